@@ -11,6 +11,63 @@ class AuditMixin:
     def _get_instance_dict(self):
         return model_to_dict(self)
 
+    @staticmethod
+    def _diff_states(original_state, new_state):
+        """
+        Returns the JSON-friendly changes between two model_to_dict snapshots.
+        A None `original_state` means the instance is new.
+        """
+        if original_state is None:
+            return {field: {'old': None, 'new': str(value)} for field, value in new_state.items()}
+
+        changes = {}
+        for field, value in new_state.items():
+            old_value = original_state.get(field)
+            if old_value != value:
+                # Serialize to JSON-friendly format
+                changes[field] = {
+                    'old': str(old_value) if old_value is not None else None,
+                    'new': str(value) if value is not None else None
+                }
+        return changes
+
+    @classmethod
+    def bulk_audit(cls, instances, action, original_states=None, user=None, ip=None):
+        """
+        Writes the audit history of instances persisted with bulk_create/bulk_update,
+        which bypass save(), as one batched INSERT.
+
+        Args:
+            instances: Saved instances (primary keys must be set).
+            action: 'CREATE' or 'UPDATE'.
+            original_states: For UPDATE, {pk: model_to_dict snapshot taken before the change}.
+                Instances without changes get no entry.
+            user, ip: Defaults to the current request's user and IP.
+
+        Returns:
+            list[AuditLog]: The created entries.
+        """
+        user = user or get_current_user()
+        ip = ip or get_current_ip()
+        if user and hasattr(user, 'is_authenticated') and not user.is_authenticated:
+            user = None
+
+        entries = []
+        for instance in instances:
+            original_state = None if action == 'CREATE' else (original_states or {}).get(instance.pk, {})
+            changes = cls._diff_states(original_state, instance._get_instance_dict())
+            if changes:
+                entries.append(AuditLog(
+                    user=user,
+                    action=action,
+                    model_name=cls.__name__,
+                    object_id=str(instance.pk),
+                    object_repr=str(instance)[:255],
+                    changes=changes,
+                    ip_address=ip
+                ))
+        return AuditLog.objects.bulk_create(entries)
+
     def save(self, *args, **kwargs):
         user = kwargs.pop('audit_user', get_current_user())
         ip = kwargs.pop('audit_ip', get_current_ip())
@@ -39,18 +96,7 @@ class AuditMixin:
             action = 'CREATE' if is_new else 'UPDATE'
             new_state = self._get_instance_dict()
             
-            changes = {}
-            if not is_new:
-                for field, value in new_state.items():
-                    old_value = original_state.get(field)
-                    if old_value != value:
-                        # Serialize to JSON-friendly format
-                        changes[field] = {
-                            'old': str(old_value) if old_value is not None else None,
-                            'new': str(value) if value is not None else None
-                        }
-            else:
-                changes = {field: {'old': None, 'new': str(value)} for field, value in new_state.items()}
+            changes = self._diff_states(None if is_new else original_state, new_state)
 
             if changes:
                 AuditLog.objects.create(
@@ -30,11 +30,15 @@ class AuditLog(models.Model):
         ('UNIT_LIMIT_OVERRIDE', 'Unit Limit Override'),
         ('ADVISING_APPROVE', 'Advising Approved'),
         ('ADVISING_REJECT', 'Advising Rejected'),
+        ('ADVISING_BATCH', 'Batch Advising Approved'),
         ('CREDITING_APPROVE', 'Crediting Approved'),
         ('CREDITING_REJECT', 'Crediting Rejected'),
         # Student Lifecycle events
         ('ADMIT_STUDENT', 'Student Admitted'),
         ('MANUAL_STUDENT', 'Manual Student Created'),
+        ('BULK_ENROLL', 'Bulk Term Rollover'),
+        # One summary entry per notification fan-out
+        ('BULK_NOTIFY', 'Bulk Notification'),
     ]
 
     user = models.ForeignKey(
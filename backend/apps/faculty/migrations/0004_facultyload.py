@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0003_professoravailability'),
+        ('terms', '0005_term_schedule_picking_end_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacultyLoad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_hours', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('day_hours', models.JSONField(default=dict)),
+                ('section_count', models.PositiveIntegerField(default=0)),
+                ('warnings', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('professor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='loads', to='faculty.professor')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='faculty_loads', to='terms.term')),
+            ],
+            options={
+                'verbose_name': 'Faculty Load',
+                'verbose_name_plural': 'Faculty Loads',
+                'unique_together': {('term', 'professor')},
+            },
+        ),
+    ]
@@ -118,3 +118,38 @@ class ProfessorAvailability(AuditMixin, models.Model):
         Format: Employee ID: Day - Session
         """
         return f"{self.professor.employee_id}: {self.get_day_display()} - {self.session}"
+
+class FacultyLoad(models.Model):
+    """
+    Per-term teaching load rollup of a professor, recomputed from their timed Schedule
+    slots by FacultyLoadService whenever their assignments change. Derived data, so
+    it is not audited.
+    """
+    term = models.ForeignKey(
+        'terms.Term',
+        on_delete=models.CASCADE,
+        related_name='faculty_loads'
+    )
+    professor = models.ForeignKey(
+        'faculty.Professor',
+        on_delete=models.CASCADE,
+        related_name='loads'
+    )
+    total_hours = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    # Scheduled hours per day code, e.g. {"M": 4.5, "W": 3.0}
+    day_hours = models.JSONField(default=dict)
+    section_count = models.PositiveIntegerField(default=0)
+    warnings = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('term', 'professor')
+        verbose_name = "Faculty Load"
+        verbose_name_plural = "Faculty Loads"
+
+    def __str__(self):
+        """
+        Returns a human readable load summary.
+        Format: Employee ID - Term Code: Hours
+        """
+        return f"{self.professor.employee_id} - {self.term.code}: {self.total_hours}h"
@@ -4,13 +4,17 @@ This is useful for fixing stale data when logic changes occur.
 """
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.forms.models import model_to_dict
 from apps.terms.models import Term
-from apps.students.models import StudentEnrollment
-from apps.grades.services.advising_service import AdvisingService
+from apps.students.models import Student, StudentEnrollment
+from apps.grades.services.student_standing import StudentStanding
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
 
 class Command(BaseCommand):
     help = 'Recalculates student standing (regularity, reason, year level) for the active term'
 
+    BATCH_SIZE = 500
+
     def handle(self, *args, **options):
         active_term = Term.objects.filter(is_active=True).first()
         if not active_term:
@@ -19,17 +23,33 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Refreshing student standing for Term: {active_term.code}...')
 
-        enrollments = StudentEnrollment.objects.filter(term=active_term)
-        count = enrollments.count()
-        
+        enrollments = list(
+            StudentEnrollment.objects.filter(term=active_term).select_related('student__user', 'term').order_by('id')
+        )
+        count = len(enrollments)
+
         self.stdout.write(f'Found {count} enrollments to process.')
 
         updated_count = 0
         with transaction.atomic():
-            for enrollment in enrollments:
-                AdvisingService.recalculate_student_standing(enrollment.student, active_term)
-                updated_count += 1
-                if updated_count % 50 == 0:
-                    self.stdout.write(f'  Processed {updated_count}/{count}...')
+            for offset in range(0, count, self.BATCH_SIZE):
+                batch = enrollments[offset:offset + self.BATCH_SIZE]
+                standings = StudentStanding.for_students(
+                    Student.objects.filter(id__in=[e.student_id for e in batch])
+                )
+                original_states = {enrollment.pk: model_to_dict(enrollment) for enrollment in batch}
+                for enrollment in batch:
+                    standings[enrollment.student_id].apply_to_enrollment(enrollment, active_term)
+                StudentEnrollment.objects.bulk_update(
+                    batch, ['is_regular', 'regularity_reason', 'year_level']
+                )
+                # bulk_update bypasses save(), so the history AuditMixin used to write is recorded here
+                StudentEnrollment.bulk_audit(batch, 'UPDATE', original_states)
+                updated_count += len(batch)
+                self.stdout.write(f'  Processed {updated_count}/{count}...')
+
+            # bulk_update skips the enrollment signals that keep the dashboard's regular/irregular
+            # and per-year counts current
+            SectioningSnapshot.mark_dirty(active_term.id, 'enrollments', 'backlog')
 
         self.stdout.write(self.style.SUCCESS(f'Successfully refreshed standing for {updated_count} students.'))
@@ -1,3 +1,5 @@
+from django.db.models import OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Concat
 from rest_framework import serializers
 from apps.grades.models import Grade, CreditingRequest, CreditingRequestItem
 from apps.academics.serializers import SubjectSerializer
@@ -22,6 +24,34 @@ class GradeSerializer(serializers.ModelSerializer):
     term_details = serializers.SerializerMethodField()
     remaining_days = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Loads everything the serializer reads with a fixed number of queries for the
+        whole list: joined student, subject, term and resolution users, the professor
+        name as a subquery annotation, and sections (with their schedule counts) and
+        subject prerequisites as prefetches.
+        """
+        from apps.scheduling.models import Schedule
+        from apps.sections.models import Section
+        from apps.sections.serializers import SectionSerializer
+
+        # Same schedule the per-row lookup picked: the first one of the section-subject
+        first_schedule = Schedule.objects.filter(
+            section=OuterRef('section'), subject=OuterRef('subject'), term=OuterRef('term')
+        ).order_by('id')
+        return queryset.select_related(
+            'student__user', 'subject__curriculum__program', 'term',
+            'resolution_requested_by', 'resolution_approved_by'
+        ).prefetch_related(
+            'subject__prerequisites__prerequisite_subject',
+            Prefetch('section', queryset=SectionSerializer.with_schedule_counts(Section.objects.all()))
+        ).annotate(
+            professor_full_name=Subquery(first_schedule.values(
+                name=Concat('professor__user__first_name', Value(' '), 'professor__user__last_name')
+            )[:1])
+        )
+
     def get_section_details(self, obj):
         if not obj.section:
             return None
@@ -29,6 +59,8 @@ class GradeSerializer(serializers.ModelSerializer):
         return SectionSerializer(obj.section).data
 
     def get_professor_name(self, obj):
+        if hasattr(obj, 'professor_full_name'):
+            return (obj.professor_full_name or '').strip() or "TBA"
         if not obj.section or not obj.subject or not obj.term:
             return "TBA"
         
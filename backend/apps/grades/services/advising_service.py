@@ -1,11 +1,14 @@
 from django.db import transaction
-from django.db.models import Count, Q
 from django.core.exceptions import ValidationError
 from apps.grades.models import Grade
 from apps.academics.models import Subject
 from apps.students.models import StudentEnrollment
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+from apps.grades.services.student_standing import StudentStanding
+from apps.grades.services.prerequisite_graph import PrerequisiteGraph
 from apps.notifications.services.notification_service import NotificationService
 from apps.notifications.models import Notification
+from apps.reports.services.transcript import TranscriptProjection
 
 
 class AdvisingService:
@@ -14,63 +17,11 @@ class AdvisingService:
         """
         Determines if a student is regular for a given term.
         Returns a dict: {"is_regular": bool, "reason": str|None}
-        """
-        # 1. Check for Unresolved Grades (INC or NO_GRADE)
-        unresolved_grades = Grade.objects.filter(
-            student=student, 
-            grade_status__in=[Grade.STATUS_INC, Grade.STATUS_NO_GRADE]
-        )
-        if unresolved_grades.exists():
-            codes = ", ".join(unresolved_grades.values_list('subject__code', flat=True))
-            return {"is_regular": False, "reason": f"Unresolved grades (INC/No Grade): {codes}"}
-
-        # 1.1 New transferee without any credits yet is Irregular
-        if student.student_type == 'TRANSFEREE' and not Grade.objects.filter(student=student).exists():
-            return {"is_regular": False, "reason": "New transferee student (Manual Advising required)"}
-
-        # 2. Check for ANY Failed/Retake/Dropped subjects in their curriculum
-        failed_or_retake_grades = Grade.objects.filter(
-            student=student, 
-            grade_status__in=[Grade.STATUS_FAILED, Grade.STATUS_RETAKE, Grade.STATUS_DROPPED]
-        )
-        if failed_or_retake_grades.exists():
-            codes = ", ".join(failed_or_retake_grades.values_list('subject__code', flat=True))
-            return {"is_regular": False, "reason": f"Subjects requiring retake: {codes}"}
-
-        # 3. Check for Back Subjects (Stricter logic)
-        # Determine standing (Year/Sem) based on progressive calculation
-        current_year = AdvisingService.get_year_level(student)
-        current_sem = term.semester_type
-        
-        sem_weight = {'1': 1, '2': 2, 'S': 3}
-        curr_weight = sem_weight.get(current_sem, 0)
-
-        # Subjects from previous years OR previous semesters of current year
-        back_subjects = Subject.objects.filter(curriculum=student.curriculum).filter(
-            Q(year_level__lt=current_year) | 
-            Q(year_level=current_year, semester__in=[k for k, v in sem_weight.items() if v < curr_weight])
-        )
 
-        # If any of these "should have been passed" subjects are missing PASSED grade
-        passed_subjects_ids = Grade.objects.filter(
-            student=student, 
-            grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_CREDITED] if hasattr(Grade, 'STATUS_CREDITED') else [Grade.STATUS_PASSED]
-        ).values_list('subject_id', flat=True)
-        # Handle cases where is_credited boolean is used instead of status
-        passed_or_credited = Grade.objects.filter(
-            Q(student=student) & 
-            (Q(grade_status=Grade.STATUS_PASSED) | Q(is_credited=True))
-        ).values_list('subject_id', flat=True)
-
-        missing_back = back_subjects.exclude(id__in=passed_or_credited)
-        if missing_back.exists():
-            missing_codes = ", ".join(missing_back.values_list('code', flat=True))
-            if student.student_type == 'TRANSFEREE':
-                return {"is_regular": False, "reason": f"Transferee with uncredited/missing subjects: {missing_codes}"}
-            else:
-                return {"is_regular": False, "reason": f"Missing back subjects: {missing_codes}"}
-
-        return {"is_regular": True, "reason": None}
+        Delegates to StudentStanding, which evaluates every rule against a single
+        snapshot of the student's grades and curriculum.
+        """
+        return StudentStanding.for_student(student).regularity(term)
 
     @staticmethod
     def get_year_level(student):
@@ -79,98 +30,29 @@ class AdvisingService:
         A student is promoted to year N+1 if they have completed >= 75% of the cumulative units 
         required up to year N.
         """
-        from django.db.models import Sum
-        
-        # Consider both passed and currently enrolled subjects
-        tracked_subject_ids = Grade.objects.filter(
-            student=student, 
-            grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_ENROLLED, Grade.STATUS_ADVISING]
-        ).values_list('subject_id', flat=True)
-
-        if not tracked_subject_ids:
-            return 1
-
-        tracked_units = Subject.objects.filter(id__in=tracked_subject_ids).aggregate(total=Sum('total_units'))['total'] or 0
-
-        # Get units per year level
-        year_units = Subject.objects.filter(curriculum=student.curriculum).values('year_level').annotate(total=Sum('total_units')).order_by('year_level')
-        
-        if not year_units:
-            return 1
-
-        current_year = 1
-        cum_sum_prev_years = 0
-        for yu in year_units:
-            y = yu['year_level']
-            cum_sum_prev_years += yu['total']
-            
-            # If tracked units >= 75% of cumulative units up to year Y, then we can be at least Year Y+1
-            if tracked_units >= (0.75 * cum_sum_prev_years):
-                current_year = y + 1
-            else:
-                # Still check if we stay at the current year level calculated so far (or y if y was reached)
-                break
-                
-        # NEW: Ensure year level is at least the highest year level of any PASSED subject
-        from django.db.models import Max
-        highest_passed_year = Grade.objects.filter(
-            student=student, 
-            grade_status=Grade.STATUS_PASSED
-        ).aggregate(max_year=Max('subject__year_level'))['max_year'] or 1
-        
-        current_year = max(current_year, highest_passed_year)
-
-        # Cap current_year to max year level in curriculum
-        max_year = max([yu['year_level'] for yu in year_units] or [1])
-        if current_year > max_year:
-            current_year = max_year
-            
-        return current_year
+        return StudentStanding.for_student(student).year_level
 
     @staticmethod
-    def validate_subject_prerequisites(student, subject, term):
+    def validate_subject_prerequisites(student, subject, term, standing=None, enrollment=None):
         """
         Validates if a student meets all prerequisites for a specific subject.
         Raises ValidationError if any prerequisite is not met.
+
+        Rules are read from the cached PrerequisiteGraph of the subject's curriculum and
+        evaluated in memory. Callers checking several subjects should pass a preloaded
+        `standing` and `enrollment` so the check issues no queries at all.
         """
-        enrollment = StudentEnrollment.objects.filter(student=student, term=term).first()
-        
-        for prereq in subject.prerequisites.all():
-            if prereq.prerequisite_type == 'SPECIFIC':
-                is_passed = Grade.objects.filter(
-                    student=student, 
-                    subject=prereq.prerequisite_subject,
-                    grade_status=Grade.STATUS_PASSED
-                ).exists()
-                if not is_passed:
-                    raise ValidationError(f"Missing prerequisite for {subject.code}: {prereq.prerequisite_subject.code}")
-            
-            elif prereq.prerequisite_type == 'YEAR_STANDING':
-                if enrollment and enrollment.year_level < prereq.standing_year:
-                    raise ValidationError(f"{subject.code} requires Year {prereq.standing_year} standing.")
-            
-            elif prereq.prerequisite_type == 'GROUP':
-                passed_count = Grade.objects.filter(
-                    student=student,
-                    grade_status=Grade.STATUS_PASSED,
-                    subject__description__icontains=prereq.description
-                ).count()
-                if passed_count < (prereq.min_subjects or 0):
-                    raise ValidationError(f"Missing group prerequisite for {subject.code}: Needs {prereq.min_subjects} subjects from '{prereq.description}'.")
-
-            elif prereq.prerequisite_type == 'PERCENTAGE' or prereq.prerequisite_type == 'PROGRAM_PERCENTAGE':
-                from django.db.models import Sum
-                total_curriculum_units = Subject.objects.filter(curriculum=student.curriculum).aggregate(total=Sum('total_units'))['total'] or 0
-                passed_units = Grade.objects.filter(
-                    student=student,
-                    grade_status=Grade.STATUS_PASSED
-                ).aggregate(total=Sum('subject__total_units'))['total'] or 0
-                
-                if total_curriculum_units > 0:
-                    percent_passed = (passed_units / total_curriculum_units) * 100
-                    threshold = prereq.min_units or 0 # min_units used as percentage threshold
-                    if percent_passed < threshold:
-                        raise ValidationError(f"Missing units prerequisite for {subject.code}: Needs {threshold}% completion (Current: {percent_passed:.1f}%).")
+        if standing is None:
+            standing = StudentStanding.for_student(student)
+        if enrollment is None:
+            enrollment = StudentEnrollment.objects.filter(student=student, term=term).first()
+
+        graph = PrerequisiteGraph.for_curriculum(subject.curriculum_id)
+        error = graph.first_unmet(
+            subject, standing, year_level=enrollment.year_level if enrollment else None
+        )
+        if error:
+            raise ValidationError(error)
 
     @staticmethod
     @transaction.atomic
@@ -202,6 +84,8 @@ class AdvisingService:
                 "reason": "ADVISING_LOCKED"
             })
 
+        standing = StudentStanding.for_student(student)
+        reg_data = standing.regularity(term)
         if not reg_data['is_regular']:
             raise ValidationError({
                 "detail": reg_data['reason'] or "Student is irregular and requires manual advising.",
@@ -215,36 +99,32 @@ class AdvisingService:
                 "reason": "ALREADY_SUBMITTED"
             })
 
-        year_level = AdvisingService.get_year_level(student)
-        
-        # Determine semester type from term (e.g., 1st, 2nd)
-        semester = term.semester_type 
-        
         # Dynamic Waterfall Search:
         # Instead of strictly checking the calculated year level, we find the EARLIEST year
         # level that has subjects offered in this semester type which the student hasn't passed yet.
         semester = term.semester_type
 
-        passed_or_credited = Grade.objects.filter(
-            student=student,
-            grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_INC]
-        ).values_list('subject_id', flat=True)
+        passed_or_inc = {
+            g.subject_id for g in standing.grades
+            if g.grade_status in (Grade.STATUS_PASSED, Grade.STATUS_INC)
+        }
 
         subjects_to_enroll = None
 
         # Iterate through years to find the first available block in the current semester type
         for y in range(1, 6): # Supports up to 5-year programs
-            potential_subjects = Subject.objects.filter(
-                curriculum=student.curriculum,
-                year_level=y,
-                semester=semester
-            ).exclude(id__in=passed_or_credited)
-
-            if potential_subjects.exists():
-                # NEW: Verify prerequisites for all subjects in this potential block
+            potential_subjects = [
+                s for s in standing.curriculum_subjects
+                if s.year_level == y and s.semester == semester and s.id not in passed_or_inc
+            ]
+
+            if potential_subjects:
+                # Verify prerequisites for all subjects in this potential block
                 try:
                     for s in potential_subjects:
-                        AdvisingService.validate_subject_prerequisites(student, s, term)
+                        AdvisingService.validate_subject_prerequisites(
+                            student, s, term, standing=standing, enrollment=enrollment
+                        )
                     subjects_to_enroll = potential_subjects
                     break
                 except ValidationError:
@@ -261,10 +141,10 @@ class AdvisingService:
 
 
         # Detect retakes (subjects with previous FAILED or RETAKE status)
-        retake_subject_ids = Grade.objects.filter(
-            student=student,
-            grade_status__in=[Grade.STATUS_FAILED, Grade.STATUS_RETAKE, Grade.STATUS_DROPPED]
-        ).values_list('subject_id', flat=True)
+        retake_subject_ids = {
+            g.subject_id for g in standing.grades
+            if g.grade_status in (Grade.STATUS_FAILED, Grade.STATUS_RETAKE, Grade.STATUS_DROPPED)
+        }
 
         grades = []
         for subject in subjects_to_enroll:
@@ -286,6 +166,7 @@ class AdvisingService:
             
         # Update enrollment status to PENDING
         StudentEnrollment.objects.filter(student=student, term=term).update(advising_status='PENDING')
+        SectioningSnapshot.mark_dirty(term.id, 'enrollments', 'backlog')
             
         return grades
 
@@ -355,8 +236,11 @@ class AdvisingService:
             raise ValidationError(f"Total units ({total_term_units}) exceed allowed limit of {max_units} for this term.")
 
         # Prerequisite check
+        standing = StudentStanding.for_student(student)
         for subject in subjects:
-            AdvisingService.validate_subject_prerequisites(student, subject, term)
+            AdvisingService.validate_subject_prerequisites(
+                student, subject, term, standing=standing, enrollment=current_enrollment
+            )
 
         grades = []
         for subject in subjects:
@@ -397,6 +281,7 @@ class AdvisingService:
             advising_status=Grade.ADVISING_APPROVED,
             grade_status=Grade.STATUS_ENROLLED
         )
+        TranscriptProjection.invalidate(student_enrollment.student_id)
 
 
         # Cache the year level
@@ -420,6 +305,103 @@ class AdvisingService:
             link_url="/student/grades"
         )
 
+    BATCH_APPROVAL_CHUNK_SIZE = 200
+
+    @classmethod
+    def batch_approve_advising(cls, enrollments, user, chunk_size=None):
+        """
+        Approves many pending enrollments in chunks, with the same effect as calling
+        approve_advising() on each of them but a constant number of queries per chunk:
+        one set-based Grade update per term, one StudentStanding batch load, one
+        bulk_update each of enrollments and students with their batched audit entries,
+        and one notification bulk insert per term.
+
+        Each chunk runs in its own transaction, so a failing chunk is rolled back and
+        reported without undoing the chunks already approved.
+
+        Args:
+            enrollments (QuerySet[StudentEnrollment]): The enrollments to approve.
+            user (User): The approving staff member.
+            chunk_size (int|None): Enrollments per chunk (defaults to BATCH_APPROVAL_CHUNK_SIZE).
+
+        Returns:
+            dict: {"processed_count": int, "errors": list[str],
+                   "chunks": list[{"chunk": int, "approved": int, "error": str|None}]}
+        """
+        from collections import defaultdict
+        from django.forms.models import model_to_dict
+        from django.utils import timezone
+        from apps.students.models import Student
+        from apps.reports.services.graduation_audit import GraduationAudit
+
+        chunk_size = chunk_size or cls.BATCH_APPROVAL_CHUNK_SIZE
+        enrollments = list(enrollments.select_related('student__user', 'term').order_by('id'))
+
+        processed_count, errors, chunks = 0, [], []
+        for index, offset in enumerate(range(0, len(enrollments), chunk_size), start=1):
+            chunk = enrollments[offset:offset + chunk_size]
+            try:
+                with transaction.atomic():
+                    by_term = defaultdict(list)
+                    for enrollment in chunk:
+                        by_term[enrollment.term].append(enrollment)
+
+                    for term, term_enrollments in by_term.items():
+                        Grade.objects.filter(
+                            term=term,
+                            student_id__in=[e.student_id for e in term_enrollments]
+                        ).exclude(
+                            grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_FAILED, Grade.STATUS_DROPPED]
+                        ).update(
+                            advising_status=Grade.ADVISING_APPROVED,
+                            grade_status=Grade.STATUS_ENROLLED
+                        )
+                    TranscriptProjection.invalidate(*(e.student_id for e in chunk))
+
+                    # Year level is computed after the grade update, as in approve_advising()
+                    standings = StudentStanding.for_students([e.student for e in chunk])
+                    now = timezone.now()
+                    original_states = {e.pk: model_to_dict(e) for e in chunk}
+                    for enrollment in chunk:
+                        enrollment.year_level = standings[enrollment.student_id].year_level
+                        enrollment.advising_status = 'APPROVED'
+                        enrollment.advising_approved_by = user
+                        enrollment.advising_approved_at = now
+                    StudentEnrollment.objects.bulk_update(
+                        chunk, ['year_level', 'advising_status', 'advising_approved_by', 'advising_approved_at']
+                    )
+                    StudentEnrollment.bulk_audit(chunk, 'UPDATE', original_states, user=user)
+                    for term in by_term:
+                        SectioningSnapshot.mark_dirty(term.id, 'enrollments', 'backlog')
+
+                    students = list({e.student_id: e.student for e in chunk}.values())
+                    student_states = {s.pk: model_to_dict(s) for s in students}
+                    for student in students:
+                        student.status = 'ENROLLED'
+                        student.updated_at = now
+                    Student.objects.bulk_update(students, ['status', 'updated_at'])
+                    Student.bulk_audit(students, 'UPDATE', student_states, user=user)
+                    # bulk_update skips the Student signals that retire cached cohort audits
+                    GraduationAudit.invalidate()
+
+                    for term, term_enrollments in by_term.items():
+                        NotificationService.notify_many(
+                            recipients=[e.student.user for e in term_enrollments],
+                            notification_type=Notification.NotificationType.ADVISING,
+                            title="Advising Approved",
+                            message=f"Your advising for {term.code} has been approved. You are now officially enrolled in your subjects.",
+                            link_url="/student/grades"
+                        )
+            except Exception as e:
+                errors.append(f"Chunk {index} ({chunk[0].student.idn}–{chunk[-1].student.idn}): {str(e)}")
+                chunks.append({"chunk": index, "approved": 0, "error": str(e)})
+                continue
+
+            processed_count += len(chunk)
+            chunks.append({"chunk": index, "approved": len(chunk), "error": None})
+
+        return {"processed_count": processed_count, "errors": errors, "chunks": chunks}
+
     @staticmethod
     @transaction.atomic
     def reject_advising(student_enrollment, reason):
@@ -538,10 +520,7 @@ class AdvisingService:
         """
         enrollment = StudentEnrollment.objects.filter(student=student, term=term).first()
         if enrollment:
-            reg_data = cls.check_student_regularity(student, term)
-            enrollment.is_regular = reg_data['is_regular']
-            enrollment.regularity_reason = reg_data['reason']
-            enrollment.year_level = cls.get_year_level(student)
+            StudentStanding.for_student(student).apply_to_enrollment(enrollment, term)
             enrollment.save()
 
     @classmethod
@@ -0,0 +1,255 @@
+"""
+Richwell Portal — Spreadsheet Grade Import
+
+Bulk midterm/final grade entry for one section-subject roster from a CSV or
+XLSX file with an `IDN` and a `Grade` column. Every row is validated against the
+roster (one locked query), the grading window, the professor's assignment (one
+Schedule query) and the grade scale before anything is written. A file with any
+invalid row changes nothing and comes back with a per-row error report. A clean
+file is applied in one transaction: one bulk UPDATE, one batch of audit entries
+and a single digest notification per registrar for the whole section (shared
+with one-by-one submissions for the same roster).
+
+Accepted grade values: 1.0 – 3.0 in quarter steps, 5.0, INC and NG (no grade).
+Rows with an empty grade cell are skipped.
+
+Usage:
+    report = GradeImportService.submit(term, subject, section, 'FINAL', request.FILES['file'], request.user)
+"""
+
+import csv
+import io
+import zipfile
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.forms.models import model_to_dict
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+
+from apps.grades.models import Grade
+from apps.grades.services.grading_service import GradingService
+from apps.notifications.models import Notification
+from apps.notifications.services.notification_service import NotificationService
+from apps.reports.services.graduation_audit import GraduationAudit
+from apps.reports.services.transcript import TranscriptProjection
+
+
+PERIODS = ('MIDTERM', 'FINAL')
+GRADE_SCALE = frozenset(Decimal(value) for value in (
+    '1.0', '1.25', '1.5', '1.75', '2.0', '2.25', '2.5', '2.75', '3.0', '5.0'
+))
+INC, NO_GRADE = 'INC', 'NG'
+# A section roster never comes close; anything larger is the wrong file
+MAX_ROWS = 1000
+
+
+def read_rows(file_obj):
+    """
+    Reads an uploaded CSV or XLSX file into (row number, idn, grade text) tuples.
+    Row numbers match the spreadsheet (the header is row 1).
+
+    Raises:
+        ValueError: Unsupported or unreadable file, missing columns or too many rows.
+    """
+    name = (getattr(file_obj, 'name', '') or '').lower()
+    if name.endswith('.xlsx'):
+        from openpyxl import load_workbook
+        from openpyxl.utils.exceptions import InvalidFileException
+        try:
+            workbook = load_workbook(file_obj, read_only=True, data_only=True)
+        except (zipfile.BadZipFile, InvalidFileException) as exc:
+            raise ValueError("The file is not a readable .xlsx workbook.") from exc
+        table = workbook.worksheets[0].iter_rows(values_only=True)
+    elif name.endswith('.csv'):
+        table = csv.reader(io.StringIO(file_obj.read().decode('utf-8-sig')))
+    else:
+        raise ValueError("Upload a .csv or .xlsx file.")
+
+    header = [str(cell).strip().upper() if cell is not None else '' for cell in next(table, [])]
+    if 'IDN' not in header or 'GRADE' not in header:
+        raise ValueError("The file must have 'IDN' and 'Grade' columns.")
+    idn_col, grade_col = header.index('IDN'), header.index('GRADE')
+
+    rows = []
+    for row_number, cells in enumerate(table, start=2):
+        cells = list(cells)
+        idn = cells[idn_col] if idn_col < len(cells) else None
+        value = cells[grade_col] if grade_col < len(cells) else None
+        idn = str(idn).strip() if idn is not None else ''
+        value = str(value).strip() if value is not None else ''
+        if not idn and not value:
+            continue
+        rows.append((row_number, idn, value))
+        if len(rows) > MAX_ROWS:
+            raise ValueError(f"The file has more than {MAX_ROWS} rows.")
+    return rows
+
+
+def parse_grade(value):
+    """
+    Returns INC, NG or a Decimal on the grade scale.
+
+    Raises:
+        ValueError: The value is not an accepted grade.
+    """
+    text = value.upper()
+    if text in (INC, NO_GRADE):
+        return text
+    try:
+        grade = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"'{value}' is not a grade. Use 1.0 - 3.0, 5.0, INC or NG.")
+    if grade not in GRADE_SCALE:
+        raise ValueError(f"{value} is not on the grade scale (1.0 - 3.0 in 0.25 steps, or 5.0).")
+    return grade
+
+
+class GradeImportService:
+    """
+    Validates and applies a roster spreadsheet of grades.
+    """
+
+    @staticmethod
+    def _check_window(term, period):
+        today = timezone.now().date()
+        if period == 'MIDTERM':
+            start, end, label = term.midterm_grade_start, term.midterm_grade_end, 'Midterm'
+        else:
+            start, end, label = term.final_grade_start, term.final_grade_end, 'Final'
+        if not start or not end:
+            raise ValueError(f"{label} grading window is not set for this term.")
+        if not (start <= today <= end):
+            raise ValueError(f"{label} grading window is closed (Open: {start} to {end}).")
+
+    @staticmethod
+    def _apply(grade, value, period, professor, now, deadlines):
+        """Applies one validated value with the rules of submit_midterm / submit_final."""
+        major_deadline, minor_deadline = deadlines
+        number = value if isinstance(value, Decimal) else None
+        if period == 'MIDTERM':
+            grade.midterm_grade = number
+            grade.midterm_submitted_at = now
+            if value == NO_GRADE:
+                grade.grade_status = Grade.STATUS_NO_GRADE
+            elif value == INC:
+                grade.grade_status = Grade.STATUS_INC
+                if not grade.inc_deadline:
+                    grade.inc_deadline = major_deadline if grade.subject.is_major else minor_deadline
+            return
+
+        grade.final_grade = number
+        grade.final_submitted_at = now
+        grade.submitted_by = professor
+        if value == NO_GRADE:
+            grade.grade_status = Grade.STATUS_NO_GRADE
+        elif value == INC:
+            grade.grade_status = Grade.STATUS_INC
+            grade.inc_deadline = major_deadline if grade.subject.is_major else minor_deadline
+        elif number <= Decimal('3.0'):
+            grade.grade_status = Grade.STATUS_PASSED
+        else:
+            grade.grade_status = Grade.STATUS_FAILED
+
+    @classmethod
+    @transaction.atomic
+    def submit(cls, term, subject, section, period, file_obj, professor):
+        """
+        Validates every row of the file and, if all are valid, applies them together.
+
+        Args:
+            term (Term), subject (Subject), section (Section): The roster being graded.
+            period (str): 'MIDTERM' or 'FINAL'.
+            file_obj (UploadedFile): CSV or XLSX with 'IDN' and 'Grade' columns.
+            professor (User): The submitting user; professors must be assigned to the roster.
+
+        Returns:
+            dict: {'period', 'applied', 'skipped', 'errors': [{'row', 'idn', 'error'}]}.
+                  `applied` is 0 whenever `errors` is not empty.
+
+        Raises:
+            ValueError: Unknown period, unreadable file or closed grading window.
+            PermissionDenied: The professor is not assigned to this section and subject.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown grading period '{period}'. Use MIDTERM or FINAL.")
+        rows = read_rows(file_obj)
+        cls._check_window(term, period)
+
+        if professor.role == 'PROFESSOR':
+            from apps.scheduling.models import Schedule
+            if not Schedule.objects.filter(
+                term=term, section=section, subject=subject, professor__user=professor
+            ).exists():
+                raise PermissionDenied("You are not assigned to manage this grade.")
+
+        roster = {
+            grade.student.idn: grade
+            for grade in Grade.objects.filter(
+                term=term, subject=subject, section=section
+            ).select_related('student', 'subject').select_for_update(of=('self',))
+        }
+
+        errors, updates, seen, skipped = [], [], set(), 0
+        for row_number, idn, value in rows:
+            def fail(message):
+                errors.append({'row': row_number, 'idn': idn, 'error': message})
+
+            if not idn:
+                fail("IDN is missing.")
+                continue
+            if idn in seen:
+                fail("Student appears more than once in the file.")
+                continue
+            seen.add(idn)
+            grade = roster.get(idn)
+            if grade is None:
+                fail(f"Student is not on the {section.name} roster for {subject.code}.")
+                continue
+            if grade.finalized_at:
+                fail("This grade is already finalized and locked.")
+                continue
+            if not value:
+                skipped += 1
+                continue
+            try:
+                updates.append((grade, parse_grade(value)))
+            except ValueError as e:
+                fail(str(e))
+
+        report = {'period': period, 'applied': 0, 'skipped': skipped, 'errors': errors}
+        if errors or not updates:
+            return report
+
+        now = timezone.now()
+        deadlines = GradingService.inc_deadlines(now)
+        original_states = {grade.pk: model_to_dict(grade) for grade, _ in updates}
+        grades = []
+        for grade, value in updates:
+            cls._apply(grade, value, period, professor, now, deadlines)
+            grade.updated_at = now
+            grades.append(grade)
+
+        Grade.objects.bulk_update(grades, [
+            'midterm_grade', 'midterm_submitted_at', 'final_grade', 'final_submitted_at',
+            'submitted_by', 'grade_status', 'inc_deadline', 'updated_at'
+        ])
+        Grade.bulk_audit(grades, 'UPDATE', original_states, user=professor)
+        TranscriptProjection.invalidate(*{grade.student_id for grade in grades})
+        GraduationAudit.invalidate()
+
+        label = 'Midterm' if period == 'MIDTERM' else 'Final'
+        NotificationService.notify_digest(
+            recipients=NotificationService.registrar_ids(),
+            notification_type=Notification.NotificationType.GRADE,
+            digest_key=GradingService.submission_digest_key(period, section.id, subject.id),
+            title=f"{label} Grades Submitted",
+            message=f"{professor.get_full_name()} submitted {label.lower()} grades for {subject.code} - {section.name}",
+            link_url="/registrar/grades",
+            unit='student',
+            count=len(grades),
+            user=professor
+        )
+
+        report['applied'] = len(grades)
+        return report
@@ -1,11 +1,14 @@
 from django.db import transaction
+from django.db.models import Case, DateField, Value, When
+from django.forms.models import model_to_dict
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 from dateutil.relativedelta import relativedelta
+from apps.academics.models import Subject
 from apps.grades.models import Grade
 from apps.notifications.services.notification_service import NotificationService
 from apps.notifications.models import Notification
-from apps.accounts.models import User
+from apps.reports.services.transcript import TranscriptProjection
 
 class GradingService:
     @staticmethod
@@ -63,16 +66,17 @@ class GradingService:
 
         grade.save()
 
-        # Notify Registrar
-        registrars = User.objects.filter(role__in=['REGISTRAR', 'HEAD_REGISTRAR'])
-        for registrar in registrars:
-            NotificationService.notify(
-                recipient=registrar,
-                notification_type=Notification.NotificationType.GRADE,
-                title="Midterm Grade Submitted",
-                message=f"{professor.get_full_name()} submitted midterm grades for {grade.subject.code}{' - ' + grade.section.name if grade.section else ''}.",
-                link_url="/registrar/grades"
-            )
+        # Notify Registrar: one digest per section and subject instead of one notice per grade
+        NotificationService.notify_digest(
+            recipients=NotificationService.registrar_ids(),
+            notification_type=Notification.NotificationType.GRADE,
+            digest_key=GradingService.submission_digest_key('MIDTERM', grade.section_id, grade.subject_id),
+            title="Midterm Grades Submitted",
+            message=f"{professor.get_full_name()} submitted midterm grades for {grade.subject.code}{' - ' + grade.section.name if grade.section else ''}",
+            link_url="/registrar/grades",
+            unit='student',
+            user=professor
+        )
 
         return grade
 
@@ -118,16 +122,17 @@ class GradingService:
 
         grade.save()
 
-        # Notify Registrar
-        registrars = User.objects.filter(role__in=['REGISTRAR', 'HEAD_REGISTRAR'])
-        for registrar in registrars:
-            NotificationService.notify(
-                recipient=registrar,
-                notification_type=Notification.NotificationType.GRADE,
-                title="Final Grade Submitted",
-                message=f"{professor.get_full_name()} submitted final grades for {grade.subject.code}{' - ' + grade.section.name if grade.section else ''}.",
-                link_url="/registrar/grades"
-            )
+        # Notify Registrar: one digest per section and subject instead of one notice per grade
+        NotificationService.notify_digest(
+            recipients=NotificationService.registrar_ids(),
+            notification_type=Notification.NotificationType.GRADE,
+            digest_key=GradingService.submission_digest_key('FINAL', grade.section_id, grade.subject_id),
+            title="Final Grades Submitted",
+            message=f"{professor.get_full_name()} submitted final grades for {grade.subject.code}{' - ' + grade.section.name if grade.section else ''}",
+            link_url="/registrar/grades",
+            unit='student',
+            user=professor
+        )
 
         return grade
 
@@ -135,26 +140,43 @@ class GradingService:
     def finalize_section_grades(self, term, subject, section, user):
         """
         Registrar bulk-finalizes grades for a section.
+        Set-based: the grades are locked and read once, stamped with a single UPDATE,
+        audited in one batch and their students notified with one bulk insert, so the
+        query count does not depend on the section size. Grades that are already
+        finalized keep their original stamp.
+
+        Returns:
+            list[Grade]: The grades finalized by this call.
         """
-        grades = Grade.objects.filter(
-            term=term, 
-            subject=subject, 
-            section=section,
-            grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_FAILED, Grade.STATUS_INC, Grade.STATUS_NO_GRADE]
-        ).exclude(grade_status=Grade.STATUS_ENROLLED)
+        grades = list(
+            Grade.objects.filter(
+                term=term, 
+                subject=subject, 
+                section=section,
+                finalized_at__isnull=True,
+                grade_status__in=[Grade.STATUS_PASSED, Grade.STATUS_FAILED, Grade.STATUS_INC, Grade.STATUS_NO_GRADE]
+            ).select_related('student', 'subject').select_for_update(of=('self',))
+        )
+        if not grades:
+            return grades
 
+        original_states = {grade.pk: model_to_dict(grade) for grade in grades}
+        now = timezone.now()
+        Grade.objects.filter(id__in=original_states).update(finalized_by=user, finalized_at=now, updated_at=now)
         for grade in grades:
             grade.finalized_by = user
-            grade.finalized_at = timezone.now()
-            grade.save()
-
-            NotificationService.notify(
-                recipient=grade.student.user,
-                notification_type=Notification.NotificationType.GRADE,
-                title="Grade Finalized",
-                message=f"Your grade for {grade.subject.code} has been finalized.",
-                link_url="/student/grades"
-            )
+            grade.finalized_at = now
+            grade.updated_at = now
+        Grade.bulk_audit(grades, 'UPDATE', original_states, user=user)
+
+        NotificationService.notify_many(
+            recipients=[grade.student.user_id for grade in grades if grade.student.user_id],
+            notification_type=Notification.NotificationType.GRADE,
+            title="Grade Finalized",
+            message=f"Your grade for {subject.code} has been finalized.",
+            link_url="/student/grades",
+            user=user
+        )
         
         return grades
 
@@ -175,11 +197,33 @@ class GradingService:
         )
         return count
 
+    @staticmethod
+    def submission_digest_key(period, section_id, subject_id):
+        """Groups the registrar notifications of one section-subject's grade submissions."""
+        return f"grade-{period.lower()}:{section_id}:{subject_id}"
+
+    @staticmethod
+    def inc_deadlines(now=None):
+        """
+        INC completion deadlines starting now: 6 months for major subjects,
+        12 months for minor ones.
+
+        Returns:
+            tuple[date, date]: (major deadline, minor deadline)
+        """
+        now = now or timezone.now()
+        return (now + relativedelta(months=6)).date(), (now + relativedelta(months=12)).date()
+
     @transaction.atomic
     def mark_unsubmitted_as_inc(self, term, period_type, user):
         """
         Optimized auto-INC logic for unsubmitted grades after deadline.
         Only touches students currently ENROLLED in the subject.
+        Set-based: one UPDATE with a Case expression for the major/minor INC deadline,
+        one batch of audit entries and one bulk notification to the affected students.
+
+        Returns:
+            int: Number of grades marked INC.
         """
         if period_type == 'MIDTERM':
             grades = Grade.objects.filter(
@@ -194,14 +238,43 @@ class GradingService:
                 grade_status=Grade.STATUS_ENROLLED
             )
 
+        grades = list(grades.select_related('student', 'subject').select_for_update(of=('self',)))
+        if not grades:
+            return 0
+
+        original_states = {grade.pk: model_to_dict(grade) for grade in grades}
+        now = timezone.now()
+        major_deadline, minor_deadline = self.inc_deadlines(now)
+        Grade.objects.filter(id__in=original_states).update(
+            grade_status=Grade.STATUS_INC,
+            inc_deadline=Case(
+                When(subject_id__in=Subject.objects.filter(is_major=True).values('id'), then=Value(major_deadline)),
+                default=Value(minor_deadline),
+                output_field=DateField()
+            ),
+            updated_at=now
+        )
         for grade in grades:
             grade.grade_status = Grade.STATUS_INC
-            # Standard INC deadline
-            months = 6 if grade.subject.is_major else 12
-            grade.inc_deadline = (timezone.now() + relativedelta(months=months)).date()
-            grade.save()
+            grade.inc_deadline = major_deadline if grade.subject.is_major else minor_deadline
+            grade.updated_at = now
+        Grade.bulk_audit(grades, 'UPDATE', original_states, user=user)
+        TranscriptProjection.invalidate(*{grade.student_id for grade in grades})
+
+        period = 'midterm' if period_type == 'MIDTERM' else 'final'
+        NotificationService.notify_many(
+            recipients={grade.student.user_id for grade in grades if grade.student.user_id},
+            notification_type=Notification.NotificationType.GRADE,
+            title="Grade Marked INC",
+            message=(
+                f"No {period} grade was submitted for one or more of your subjects in {term.code}, "
+                f"so they are now marked INC. Check your grades for the completion deadline."
+            ),
+            link_url="/student/grades",
+            user=user
+        )
             
-        return grades.count()
+        return len(grades)
 
     @transaction.atomic
     def drop_subject(self, student, subject, term):
@@ -0,0 +1,144 @@
+"""
+Richwell Portal — Prerequisite Graph
+
+Compiles every SubjectPrerequisite of a CurriculumVersion into an in-memory graph
+(subject -> list of rules) that is cached per curriculum and evaluated against a
+StudentStanding without touching the database.
+
+Before this, validate_subject_prerequisites ran one or two queries per rule per
+subject, so advising a full year block cost dozens of queries per student. The graph
+is compiled with a single query and invalidated by apps.grades.signals whenever a
+Subject or SubjectPrerequisite of the curriculum is saved or deleted.
+The invalidation only reaches other worker processes through a shared cache backend
+(see CACHES in config/settings/base.py; core.checks warns about per-process caches).
+
+Usage:
+    graph = PrerequisiteGraph.for_curriculum(subject.curriculum_id)
+    error = graph.first_unmet(subject, standing, year_level=enrollment.year_level)
+"""
+
+from collections import defaultdict, namedtuple
+
+from django.core.cache import cache
+
+from apps.academics.models import SubjectPrerequisite
+from core.cache import drop_now_and_on_commit
+
+
+CACHE_KEY = 'prerequisite_graph:{curriculum_id}'
+CACHE_TIMEOUT = 60 * 60 * 6  # Safety net; entries are invalidated on change
+
+PERCENTAGE_TYPES = ('PERCENTAGE', 'PROGRAM_PERCENTAGE')
+
+# A single compiled prerequisite rule. Only plain values are stored so the graph pickles cheaply.
+Rule = namedtuple('Rule', [
+    'prerequisite_type', 'prerequisite_subject_id', 'prerequisite_subject_code',
+    'standing_year', 'min_units', 'min_subjects', 'description',
+])
+
+
+class PrerequisiteGraph:
+    """
+    Compiled prerequisite rules of one curriculum.
+
+    Args:
+        curriculum_id (int): The CurriculumVersion the rules belong to.
+        rules (dict[int, list[Rule]]): Rules keyed by the ID of the subject they guard.
+    """
+
+    def __init__(self, curriculum_id, rules):
+        self.curriculum_id = curriculum_id
+        self.rules = dict(rules)
+
+    # ── Compilation & caching ──────────────────────────────────────────────
+
+    @classmethod
+    def compile(cls, curriculum_id):
+        """
+        Builds the graph from the database with a single query.
+        """
+        rules = defaultdict(list)
+        prereqs = SubjectPrerequisite.objects.filter(
+            subject__curriculum_id=curriculum_id
+        ).select_related('prerequisite_subject').order_by('id')
+
+        for prereq in prereqs:
+            rules[prereq.subject_id].append(Rule(
+                prerequisite_type=prereq.prerequisite_type,
+                prerequisite_subject_id=prereq.prerequisite_subject_id,
+                prerequisite_subject_code=(
+                    prereq.prerequisite_subject.code if prereq.prerequisite_subject else None
+                ),
+                standing_year=prereq.standing_year,
+                min_units=prereq.min_units,
+                min_subjects=prereq.min_subjects,
+                description=prereq.description,
+            ))
+        return cls(curriculum_id, rules)
+
+    @classmethod
+    def for_curriculum(cls, curriculum_id):
+        """
+        Returns the cached graph of a curriculum, compiling it on a cache miss.
+        """
+        key = CACHE_KEY.format(curriculum_id=curriculum_id)
+        graph = cache.get(key)
+        if graph is None:
+            graph = cls.compile(curriculum_id)
+            cache.set(key, graph, CACHE_TIMEOUT)
+        return graph
+
+    @staticmethod
+    def invalidate(*curriculum_ids):
+        """Drops the cached graphs of the given curricula (see core.cache)."""
+        drop_now_and_on_commit(*(CACHE_KEY.format(curriculum_id=cid) for cid in curriculum_ids if cid is not None))
+
+    # ── Graph queries ──────────────────────────────────────────────────────
+
+    def rules_for(self, subject_id):
+        """Returns the compiled rules guarding a subject (empty if none)."""
+        return self.rules.get(subject_id, [])
+
+    def direct_prerequisites(self, subject_id):
+        """Returns the IDs of the subjects a subject directly requires (SPECIFIC edges)."""
+        return [
+            r.prerequisite_subject_id for r in self.rules_for(subject_id)
+            if r.prerequisite_type == 'SPECIFIC' and r.prerequisite_subject_id
+        ]
+
+    # ── Evaluation ─────────────────────────────────────────────────────────
+
+    def first_unmet(self, subject, standing, year_level=None):
+        """
+        Evaluates every rule of `subject` against a student's standing.
+
+        Args:
+            subject (Subject): The subject being checked.
+            standing (StudentStanding): The student's grade snapshot.
+            year_level (int|None): The year level of the student's enrollment for the
+                                   term. YEAR_STANDING rules are skipped when None.
+
+        Returns:
+            str|None: The message of the first unmet rule, or None if all are met.
+        """
+        for rule in self.rules_for(subject.id):
+            if rule.prerequisite_type == 'SPECIFIC':
+                if rule.prerequisite_subject_id not in standing.passed_subject_ids:
+                    return f"Missing prerequisite for {subject.code}: {rule.prerequisite_subject_code}"
+
+            elif rule.prerequisite_type == 'YEAR_STANDING':
+                if year_level is not None and year_level < rule.standing_year:
+                    return f"{subject.code} requires Year {rule.standing_year} standing."
+
+            elif rule.prerequisite_type == 'GROUP':
+                if standing.passed_count_matching(rule.description) < (rule.min_subjects or 0):
+                    return f"Missing group prerequisite for {subject.code}: Needs {rule.min_subjects} subjects from '{rule.description}'."
+
+            elif rule.prerequisite_type in PERCENTAGE_TYPES:
+                total_units = standing.curriculum_units
+                if total_units > 0:
+                    percent_passed = (standing.passed_units / total_units) * 100
+                    threshold = rule.min_units or 0  # min_units used as percentage threshold
+                    if percent_passed < threshold:
+                        return f"Missing units prerequisite for {subject.code}: Needs {threshold}% completion (Current: {percent_passed:.1f}%)."
+        return None
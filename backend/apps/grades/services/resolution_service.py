@@ -4,7 +4,6 @@ from rest_framework.exceptions import PermissionDenied
 from apps.grades.models import Grade
 from apps.notifications.services.notification_service import NotificationService
 from apps.notifications.models import Notification
-from apps.accounts.models import User
 
 class ResolutionService:
     @staticmethod
@@ -48,16 +47,17 @@ class ResolutionService:
         grade.resolution_requested_at = timezone.now()
         grade.save()
         
-        # Notify Registrar
-        registrars = User.objects.filter(role='REGISTRAR')
-        for registrar in registrars:
-            NotificationService.notify(
-                recipient=registrar,
-                notification_type=Notification.NotificationType.GRADE,
-                title="Resolution Requested",
-                message=f"{professor.get_full_name()} requested to resolve INC for {grade.student.idn} - {grade.subject.code}.",
-                link_url="/registrar/resolutions"
-            )
+        # Notify Registrar: requests for one subject are counted in a single digest
+        NotificationService.notify_digest(
+            recipients=NotificationService.registrar_ids(include_head=False),
+            notification_type=Notification.NotificationType.GRADE,
+            digest_key=f"resolution-requested:{grade.section_id}:{grade.subject_id}",
+            title="Resolution Requested",
+            message=f"{professor.get_full_name()} requested to resolve INC grades for {grade.subject.code}, latest {grade.student.idn}",
+            link_url="/registrar/resolutions",
+            unit='request',
+            user=professor
+        )
 
         return grade
 
@@ -148,16 +148,17 @@ class ResolutionService:
         grade.resolution_approved_at = timezone.now()
         grade.save()
 
-        # Notify Registrar
-        registrars = User.objects.filter(role='REGISTRAR')
-        for registrar in registrars:
-            NotificationService.notify(
-                recipient=registrar,
-                notification_type=Notification.NotificationType.GRADE,
-                title="Resolution Approved by Head",
-                message=f"{program_head.get_full_name()} approved the resolved grade for {grade.student.idn} - {grade.subject.code}. Ready for finalization.",
-                link_url="/registrar/grades"
-            )
+        # Notify Registrar: approvals for one subject are counted in a single digest
+        NotificationService.notify_digest(
+            recipients=NotificationService.registrar_ids(include_head=False),
+            notification_type=Notification.NotificationType.GRADE,
+            digest_key=f"resolution-head-approved:{grade.section_id}:{grade.subject_id}",
+            title="Resolution Approved by Head",
+            message=f"{program_head.get_full_name()} approved resolved grades for {grade.subject.code}, latest {grade.student.idn}. Ready for finalization",
+            link_url="/registrar/grades",
+            unit='grade',
+            user=program_head
+        )
 
         return grade
 
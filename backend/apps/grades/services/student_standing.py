@@ -0,0 +1,229 @@
+"""
+Richwell Portal — Student Standing Engine
+
+Computes a student's academic standing (regularity, irregularity reason, year level
+and back subjects) from a single snapshot of their grades and curriculum.
+
+AdvisingService used to issue roughly ten Grade/Subject queries per student to answer
+these questions. StudentStanding loads the data once and evaluates every rule in memory,
+and StudentStanding.for_students() does the same for a whole batch of students with a
+constant number of queries.
+
+Usage:
+    standing = StudentStanding.for_student(student)
+    standing.year_level
+    standing.regularity(term)        # {"is_regular": bool, "reason": str|None}
+
+    standings = StudentStanding.for_students(Student.objects.filter(program=program))
+    standings[student.id].regularity(term)
+"""
+
+from collections import defaultdict
+from functools import cached_property
+
+from apps.grades.models import Grade
+from apps.academics.models import Subject
+
+
+# Relative order of semesters inside a year level, used to find back subjects
+SEMESTER_WEIGHT = {'1': 1, '2': 2, 'S': 3}
+
+UNRESOLVED_STATUSES = (Grade.STATUS_INC, Grade.STATUS_NO_GRADE)
+RETAKE_STATUSES = (Grade.STATUS_FAILED, Grade.STATUS_RETAKE, Grade.STATUS_DROPPED)
+TRACKED_STATUSES = (Grade.STATUS_PASSED, Grade.STATUS_ENROLLED, Grade.STATUS_ADVISING)
+
+
+class StudentStanding:
+    """
+    In-memory academic standing for a single student.
+
+    Args:
+        student (Student): The student being evaluated.
+        grades (list[Grade]): Every Grade of the student, with `subject` preloaded,
+                              in the default Grade ordering.
+        curriculum_subjects (list[Subject]): Every Subject of the student's curriculum,
+                                             ordered by primary key.
+    """
+
+    def __init__(self, student, grades, curriculum_subjects):
+        self.student = student
+        self.grades = list(grades)
+        self.curriculum_subjects = list(curriculum_subjects)
+
+    # ── Loaders ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def for_student(cls, student):
+        """
+        Builds the standing of one student with two queries (grades, curriculum).
+        """
+        grades = Grade.objects.filter(student=student).select_related('subject')
+        subjects = Subject.objects.filter(curriculum_id=student.curriculum_id).order_by('id')
+        return cls(student, grades, subjects)
+
+    @classmethod
+    def for_students(cls, students):
+        """
+        Builds standings for a batch of students with a constant number of queries:
+        one for the students (if a queryset is given), one for all of their grades
+        and one for every curriculum they belong to.
+
+        Args:
+            students (QuerySet|Iterable[Student]): The students to evaluate.
+
+        Returns:
+            dict[int, StudentStanding]: Standings keyed by student ID.
+        """
+        students = list(students)
+        if not students:
+            return {}
+
+        grades_by_student = defaultdict(list)
+        grades = Grade.objects.filter(
+            student_id__in=[s.id for s in students]
+        ).select_related('subject')
+        for grade in grades:
+            grades_by_student[grade.student_id].append(grade)
+
+        subjects_by_curriculum = defaultdict(list)
+        subjects = Subject.objects.filter(
+            curriculum_id__in={s.curriculum_id for s in students}
+        ).order_by('id')
+        for subject in subjects:
+            subjects_by_curriculum[subject.curriculum_id].append(subject)
+
+        return {
+            s.id: cls(s, grades_by_student[s.id], subjects_by_curriculum[s.curriculum_id])
+            for s in students
+        }
+
+    # ── Derived sets ───────────────────────────────────────────────────────
+
+    def _grades_with_status(self, statuses):
+        return [g for g in self.grades if g.grade_status in statuses]
+
+    @cached_property
+    def passed_or_credited_ids(self):
+        """Subject IDs the student has PASSED or has been credited for."""
+        return {
+            g.subject_id for g in self.grades
+            if g.grade_status == Grade.STATUS_PASSED or g.is_credited
+        }
+
+    @cached_property
+    def passed_subject_ids(self):
+        """Subject IDs with a PASSED grade (used by prerequisite rules)."""
+        return {g.subject_id for g in self._grades_with_status((Grade.STATUS_PASSED,))}
+
+    @cached_property
+    def passed_units(self):
+        """Total units of every PASSED grade."""
+        return sum(g.subject.total_units for g in self._grades_with_status((Grade.STATUS_PASSED,)))
+
+    @cached_property
+    def curriculum_units(self):
+        """Total units of the student's curriculum."""
+        return sum(s.total_units for s in self.curriculum_subjects)
+
+    def passed_count_matching(self, description):
+        """
+        Counts PASSED grades whose subject description contains `description`
+        (case-insensitive), mirroring a `subject__description__icontains` filter.
+        """
+        needle = (description or '').lower()
+        return sum(
+            1 for g in self._grades_with_status((Grade.STATUS_PASSED,))
+            if needle in g.subject.description.lower()
+        )
+
+    # ── Year level ─────────────────────────────────────────────────────────
+
+    @cached_property
+    def year_level(self):
+        """
+        Calculates the year level based on cumulative progress.
+        A student is promoted to year N+1 once they have completed >= 75% of the
+        cumulative units required up to year N, and is never placed below the highest
+        year level of any PASSED subject. Capped to the curriculum's last year.
+        """
+        tracked = {g.subject_id: g.subject for g in self._grades_with_status(TRACKED_STATUSES)}
+        if not tracked:
+            return 1
+        tracked_units = sum(s.total_units for s in tracked.values())
+
+        units_per_year = defaultdict(int)
+        for subject in self.curriculum_subjects:
+            units_per_year[subject.year_level] += subject.total_units
+        if not units_per_year:
+            return 1
+
+        current_year = 1
+        cumulative_units = 0
+        for year in sorted(units_per_year):
+            cumulative_units += units_per_year[year]
+            if tracked_units >= (0.75 * cumulative_units):
+                current_year = year + 1
+            else:
+                break
+
+        passed_years = [g.subject.year_level for g in self._grades_with_status((Grade.STATUS_PASSED,))]
+        current_year = max(current_year, max(passed_years, default=0) or 1)
+
+        return min(current_year, max(units_per_year))
+
+    # ── Regularity ─────────────────────────────────────────────────────────
+
+    def back_subjects(self, term):
+        """
+        Returns curriculum subjects from earlier year levels, or earlier semesters of the
+        current year level, that the student has not yet passed or been credited for.
+        """
+        current_year = self.year_level
+        current_weight = SEMESTER_WEIGHT.get(term.semester_type, 0)
+        return [
+            s for s in self.curriculum_subjects
+            if (
+                s.year_level < current_year
+                or (s.year_level == current_year and SEMESTER_WEIGHT.get(s.semester, 0) < current_weight)
+            ) and s.id not in self.passed_or_credited_ids
+        ]
+
+    def regularity(self, term):
+        """
+        Determines if the student is regular for the given term.
+
+        Returns:
+            dict: {"is_regular": bool, "reason": str|None}
+        """
+        unresolved = self._grades_with_status(UNRESOLVED_STATUSES)
+        if unresolved:
+            codes = ", ".join(g.subject.code for g in unresolved)
+            return {"is_regular": False, "reason": f"Unresolved grades (INC/No Grade): {codes}"}
+
+        if self.student.student_type == 'TRANSFEREE' and not self.grades:
+            return {"is_regular": False, "reason": "New transferee student (Manual Advising required)"}
+
+        retakes = self._grades_with_status(RETAKE_STATUSES)
+        if retakes:
+            codes = ", ".join(g.subject.code for g in retakes)
+            return {"is_regular": False, "reason": f"Subjects requiring retake: {codes}"}
+
+        missing_back = self.back_subjects(term)
+        if missing_back:
+            missing_codes = ", ".join(s.code for s in missing_back)
+            if self.student.student_type == 'TRANSFEREE':
+                return {"is_regular": False, "reason": f"Transferee with uncredited/missing subjects: {missing_codes}"}
+            return {"is_regular": False, "reason": f"Missing back subjects: {missing_codes}"}
+
+        return {"is_regular": True, "reason": None}
+
+    def apply_to_enrollment(self, enrollment, term):
+        """
+        Copies regularity, reason and year level for `term` onto an enrollment
+        without saving it.
+        """
+        reg_data = self.regularity(term)
+        enrollment.is_regular = reg_data['is_regular']
+        enrollment.regularity_reason = reg_data['reason']
+        enrollment.year_level = self.year_level
+        return enrollment
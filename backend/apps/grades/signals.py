@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from apps.academics.models import Subject, SubjectPrerequisite
+from apps.grades.services.prerequisite_graph import PrerequisiteGraph
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_graph_on_subject_change(sender, instance, **kwargs):
+    PrerequisiteGraph.invalidate(instance.curriculum_id)
+
+
+@receiver(pre_delete, sender=Subject)
+def invalidate_dependent_graphs(sender, instance, **kwargs):
+    # Rules in other curricula pointing at this subject lose their target (SET_NULL)
+    dependent_curricula = SubjectPrerequisite.objects.filter(
+        prerequisite_subject=instance
+    ).values_list('subject__curriculum_id', flat=True).distinct()
+    PrerequisiteGraph.invalidate(*dependent_curricula)
+
+
+@receiver(post_save, sender=SubjectPrerequisite)
+@receiver(post_delete, sender=SubjectPrerequisite)
+def invalidate_graph_on_prerequisite_change(sender, instance, **kwargs):
+    curriculum_id = Subject.objects.filter(
+        id=instance.subject_id
+    ).values_list('curriculum_id', flat=True).first()
+    PrerequisiteGraph.invalidate(curriculum_id)
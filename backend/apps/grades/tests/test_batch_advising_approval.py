@@ -0,0 +1,144 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.students.models import Student, StudentEnrollment
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.grades.models import Grade
+from apps.terms.models import Term
+from apps.notifications.models import Notification
+from apps.auditing.models import AuditLog
+from apps.grades.services.advising_service import AdvisingService
+from apps.reports.services.graduation_audit import GraduationAudit
+
+User = get_user_model()
+
+
+@pytest.fixture
+def setup_data(db):
+    program = Program.objects.create(code='BSBA', name='BS Business Administration')
+    curriculum = CurriculumVersion.objects.create(program=program, version_name='v1')
+    term = Term.objects.create(
+        code='2025-1SEM',
+        semester_type='1',
+        academic_year='2025-2026',
+        start_date=date(2025, 8, 1),
+        end_date=date(2025, 12, 31),
+        enrollment_start=date(2025, 7, 1),
+        enrollment_end=date(2025, 7, 31),
+        advising_start=date(2025, 7, 1),
+        advising_end=date(2025, 7, 31),
+        is_active=True
+    )
+    subjects = [
+        Subject.objects.create(curriculum=curriculum, code=f'BA10{i}', description=f'BA 10{i}', year_level=1, semester='1', total_units=3)
+        for i in range(2)
+    ]
+
+    def make_pending(idx):
+        user = User.objects.create(username=f'batch{idx}', email=f'batch{idx}@example.com')
+        student = Student.objects.create(
+            user=user, idn=f'2700{idx:02d}', date_of_birth='2005-01-01', status='ADMITTED',
+            program=program, curriculum=curriculum, gender='MALE', student_type='FRESHMAN'
+        )
+        for subject in subjects:
+            Grade.objects.create(
+                student=student, subject=subject, term=term,
+                grade_status=Grade.STATUS_ADVISING, advising_status=Grade.ADVISING_PENDING
+            )
+        return StudentEnrollment.objects.create(
+            student=student, term=term, advising_status='PENDING', is_regular=True, year_level=None
+        )
+
+    return {'term': term, 'make_pending': make_pending}
+
+
+@pytest.mark.django_db
+def test_batch_approval_matches_single_approval(setup_data):
+    enrollments = [setup_data['make_pending'](i) for i in range(5)]
+    admin = User.objects.create_superuser(username='batchadmin', email='ba@example.com', password='p')
+
+    result = AdvisingService.batch_approve_advising(
+        StudentEnrollment.objects.filter(advising_status='PENDING'), admin, chunk_size=2
+    )
+
+    assert result['processed_count'] == 5
+    assert result['errors'] == []
+    assert [c['approved'] for c in result['chunks']] == [2, 2, 1]
+
+    for enrollment in enrollments:
+        enrollment.refresh_from_db()
+        assert enrollment.advising_status == 'APPROVED'
+        assert enrollment.advising_approved_by == admin
+        assert enrollment.year_level == 1
+        assert enrollment.student.status == 'ENROLLED'
+    assert not Grade.objects.exclude(grade_status=Grade.STATUS_ENROLLED).exists()
+    assert Notification.objects.filter(title="Advising Approved").count() == 5
+
+
+@pytest.mark.django_db
+def test_batch_approval_audits_every_row(setup_data):
+    enrollments = [setup_data['make_pending'](i) for i in range(3)]
+    admin = User.objects.create_superuser(username='batchadmin', email='ba@example.com', password='p')
+
+    AdvisingService.batch_approve_advising(
+        StudentEnrollment.objects.filter(advising_status='PENDING'), admin, chunk_size=2
+    )
+
+    for enrollment in enrollments:
+        entry = AuditLog.objects.filter(
+            model_name='StudentEnrollment', action='UPDATE', object_id=str(enrollment.pk)
+        ).latest('id')
+        assert entry.user == admin
+        assert entry.changes['advising_status'] == {'old': 'PENDING', 'new': 'APPROVED'}
+        assert entry.changes['year_level'] == {'old': None, 'new': '1'}
+
+        entry = AuditLog.objects.filter(
+            model_name='Student', action='UPDATE', object_id=str(enrollment.student_id)
+        ).latest('id')
+        assert entry.user == admin
+        assert entry.changes['status'] == {'old': 'ADMITTED', 'new': 'ENROLLED'}
+
+
+@pytest.mark.django_db
+def test_batch_approval_retires_cached_cohort_audits(setup_data):
+    enrollment = setup_data['make_pending'](0)
+    program_id = enrollment.student.program_id
+    admin = User.objects.create_superuser(username='batchadmin', email='ba@example.com', password='p')
+    assert GraduationAudit.for_cohort(program_id=program_id)['students'][0]['status'] == 'ADMITTED'
+
+    AdvisingService.batch_approve_advising(StudentEnrollment.objects.filter(advising_status='PENDING'), admin)
+
+    assert GraduationAudit.for_cohort(program_id=program_id)['students'][0]['status'] == 'ENROLLED'
+
+
+@pytest.mark.django_db
+def test_batch_approval_query_count_is_per_chunk(setup_data, django_assert_max_num_queries):
+    for i in range(10):
+        setup_data['make_pending'](i)
+    admin = User.objects.create_superuser(username='batchadmin', email='ba@example.com', password='p')
+
+    # 1 enrollment load + per chunk: savepoint pair, grade update, standing (2), enrollment
+    # bulk_update and audit insert, student bulk_update and audit insert, notification insert
+    with django_assert_max_num_queries(1 + 11):
+        result = AdvisingService.batch_approve_advising(
+            StudentEnrollment.objects.filter(advising_status='PENDING'), admin, chunk_size=50
+        )
+    assert result['processed_count'] == 10
+
+
+@pytest.mark.django_db
+def test_batch_approve_endpoint_writes_summary_audit(setup_data):
+    for i in range(3):
+        setup_data['make_pending'](i)
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_superuser(username='batchadmin', email='ba@example.com', password='p'))
+
+    response = client.post(reverse('advising-approvals-batch-approve-regular'))
+
+    assert response.status_code == 200
+    assert response.data['processed_count'] == 3
+    assert response.data['chunks'] == [{'chunk': 1, 'approved': 3, 'error': None}]
+    assert AuditLog.objects.filter(action='ADVISING_BATCH').count() == 1
@@ -0,0 +1,108 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from dateutil.relativedelta import relativedelta
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.grades.models import Grade
+from apps.grades.services.grading_service import GradingService
+from apps.notifications.models import Notification
+from apps.sections.models import Section
+from apps.students.models import Student
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.fixture
+def setup_data(db):
+    program = Program.objects.create(code='BULKG', name='Bulk Grades')
+    curriculum = CurriculumVersion.objects.create(program=program, version_name='v1')
+    term = Term.objects.create(
+        code='2025-BULKG', semester_type='1', academic_year='2025-2026',
+        start_date=date(2025, 8, 1), end_date=date(2025, 12, 31),
+        enrollment_start=date(2025, 7, 1), enrollment_end=date(2025, 7, 31),
+        advising_start=date(2025, 7, 1), advising_end=date(2025, 7, 31)
+    )
+    major = Subject.objects.create(curriculum=curriculum, code='BG101', description='Major', year_level=1,
+                                   semester='1', total_units=3, is_major=True)
+    minor = Subject.objects.create(curriculum=curriculum, code='BG102', description='Minor', year_level=1,
+                                   semester='1', total_units=3)
+    section = Section.objects.create(name='BG 1-1', term=term, program=program, year_level=1,
+                                     section_number=1, session='AM')
+    registrar = User.objects.create(username='bgregistrar', email='bgreg@example.com', role='REGISTRAR')
+
+    def make_students(count):
+        students = []
+        for _ in range(count):
+            idx = Student.objects.count() + 1
+            students.append(Student.objects.create(
+                user=User.objects.create(username=f'bg{idx}', email=f'bg{idx}@example.com', role='STUDENT'),
+                idn=f'25{idx:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='FEMALE', student_type='FRESHMAN'
+            ))
+        return students
+
+    return {
+        'term': term, 'major': major, 'minor': minor, 'section': section,
+        'registrar': registrar, 'make_students': make_students,
+    }
+
+
+@pytest.mark.django_db
+class TestBulkGradeFinalization:
+    def finalize_queries(self, setup_data, count, django_assert_max_num_queries):
+        Grade.objects.all().delete()
+        for student in setup_data['make_students'](count):
+            Grade.objects.create(student=student, subject=setup_data['major'], term=setup_data['term'],
+                                 section=setup_data['section'], grade_status=Grade.STATUS_PASSED, final_grade=2.0)
+        # savepoint pair, select, update, audit batch, notification insert, notification audit
+        with django_assert_max_num_queries(7):
+            return GradingService().finalize_section_grades(
+                setup_data['term'], setup_data['major'], setup_data['section'], setup_data['registrar']
+            )
+
+    def test_finalize_section_is_constant_in_queries(self, setup_data, django_assert_max_num_queries):
+        assert len(self.finalize_queries(setup_data, 3, django_assert_max_num_queries)) == 3
+        finalized = self.finalize_queries(setup_data, 40, django_assert_max_num_queries)
+
+        assert len(finalized) == 40
+        assert not Grade.objects.filter(finalized_at__isnull=True).exists()
+        assert set(Grade.objects.values_list('finalized_by', flat=True)) == {setup_data['registrar'].id}
+        entries = AuditLog.objects.filter(model_name='Grade', action='UPDATE', object_id__in=[str(g.id) for g in finalized])
+        assert entries.count() == 40
+        assert set(entries.values_list('user_id', flat=True)) == {setup_data['registrar'].id}
+        assert Notification.objects.filter(title="Grade Finalized").count() == 43
+
+        # Already finalized grades are left alone
+        assert GradingService().finalize_section_grades(
+            setup_data['term'], setup_data['major'], setup_data['section'], setup_data['registrar']
+        ) == []
+
+    def test_inc_sweep_uses_major_and_minor_deadlines(self, setup_data, django_assert_max_num_queries):
+        term = setup_data['term']
+        students = setup_data['make_students'](3)
+        for student in students:
+            for subject in (setup_data['major'], setup_data['minor']):
+                Grade.objects.create(student=student, subject=subject, term=term, grade_status=Grade.STATUS_ENROLLED)
+        Grade.objects.filter(student=students[0], subject=setup_data['minor']).update(
+            final_grade=1.5, grade_status=Grade.STATUS_PASSED
+        )
+
+        with django_assert_max_num_queries(7):
+            count = GradingService().mark_unsubmitted_as_inc(term, 'FINAL', setup_data['registrar'])
+
+        assert count == 5
+        today = timezone.now().date()
+        major_deadline = (timezone.now() + relativedelta(months=6)).date()
+        minor_deadline = (timezone.now() + relativedelta(months=12)).date()
+        inc = Grade.objects.filter(grade_status=Grade.STATUS_INC)
+        assert set(inc.filter(subject=setup_data['major']).values_list('inc_deadline', flat=True)) == {major_deadline}
+        assert set(inc.filter(subject=setup_data['minor']).values_list('inc_deadline', flat=True)) == {minor_deadline}
+        assert major_deadline > today
+        assert AuditLog.objects.filter(model_name='Grade', action='UPDATE').count() == 5
+        assert Notification.objects.filter(title="Grade Marked INC").count() == 3
+
+        assert GradingService().mark_unsubmitted_as_inc(term, 'FINAL', setup_data['registrar']) == 0
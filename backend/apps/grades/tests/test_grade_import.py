@@ -0,0 +1,145 @@
+import io
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from openpyxl import Workbook
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.faculty.models import Professor
+from apps.grades.models import Grade
+from apps.grades.services.grade_import import read_rows
+from apps.notifications.models import Notification
+from apps.scheduling.models import Schedule
+from apps.sections.models import Section
+from apps.students.models import Student
+from apps.terms.models import Term
+
+User = get_user_model()
+URL = '/api/grades/submission/bulk-submit/'
+
+
+def csv_file(rows, name='grades.csv'):
+    content = 'IDN,Name,Grade\n' + ''.join(f'{idn},Student,{grade}\n' for idn, grade in rows)
+    return SimpleUploadedFile(name, content.encode('utf-8'), content_type='text/csv')
+
+
+@pytest.mark.django_db
+class TestGradeImport:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        today = date.today()
+        self.term = Term.objects.create(
+            code='2025-GI', semester_type='1', academic_year='2025-2026',
+            start_date=today - timedelta(days=90), end_date=today + timedelta(days=30),
+            enrollment_start=today - timedelta(days=120), enrollment_end=today - timedelta(days=100),
+            advising_start=today - timedelta(days=120), advising_end=today - timedelta(days=100),
+            midterm_grade_start=today - timedelta(days=40), midterm_grade_end=today - timedelta(days=30),
+            final_grade_start=today - timedelta(days=1), final_grade_end=today + timedelta(days=5)
+        )
+        program = Program.objects.create(code='GI', name='Grade Import')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='v1')
+        self.subject = Subject.objects.create(curriculum=curriculum, code='GI101', description='Import',
+                                              year_level=1, semester='1', total_units=3, is_major=True)
+        self.section = Section.objects.create(name='GI 1-1', term=self.term, program=program, year_level=1,
+                                              section_number=1, session='AM')
+        self.prof_user = User.objects.create(username='giprof', email='giprof@test.com', role='PROFESSOR',
+                                             first_name='Ana', last_name='Reyes')
+        professor = Professor.objects.create(user=self.prof_user, employee_id='GI-001', department='IT',
+                                             date_of_birth=date(1980, 1, 1))
+        Schedule.objects.create(term=self.term, section=self.section, subject=self.subject,
+                                component_type='LEC', professor=professor)
+        self.registrars = [
+            User.objects.create(username=f'gireg{i}', email=f'gireg{i}@test.com', role=role)
+            for i, role in enumerate(['REGISTRAR', 'HEAD_REGISTRAR'])
+        ]
+        self.grades = {}
+        for i in range(4):
+            student = Student.objects.create(
+                user=User.objects.create(username=f'gistud{i}', email=f'gistud{i}@test.com', role='STUDENT'),
+                idn=f'28{i:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+            )
+            self.grades[student.idn] = Grade.objects.create(
+                student=student, subject=self.subject, term=self.term, section=self.section,
+                grade_status=Grade.STATUS_ENROLLED
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.prof_user)
+
+    def post(self, file_obj, period='FINAL'):
+        return self.client.post(URL, {
+            'file': file_obj, 'term_id': self.term.id, 'subject_id': self.subject.id,
+            'section_id': self.section.id, 'period': period,
+        }, format='multipart')
+
+    def test_csv_is_applied_in_bulk(self, django_assert_max_num_queries):
+        rows = [('280000', '1.25'), ('280001', '5.0'), ('280002', 'inc'), ('280003', '')]
+        with django_assert_max_num_queries(14):
+            response = self.post(csv_file(rows))
+
+        assert response.status_code == 200
+        assert (response.data['applied'], response.data['skipped'], response.data['errors']) == (3, 1, [])
+        statuses = {idn: (grade.refresh_from_db() or grade) for idn, grade in self.grades.items()}
+        assert (statuses['280000'].final_grade, statuses['280000'].grade_status) == (Decimal('1.25'), Grade.STATUS_PASSED)
+        assert statuses['280001'].grade_status == Grade.STATUS_FAILED
+        assert statuses['280002'].grade_status == Grade.STATUS_INC and statuses['280002'].inc_deadline
+        assert statuses['280003'].grade_status == Grade.STATUS_ENROLLED
+        assert statuses['280000'].submitted_by == self.prof_user
+
+        assert AuditLog.objects.filter(model_name='Grade', action='UPDATE', user=self.prof_user).count() == 3
+        assert AuditLog.objects.filter(action='GRADE_BULK_SUBMIT').count() == 1
+        notices = Notification.objects.filter(title='Final Grades Submitted')
+        assert sorted(notices.values_list('recipient_id', flat=True)) == sorted(u.id for u in self.registrars)
+        assert '(3 students)' in notices.first().message
+
+    def test_invalid_rows_reject_the_whole_file(self):
+        rows = [('280000', '1.0'), ('280001', '4.0'), ('999999', '2.0'), ('280000', '2.0'), ('280002', 'A')]
+        response = self.post(csv_file(rows))
+
+        assert response.status_code == 400
+        assert response.data['applied'] == 0
+        assert [(e['row'], e['idn']) for e in response.data['errors']] == [
+            (3, '280001'), (4, '999999'), (5, '280000'), (6, '280002')
+        ]
+        assert not Grade.objects.exclude(grade_status=Grade.STATUS_ENROLLED).exists()
+        assert not Notification.objects.exists()
+
+    def test_xlsx_midterm_and_guards(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['IDN', 'Grade'])
+        sheet.append(['280000', 2.5])
+        sheet.append([280001, 'NG'])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        xlsx = SimpleUploadedFile('grades.xlsx', buffer.getvalue())
+
+        # The midterm window is closed
+        response = self.post(xlsx, period='MIDTERM')
+        assert response.status_code == 400
+        assert 'closed' in response.data['message']
+
+        self.term.midterm_grade_end = date.today()
+        self.term.save()
+        xlsx.seek(0)
+        response = self.post(xlsx, period='MIDTERM')
+        assert response.status_code == 200 and response.data['applied'] == 2
+        self.grades['280001'].refresh_from_db()
+        assert self.grades['280001'].grade_status == Grade.STATUS_NO_GRADE
+
+        other = User.objects.create(username='giother', email='giother@test.com', role='PROFESSOR')
+        self.client.force_authenticate(user=other)
+        assert self.post(csv_file([('280000', '1.0')])).status_code == 403
+        assert self.post(SimpleUploadedFile('grades.txt', b'IDN,Grade\n')).status_code == 400
+
+    def test_unreadable_xlsx_is_rejected(self):
+        with pytest.raises(ValueError, match='not a readable .xlsx'):
+            read_rows(SimpleUploadedFile('x.xlsx', b'not a zip'))
+
+        response = self.post(SimpleUploadedFile('grades.xlsx', b'not a zip'))
+        assert response.status_code == 400
+        assert not Grade.objects.exclude(grade_status=Grade.STATUS_ENROLLED).exists()
@@ -0,0 +1,107 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject, SubjectPrerequisite
+from apps.faculty.models import Professor
+from apps.grades.models import Grade
+from apps.scheduling.models import Schedule
+from apps.sections.models import Section
+from apps.students.models import Student
+from tests.factories import TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestGradeSerializerQueries:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = TermFactory()
+        self.program = Program.objects.create(code='NPO', name='No N+1')
+        self.curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.subjects = [
+            Subject.objects.create(curriculum=self.curriculum, code=f'NP{i}', description=f'Subject {i}',
+                                   year_level=1, semester='1', total_units=3)
+            for i in range(2)
+        ]
+        SubjectPrerequisite.objects.create(subject=self.subjects[1], prerequisite_type='SPECIFIC',
+                                           prerequisite_subject=self.subjects[0])
+        self.sections = [
+            Section.objects.create(name=f'NP 1-{i}', term=self.term, program=self.program, year_level=1,
+                                   section_number=i, session='AM')
+            for i in (1, 2)
+        ]
+        self.prof_user = User.objects.create(username='npprof', email='npprof@test.com', role='PROFESSOR',
+                                             first_name='Rosa', last_name='Lim')
+        professor = Professor.objects.create(user=self.prof_user, employee_id='NP-001', department='IT',
+                                             date_of_birth=date(1980, 1, 1))
+        for section in self.sections:
+            for subject in self.subjects:
+                Schedule.objects.create(
+                    term=self.term, section=section, subject=subject, component_type='LEC',
+                    professor=professor if section == self.sections[0] else None,
+                    days=['M'], start_time=time(8), end_time=time(9)
+                )
+        self.registrar = User.objects.create(username='npreg', email='npreg@test.com', role='REGISTRAR')
+        self.students = []
+
+    def add_students(self, count):
+        for _ in range(count):
+            idx = len(self.students)
+            student = Student.objects.create(
+                user=User.objects.create(username=f'npstud{idx}', email=f'npstud{idx}@test.com', role='STUDENT'),
+                idn=f'31{idx:04d}', program=self.program, curriculum=self.curriculum,
+                date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+            )
+            for subject in self.subjects:
+                Grade.objects.create(student=student, subject=subject, term=self.term,
+                                     section=self.sections[idx % 2], grade_status=Grade.STATUS_ENROLLED)
+            self.students.append(student)
+
+    def get(self, user, url, params=None):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, params or {})
+        assert response.status_code == 200
+        return response, len(queries)
+
+    @pytest.mark.parametrize('endpoint', ['advising-registrar', 'advising-student', 'roster'])
+    def test_query_count_does_not_grow_with_rows(self, endpoint):
+        def call():
+            if endpoint == 'advising-registrar':
+                return self.get(self.registrar, '/api/grades/advising/')
+            if endpoint == 'advising-student':
+                return self.get(self.students[0].user, '/api/grades/advising/')
+            return self.get(self.prof_user, '/api/grades/submission/roster/', {
+                'section_id': self.sections[0].id, 'subject_id': self.subjects[1].id
+            })
+
+        self.add_students(2)
+        _, few = call()
+        self.add_students(10)
+        _, many = call()
+
+        # page count, grades (with the professor subquery), prerequisites, prerequisite
+        # subjects and the annotated sections
+        assert few == many == 5
+
+    def test_eager_loaded_rows_match_the_per_row_lookups(self):
+        self.add_students(2)
+        response, _ = self.get(self.registrar, '/api/grades/advising/')
+        rows = response.data['results'] if isinstance(response.data, dict) else response.data
+
+        by_key = {(row['student_idn'], row['subject_details']['code']): row for row in rows}
+        first = by_key[(self.students[0].idn, 'NP1')]
+        second = by_key[(self.students[1].idn, 'NP1')]
+        assert first['professor_name'] == 'Rosa Lim'
+        assert second['professor_name'] == 'TBA'
+        assert first['section_details']['subject_count'] == 2
+        assert first['section_details']['scheduling_status'] == 'FULL'
+        assert second['section_details']['scheduling_status'] == 'UNSCHEDULED'
+        assert first['section_details']['program_code'] == 'NPO'
+        assert first['subject_details']['prerequisites'][0]['prerequisite_subject_code'] == 'NP0'
@@ -0,0 +1,137 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from apps.students.models import Student, StudentEnrollment
+from apps.academics.models import Program, CurriculumVersion, Subject, SubjectPrerequisite
+from apps.grades.models import Grade
+from apps.terms.models import Term
+from apps.grades.services.advising_service import AdvisingService
+from apps.grades.services.prerequisite_graph import CACHE_KEY, PrerequisiteGraph
+from apps.grades.services.student_standing import StudentStanding
+
+User = get_user_model()
+
+
+@pytest.fixture
+def setup_data(db):
+    program = Program.objects.create(code='BSIT', name='BS Information Technology')
+    curriculum = CurriculumVersion.objects.create(program=program, version_name='v1')
+    term = Term.objects.create(
+        code='2025-1SEM',
+        semester_type='1',
+        academic_year='2025-2026',
+        start_date=date(2025, 8, 1),
+        end_date=date(2025, 12, 31),
+        enrollment_start=date(2025, 7, 1),
+        enrollment_end=date(2025, 7, 31),
+        advising_start=date(2025, 7, 1),
+        advising_end=date(2025, 7, 31),
+        is_active=True
+    )
+    intro = Subject.objects.create(curriculum=curriculum, code='IT101', description='Intro Programming', year_level=1, semester='1', total_units=3)
+    advanced = Subject.objects.create(curriculum=curriculum, code='IT201', description='Advanced Programming', year_level=2, semester='1', total_units=3)
+    capstone = Subject.objects.create(curriculum=curriculum, code='CAP', description='Capstone', year_level=2, semester='1', total_units=4)
+
+    user = User.objects.create(username='graphstudent', email='graph@example.com')
+    student = Student.objects.create(
+        user=user, idn='270001', date_of_birth='2005-01-01',
+        program=program, curriculum=curriculum, gender='MALE', student_type='CURRENT'
+    )
+    enrollment = StudentEnrollment.objects.create(student=student, term=term, year_level=1)
+    return {
+        'curriculum': curriculum, 'term': term, 'student': student, 'enrollment': enrollment,
+        'intro': intro, 'advanced': advanced, 'capstone': capstone,
+    }
+
+
+@pytest.mark.django_db
+def test_specific_prerequisite_messages_match(setup_data):
+    d = setup_data
+    SubjectPrerequisite.objects.create(subject=d['advanced'], prerequisite_type='SPECIFIC', prerequisite_subject=d['intro'])
+
+    with pytest.raises(ValidationError) as excinfo:
+        AdvisingService.validate_subject_prerequisites(d['student'], d['advanced'], d['term'])
+    assert "Missing prerequisite for IT201: IT101" in str(excinfo.value)
+
+    Grade.objects.create(student=d['student'], subject=d['intro'], term=d['term'], grade_status=Grade.STATUS_PASSED)
+    AdvisingService.validate_subject_prerequisites(d['student'], d['advanced'], d['term'])
+
+
+@pytest.mark.django_db
+def test_year_group_and_percentage_rules(setup_data):
+    d = setup_data
+    SubjectPrerequisite.objects.create(subject=d['capstone'], prerequisite_type='YEAR_STANDING', standing_year=2)
+    SubjectPrerequisite.objects.create(subject=d['capstone'], prerequisite_type='GROUP', description='programming', min_subjects=2)
+    SubjectPrerequisite.objects.create(subject=d['capstone'], prerequisite_type='PERCENTAGE', min_units=50)
+    graph = PrerequisiteGraph.for_curriculum(d['curriculum'].id)
+
+    standing = StudentStanding.for_student(d['student'])
+    assert graph.first_unmet(d['capstone'], standing, year_level=1) == "CAP requires Year 2 standing."
+    assert graph.first_unmet(d['capstone'], standing, year_level=2) == (
+        "Missing group prerequisite for CAP: Needs 2 subjects from 'programming'."
+    )
+
+    for subject in (d['intro'], d['advanced']):
+        Grade.objects.create(student=d['student'], subject=subject, term=d['term'], grade_status=Grade.STATUS_PASSED)
+    standing = StudentStanding.for_student(d['student'])
+    # 6 of 10 units passed, so the 50% threshold is met
+    assert graph.first_unmet(d['capstone'], standing, year_level=2) is None
+
+
+@pytest.mark.django_db
+def test_graph_is_cached_and_evaluated_without_queries(setup_data, django_assert_num_queries):
+    d = setup_data
+    SubjectPrerequisite.objects.create(subject=d['advanced'], prerequisite_type='SPECIFIC', prerequisite_subject=d['intro'])
+    PrerequisiteGraph.for_curriculum(d['curriculum'].id)
+    standing = StudentStanding.for_student(d['student'])
+    standing.passed_subject_ids
+
+    with django_assert_num_queries(0):
+        for subject in (d['intro'], d['advanced'], d['capstone']):
+            try:
+                AdvisingService.validate_subject_prerequisites(
+                    d['student'], subject, d['term'], standing=standing, enrollment=d['enrollment']
+                )
+            except ValidationError:
+                pass
+
+
+@pytest.mark.django_db
+def test_cache_invalidated_on_prerequisite_change(setup_data):
+    d = setup_data
+    assert PrerequisiteGraph.for_curriculum(d['curriculum'].id).rules_for(d['advanced'].id) == []
+
+    prereq = SubjectPrerequisite.objects.create(subject=d['advanced'], prerequisite_type='SPECIFIC', prerequisite_subject=d['intro'])
+    graph = PrerequisiteGraph.for_curriculum(d['curriculum'].id)
+    assert graph.direct_prerequisites(d['advanced'].id) == [d['intro'].id]
+
+    prereq.delete()
+    assert PrerequisiteGraph.for_curriculum(d['curriculum'].id).rules_for(d['advanced'].id) == []
+
+
+@pytest.mark.django_db
+def test_graph_cached_before_commit_is_dropped_on_commit(setup_data, django_capture_on_commit_callbacks):
+    d = setup_data
+    with django_capture_on_commit_callbacks(execute=True):
+        SubjectPrerequisite.objects.create(subject=d['advanced'], prerequisite_type='SPECIFIC', prerequisite_subject=d['intro'])
+        # A concurrent request re-caches the pre-commit graph, which lacks the new rule
+        cache.set(CACHE_KEY.format(curriculum_id=d['curriculum'].id), PrerequisiteGraph(d['curriculum'].id, {}))
+
+    assert PrerequisiteGraph.for_curriculum(d['curriculum'].id).direct_prerequisites(d['advanced'].id) == [d['intro'].id]
+
+
+@pytest.mark.django_db
+def test_auto_advise_regular_picks_first_unblocked_block(setup_data):
+    d = setup_data
+    d['student'].is_advising_unlocked = True
+    d['student'].save()
+    SubjectPrerequisite.objects.create(subject=d['advanced'], prerequisite_type='SPECIFIC', prerequisite_subject=d['intro'])
+
+    grades = AdvisingService.auto_advise_regular(d['student'], d['term'])
+
+    assert [g.subject.code for g in grades] == ['IT101']
+    d['enrollment'].refresh_from_db()
+    assert d['enrollment'].advising_status == 'PENDING'
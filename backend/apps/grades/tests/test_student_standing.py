@@ -0,0 +1,136 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from apps.students.models import Student, StudentEnrollment
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.grades.models import Grade
+from apps.terms.models import Term
+from apps.grades.services.student_standing import StudentStanding
+from apps.auditing.models import AuditLog
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+
+User = get_user_model()
+
+
+@pytest.fixture
+def setup_data(db):
+    program = Program.objects.create(code='BSIS', name='BS Information Systems')
+    curriculum = CurriculumVersion.objects.create(program=program, version_name='v1')
+    term = Term.objects.create(
+        code='2025-2SEM',
+        semester_type='2',
+        academic_year='2025-2026',
+        start_date=date(2025, 11, 1),
+        end_date=date(2026, 3, 31),
+        enrollment_start=date(2025, 10, 1),
+        enrollment_end=date(2025, 10, 31),
+        advising_start=date(2025, 10, 1),
+        advising_end=date(2025, 10, 31),
+        is_active=True
+    )
+    subjects = [
+        Subject.objects.create(curriculum=curriculum, code='S1-1', description='Subj 1-1', year_level=1, semester='1', total_units=3),
+        Subject.objects.create(curriculum=curriculum, code='S1-2', description='Subj 1-2', year_level=1, semester='1', total_units=3),
+        Subject.objects.create(curriculum=curriculum, code='S1-3', description='Subj 1-3', year_level=1, semester='2', total_units=3),
+        Subject.objects.create(curriculum=curriculum, code='S2-1', description='Subj 2-1', year_level=2, semester='1', total_units=3),
+    ]
+
+    def make_student(idx, student_type='CURRENT'):
+        user = User.objects.create(username=f'standing{idx}', email=f'standing{idx}@example.com')
+        return Student.objects.create(
+            user=user, idn=f'2600{idx:02d}', date_of_birth='2005-01-01',
+            program=program, curriculum=curriculum, gender='MALE', student_type=student_type
+        )
+
+    return {'term': term, 'subjects': subjects, 'make_student': make_student}
+
+
+@pytest.mark.django_db
+def test_regular_student_has_no_back_subjects(setup_data):
+    term, subjects = setup_data['term'], setup_data['subjects']
+    student = setup_data['make_student'](1)
+    Grade.objects.create(student=student, subject=subjects[0], term=term, grade_status=Grade.STATUS_PASSED)
+    Grade.objects.create(student=student, subject=subjects[1], term=term, grade_status=Grade.STATUS_PASSED)
+
+    standing = StudentStanding.for_student(student)
+
+    assert standing.year_level == 1
+    assert standing.back_subjects(term) == []
+    assert standing.regularity(term) == {"is_regular": True, "reason": None}
+
+
+@pytest.mark.django_db
+def test_missing_back_subject_makes_student_irregular(setup_data):
+    term, subjects = setup_data['term'], setup_data['subjects']
+    student = setup_data['make_student'](2)
+    Grade.objects.create(student=student, subject=subjects[0], term=term, grade_status=Grade.STATUS_PASSED)
+
+    standing = StudentStanding.for_student(student)
+
+    assert [s.code for s in standing.back_subjects(term)] == ['S1-2']
+    assert standing.regularity(term) == {"is_regular": False, "reason": "Missing back subjects: S1-2"}
+
+
+@pytest.mark.django_db
+def test_unresolved_grade_takes_precedence(setup_data):
+    term, subjects = setup_data['term'], setup_data['subjects']
+    student = setup_data['make_student'](3)
+    Grade.objects.create(student=student, subject=subjects[0], term=term, grade_status=Grade.STATUS_INC)
+    Grade.objects.create(student=student, subject=subjects[1], term=term, grade_status=Grade.STATUS_FAILED)
+
+    reg_data = StudentStanding.for_student(student).regularity(term)
+
+    assert reg_data["is_regular"] is False
+    assert reg_data["reason"] == "Unresolved grades (INC/No Grade): S1-1"
+
+
+@pytest.mark.django_db
+def test_new_transferee_is_irregular(setup_data):
+    student = setup_data['make_student'](4, student_type='TRANSFEREE')
+
+    reg_data = StudentStanding.for_student(student).regularity(setup_data['term'])
+
+    assert reg_data == {"is_regular": False, "reason": "New transferee student (Manual Advising required)"}
+
+
+@pytest.mark.django_db
+def test_for_students_uses_constant_queries(setup_data, django_assert_num_queries):
+    term, subjects = setup_data['term'], setup_data['subjects']
+    students = [setup_data['make_student'](10 + i) for i in range(6)]
+    for student in students[::2]:
+        Grade.objects.create(student=student, subject=subjects[0], term=term, grade_status=Grade.STATUS_PASSED)
+
+    # 1 student query + 1 grade query + 1 curriculum query, independent of batch size
+    with django_assert_num_queries(3):
+        standings = StudentStanding.for_students(Student.objects.filter(id__in=[s.id for s in students]))
+        results = {sid: (st.year_level, st.regularity(term)) for sid, st in standings.items()}
+
+    for student in students:
+        expected = StudentStanding.for_student(student)
+        assert results[student.id] == (expected.year_level, expected.regularity(term))
+
+
+@pytest.mark.django_db
+def test_refresh_command_updates_enrollments(setup_data):
+    term, subjects = setup_data['term'], setup_data['subjects']
+    student = setup_data['make_student'](20)
+    Grade.objects.create(student=student, subject=subjects[0], term=term, grade_status=Grade.STATUS_FAILED)
+    enrollment = StudentEnrollment.objects.create(student=student, term=term, is_regular=True, year_level=3)
+
+    enrollment.advising_status = 'APPROVED'
+    enrollment.save()
+    assert SectioningSnapshot.for_term(term).report['regular_students'] == 1
+
+    call_command('refresh_student_standing')
+
+    assert SectioningSnapshot.for_term(term).report['irregular_students'] == 1
+    enrollment.refresh_from_db()
+    assert enrollment.is_regular is False
+    assert enrollment.regularity_reason == "Subjects requiring retake: S1-1"
+    assert enrollment.year_level == 1
+
+    entry = AuditLog.objects.filter(action='UPDATE', model_name='StudentEnrollment', object_id=str(enrollment.id)).latest('id')
+    assert entry.changes['is_regular'] == {'old': 'True', 'new': 'False'}
+    assert entry.changes['year_level'] == {'old': '3', 'new': '1'}
@@ -36,7 +36,7 @@ class AdvisingViewSet(viewsets.ModelViewSet):
         Filters the Grade queryset based on the authenticated user's role.
         """
         user = self.request.user
-        queryset = Grade.objects.all()
+        queryset = GradeSerializer.setup_eager_loading(Grade.objects.all())
         if user.role == 'STUDENT': return queryset.filter(student__user=user)
         if user.role == 'PROGRAM_HEAD': return queryset.filter(student__program__program_head=user)
         if user.role in ('ADMIN', 'REGISTRAR', 'HEAD_REGISTRAR'): return queryset
@@ -65,6 +65,7 @@ class AdvisingViewSet(viewsets.ModelViewSet):
         
         try:
             grades = AdvisingService.auto_advise_regular(student, active_term)
+            grades = GradeSerializer.setup_eager_loading(Grade.objects.filter(id__in=[grade.id for grade in grades])).order_by('id')
             return Response(GradeSerializer(grades, many=True).data, status=status.HTTP_201_CREATED)
         except django_exceptions.ValidationError as e:
             raise map_django_error(e)
@@ -81,6 +82,7 @@ class AdvisingViewSet(viewsets.ModelViewSet):
         
         try:
             grades = AdvisingService.manual_advise_irregular(student, active_term, serializer.validated_data['subject_ids'])
+            grades = GradeSerializer.setup_eager_loading(Grade.objects.filter(id__in=[grade.id for grade in grades])).order_by('id')
             return Response(GradeSerializer(grades, many=True).data, status=status.HTTP_201_CREATED)
         except django_exceptions.ValidationError as e:
             raise map_django_error(e)
@@ -185,6 +187,8 @@ class AdvisingApprovalViewSet(AuditMixin, viewsets.ModelViewSet):
     def batch_approve_regular(self, request):
         """
         Approves all regular students with PENDING advising status in the user's program.
+        Runs in chunks through AdvisingService.batch_approve_advising(); progress and
+        errors are reported per chunk.
         """
         user = self.request.user
         queryset = StudentEnrollment.objects.filter(advising_status='PENDING', is_regular=True)
@@ -195,23 +199,19 @@ class AdvisingApprovalViewSet(AuditMixin, viewsets.ModelViewSet):
         if count == 0:
             return Response({"error": "No pending regular students found."}, status=status.HTTP_400_BAD_REQUEST)
             
-        processed_count, errors = 0, []
-        for enrollment in queryset:
-            try:
-                AdvisingService.approve_advising(enrollment, user)
-                processed_count += 1
-            except Exception as e:
-                errors.append(f"{enrollment.student.idn}: {str(e)}")
-        
+        result = AdvisingService.batch_approve_advising(queryset, user)
+        processed_count, errors = result['processed_count'], result['errors']
+
         self.audit_action(
             request,
-            action="BATCH_ADVISING_APPROVE",
+            action="ADVISING_BATCH",
             resource="StudentEnrollment:Batch",
             description=f"Batch approved {processed_count} regular students",
-            metadata={"count": processed_count, "errors": errors, "role": user.role}
+            metadata={"count": processed_count, "errors": errors, "chunks": result['chunks'], "role": user.role}
         )
         return Response({
             "status": f"Successfully approved {processed_count} regular students.",
             "processed_count": processed_count,
-            "errors": errors
+            "errors": errors,
+            "chunks": result['chunks']
         })
@@ -18,6 +18,7 @@ from core.utils import map_django_error
 from core.permissions import IsProfessor, IsRegistrar, IsAdmin
 from apps.grades.models import Grade
 from apps.grades.serializers import GradeSerializer
+from apps.grades.services.grade_import import GradeImportService
 from apps.grades.services.grading_service import GradingService
 from apps.terms.models import Term
 from apps.academics.models import Subject
@@ -80,10 +81,10 @@ class GradeSubmissionViewSet(AuditMixin, viewsets.GenericViewSet):
         subject_id = request.query_params.get('subject_id')
         search_term = request.query_params.get('search')
 
-        queryset = Grade.objects.filter(
+        queryset = GradeSerializer.setup_eager_loading(Grade.objects.filter(
             section_id=section_id, 
             subject_id=subject_id
-        ).select_related('student__user').order_by('student__user__last_name')
+        )).order_by('student__user__last_name')
 
         if search_term:
             queryset = queryset.filter(
@@ -100,6 +101,42 @@ class GradeSubmissionViewSet(AuditMixin, viewsets.GenericViewSet):
         serializer = GradeSerializer(queryset, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['post'], url_path='bulk-submit')
+    def bulk_submit(self, request):
+        """
+        Applies a CSV/XLSX roster of midterm or final grades ('IDN' and 'Grade' columns)
+        for one section and subject. Nothing is saved unless every row is valid;
+        the response lists the invalid rows.
+        """
+        from apps.sections.models import Section
+        file_obj = request.FILES.get('file')
+        if not file_obj:
+            raise drf_exceptions.ValidationError({'detail': 'No file uploaded.'})
+        try:
+            term = Term.objects.get(pk=request.data.get('term_id'))
+            subject = Subject.objects.get(pk=request.data.get('subject_id'))
+            section = Section.objects.get(pk=request.data.get('section_id'))
+        except (Term.DoesNotExist, Subject.DoesNotExist, Section.DoesNotExist, ValueError):
+            raise drf_exceptions.ValidationError({'detail': 'Valid term_id, subject_id and section_id are required.'})
+
+        period = str(request.data.get('period', 'FINAL')).upper()
+        try:
+            report = GradeImportService.submit(term, subject, section, period, file_obj, request.user)
+        except ValueError as e:
+            raise drf_exceptions.ValidationError({'detail': str(e)})
+
+        if report['errors']:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+
+        self.audit_action(
+            request,
+            action="GRADE_BULK_SUBMIT",
+            resource=f"Section:{section.id}",
+            description=f"Bulk submitted {period.lower()} grades for {subject.code} in {section.name}.",
+            metadata={"period": period, "subject_id": subject.id, "applied": report['applied'], "skipped": report['skipped']}
+        )
+        return Response(report)
+
     @action(detail=False, methods=['post'], url_path='finalize-section')
     def finalize_section(self, request):
         """
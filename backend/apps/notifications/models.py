@@ -36,6 +36,10 @@ class Notification(AuditMixin, models.Model):
     message = models.TextField()
     link_url = models.CharField(max_length=255, blank=True, null=True)
     is_read = models.BooleanField(default=False)
+    # Digest notifications (NotificationService.notify_digest) share a key per event group
+    # and count the events folded into them
+    digest_key = models.CharField(max_length=100, blank=True, null=True, db_index=True)
+    event_count = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -9,6 +9,6 @@ class NotificationSerializer(serializers.ModelSerializer):
         model = Notification
         fields = [
             'id', 'recipient', 'recipient_name', 'type', 'type_display',
-            'title', 'message', 'link_url', 'is_read', 'created_at'
+            'title', 'message', 'link_url', 'is_read', 'event_count', 'created_at'
         ]
-        read_only_fields = ['recipient', 'created_at']
+        read_only_fields = ['recipient', 'event_count', 'created_at']
@@ -7,12 +7,37 @@ Notifications cannot be created directly via the API — only this service creat
 
 Usage:
     NotificationService.notify(recipient=user, notification_type=..., title=..., message=...)
+    NotificationService.notify_many(recipients=users, notification_type=..., title=..., message=...)
+    NotificationService.notify_digest(recipients=NotificationService.registrar_ids(), notification_type=...,
+                                      digest_key=..., title=..., message=..., unit='student')
     NotificationService.notify_session_redirection(student, preferred_session, assigned_session)
     NotificationService.mark_as_read(notification_id, requesting_user)
     NotificationService.mark_all_as_read(user)
 """
 
+from datetime import timedelta
+from itertools import islice
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.auditing.middleware import get_current_ip, get_current_user
+from apps.auditing.models import AuditLog
 from ..models import Notification
+from core.cache import drop_now_and_on_commit
+
+
+# Notifications per bulk INSERT in notify_many
+BULK_BATCH_SIZE = 1000
+
+# Events of the same group reaching a recipient within this window share one digest
+DIGEST_WINDOW = timedelta(minutes=30)
+
+REGISTRAR_ROLES = ('REGISTRAR', 'HEAD_REGISTRAR')
+REGISTRAR_CACHE_KEY = 'notifications:registrars'
+REGISTRAR_CACHE_TIMEOUT = 60 * 60
 
 
 class NotificationService:
@@ -40,6 +65,185 @@ class NotificationService:
             link_url=link_url
         )
 
+    @staticmethod
+    def notify_many(recipients, notification_type, title, message, link_url=None,
+                    batch_size=BULK_BATCH_SIZE, defer=False, user=None):
+        """
+        Creates the same notification for many recipients with chunked bulk inserts
+        and records the fan-out as one BULK_NOTIFY audit entry instead of one entry per
+        notification.
+
+        Args:
+            recipients (Iterable[User | int]): The users (or user primary keys) to notify.
+                                               Consumed lazily, so a values_list iterator works.
+            notification_type (str): One of Notification.NotificationType choices.
+            title (str): Short heading displayed in the notification panel.
+            message (str): Full notification body text.
+            link_url (str | None): Optional deep-link URL to the relevant portal page.
+            batch_size (int): Notifications per INSERT; each chunk commits on its own
+                              when called outside a transaction.
+            defer (bool): Run the fan-out once the current transaction commits, so the
+                          caller's transaction does not hold the inserts.
+            user (User | None): Actor recorded on the audit entry; defaults to the
+                                current request's user.
+
+        Returns:
+            int | None: Number of notifications created, or None when deferred.
+        """
+        user, ip = NotificationService._actor(user)
+
+        def fan_out():
+            total = 0
+            iterator = iter(recipients)
+            while chunk := list(islice(iterator, batch_size)):
+                Notification.objects.bulk_create([
+                    Notification(
+                        recipient_id=getattr(recipient, 'pk', recipient),
+                        type=notification_type,
+                        title=title,
+                        message=message,
+                        link_url=link_url
+                    )
+                    for recipient in chunk
+                ])
+                total += len(chunk)
+
+            if total:
+                AuditLog.objects.create(
+                    user=user,
+                    action='BULK_NOTIFY',
+                    model_name='Notification',
+                    object_id=notification_type,
+                    object_repr=f"{title} ({total} recipients)"[:255],
+                    changes={'type': notification_type, 'title': title, 'recipients': total, 'link_url': link_url},
+                    ip_address=ip
+                )
+            return total
+
+        if defer:
+            transaction.on_commit(fan_out)
+            return None
+        return fan_out()
+
+    @staticmethod
+    def notify_digest(recipients, notification_type, digest_key, title, message, link_url=None,
+                      unit='update', count=1, window=DIGEST_WINDOW, user=None):
+        """
+        Records `count` events of one group (e.g. grade submissions for a section and
+        subject) for each recipient. A recipient with an unread notification of the
+        same group from within `window` has it updated in place (count, message and
+        timestamp); everyone else gets a new one. Events raised inside one transaction
+        therefore end up in a single notification per recipient as well.
+
+        Query count is constant in the number of recipients: one lookup of the open
+        digests, one bulk UPDATE, one bulk INSERT and one BULK_NOTIFY audit entry.
+
+        Args:
+            recipients (Iterable[User | int]): The users (or user primary keys) to notify.
+            notification_type (str): One of Notification.NotificationType choices.
+            digest_key (str): Identifies the event group, e.g. 'grade-final:<section>:<subject>'.
+            title (str): Short heading displayed in the notification panel.
+            message (str): Body text without a trailing period; the running count is
+                           appended, e.g. "... for IT101 - BSIT 1-1 (12 students)."
+            link_url (str | None): Optional deep-link URL to the relevant portal page.
+            unit (str): Singular noun the events are counted in.
+            count (int): Number of events this call stands for.
+            window (timedelta): How far back an unread digest is still extended.
+            user (User | None): Actor recorded on the audit entry; defaults to the
+                                current request's user.
+
+        Returns:
+            int: Number of recipients notified.
+        """
+        recipient_ids = list(dict.fromkeys(getattr(recipient, 'pk', recipient) for recipient in recipients))
+        if not recipient_ids or count < 1:
+            return 0
+
+        def render(total):
+            return f"{message} ({total} {unit}{'' if total == 1 else 's'})."
+
+        now = timezone.now()
+        open_digests = {
+            notification.recipient_id: notification
+            for notification in Notification.objects.filter(
+                recipient_id__in=recipient_ids,
+                type=notification_type,
+                digest_key=digest_key,
+                is_read=False,
+                created_at__gte=now - window
+            ).only('id', 'recipient_id', 'event_count').order_by('created_at')
+        }
+        for notification in open_digests.values():
+            notification.event_count += count
+            notification.title = title
+            notification.message = render(notification.event_count)
+            notification.link_url = link_url
+            notification.created_at = now
+        Notification.objects.bulk_update(
+            open_digests.values(), ['event_count', 'title', 'message', 'link_url', 'created_at']
+        )
+        Notification.objects.bulk_create([
+            Notification(
+                recipient_id=recipient_id,
+                type=notification_type,
+                title=title,
+                message=render(count),
+                link_url=link_url,
+                digest_key=digest_key,
+                event_count=count
+            )
+            for recipient_id in recipient_ids if recipient_id not in open_digests
+        ])
+
+        user, ip = NotificationService._actor(user)
+        AuditLog.objects.create(
+            user=user,
+            action='BULK_NOTIFY',
+            model_name='Notification',
+            object_id=notification_type,
+            object_repr=f"{title} ({len(recipient_ids)} recipients)"[:255],
+            changes={
+                'type': notification_type, 'title': title, 'digest_key': digest_key, 'events': count,
+                'recipients': len(recipient_ids), 'merged': len(open_digests), 'link_url': link_url
+            },
+            ip_address=ip
+        )
+        return len(recipient_ids)
+
+    @staticmethod
+    def registrar_ids(include_head=True):
+        """
+        Returns the primary keys of the active registrar staff, cached so that
+        per-grade notifications do not look them up every time. The cache is cleared
+        by the User save/delete signals.
+
+        Args:
+            include_head (bool): Include HEAD_REGISTRAR users as well as REGISTRAR.
+
+        Returns:
+            list[int]: User primary keys.
+        """
+        registrars = cache.get(REGISTRAR_CACHE_KEY)
+        if registrars is None:
+            registrars = list(
+                User.objects.filter(role__in=REGISTRAR_ROLES, is_active=True).order_by('id').values_list('id', 'role')
+            )
+            cache.set(REGISTRAR_CACHE_KEY, registrars, REGISTRAR_CACHE_TIMEOUT)
+        return [user_id for user_id, role in registrars if include_head or role == 'REGISTRAR']
+
+    @staticmethod
+    def invalidate_registrars():
+        """Drops the cached registrar list (see core.cache)."""
+        drop_now_and_on_commit(REGISTRAR_CACHE_KEY)
+
+    @staticmethod
+    def _actor(user):
+        """Returns the (user, ip) recorded on audit entries written by this service."""
+        user = user or get_current_user()
+        if user and hasattr(user, 'is_authenticated') and not user.is_authenticated:
+            user = None
+        return user, get_current_ip()
+
     @staticmethod
     def notify_session_redirection(student, preferred_session, assigned_session):
         """
@@ -57,14 +261,39 @@ class NotificationService:
             recipient=student.user,
             notification_type=Notification.NotificationType.SCHEDULE,
             title="Session Assignment Changed",
-            message=(
-                f"Your preferred {preferred_session} session was fully booked. "
-                f"You have been automatically assigned to an {assigned_session} section instead. "
-                f"Please check your updated schedule."
-            ),
+            message=NotificationService._session_redirection_message(preferred_session, assigned_session),
             link_url="/student/schedule"
         )
 
+    @staticmethod
+    def notify_session_redirections(students, preferred_session, assigned_session, defer=False):
+        """
+        Bulk form of notify_session_redirection() for students placed together, e.g. by
+        PickingService.auto_assign_remaining(). Written with notify_many().
+
+        Args:
+            students (Iterable[Student]): The redirected students (only `user_id` is read).
+            preferred_session (str): Session they were placed for by default ('AM' or 'PM').
+            assigned_session (str): Session they were actually assigned to.
+            defer (bool): Send once the current transaction commits.
+        """
+        return NotificationService.notify_many(
+            recipients=[student.user_id for student in students],
+            notification_type=Notification.NotificationType.SCHEDULE,
+            title="Session Assignment Changed",
+            message=NotificationService._session_redirection_message(preferred_session, assigned_session),
+            link_url="/student/schedule",
+            defer=defer
+        )
+
+    @staticmethod
+    def _session_redirection_message(preferred_session, assigned_session):
+        return (
+            f"Your preferred {preferred_session} session was fully booked. "
+            f"You have been automatically assigned to an {assigned_session} section instead. "
+            f"Please check your updated schedule."
+        )
+
     @staticmethod
     def mark_as_read(notification_id, user):
         """
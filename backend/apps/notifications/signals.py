@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.accounts.models import User
+from apps.notifications.services.notification_service import NotificationService
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_registrars_on_user_change(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login; anything else may change who is a registrar
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    NotificationService.invalidate_registrars()
@@ -0,0 +1,187 @@
+"""
+Richwell Portal — Batch COR Generation
+
+Certificates of Registration for a whole term, optionally narrowed to a program,
+a section (home-section assignments) or a year level, as released by the registrar
+at term start.
+
+All data is preloaded with three queries (enrollments with student details, approved
+grades with subjects, term schedules with rooms) into plain document dicts. The PDFs
+are then rendered by apps.reports.services.cor_pdf, either merged into one file
+or one file per student in a process pool, with the results streamed into a ZIP.
+
+Usage:
+    documents = CORBatchService.documents(term, program_id=..., section_id=..., year_level=...)
+    merged = CORBatchService.merged_pdf(documents)
+    response = StreamingHttpResponse(CORBatchService.stream_zip(documents), content_type='application/zip')
+"""
+
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from apps.grades.models import Grade
+from apps.scheduling.models import Schedule
+from apps.students.models import StudentEnrollment
+from apps.reports.services.cor_pdf import render_cor, render_cors
+
+
+# Students per batch; one merged PDF of this many pages is still built in memory
+BATCH_LIMIT = 2000
+# Upper bound on render worker processes
+MAX_WORKERS = 4
+# Below this many documents the pool costs more than it saves
+POOL_THRESHOLD = 8
+
+
+class _ZipSink:
+    """Write-only buffer a ZipFile writes into while its output is streamed out."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data, self.chunks = b''.join(self.chunks), []
+        return data
+
+
+class CORBatchService:
+    """
+    Loads and renders Certificates of Registration in bulk.
+    """
+
+    @staticmethod
+    def schedule_text(schedule):
+        if not schedule or not schedule.start_time:
+            return "TBA"
+        return f"{''.join(schedule.days)} {schedule.start_time.strftime('%I:%M%p')}"
+
+    @classmethod
+    def documents(cls, term, program_id=None, section_id=None, year_level=None, enrollments=None):
+        """
+        Builds the COR documents of a term with three queries.
+
+        Args:
+            term (Term|int): The term or its primary key.
+            program_id, section_id, year_level: Optional filters on the enrolled students.
+            enrollments (QuerySet|None): Use these StudentEnrollments of the term instead
+                                         of the filters (the single-student COR does).
+
+        Returns:
+            list[dict]: One document per student with approved subjects, ordered by IDN.
+                        Students without approved subjects are left out.
+
+        Raises:
+            ValueError: More than BATCH_LIMIT students match.
+        """
+        term_id = getattr(term, 'id', term)
+        if enrollments is None:
+            enrollments = StudentEnrollment.objects.filter(term_id=term_id)
+            if program_id:
+                enrollments = enrollments.filter(student__program_id=program_id)
+            if year_level:
+                enrollments = enrollments.filter(year_level=year_level)
+            if section_id:
+                enrollments = enrollments.filter(
+                    student__section_assignments__section_id=section_id,
+                    student__section_assignments__term_id=term_id
+                ).distinct()
+
+        enrollments = list(
+            enrollments.select_related('student__user', 'student__program', 'term').order_by('student__idn')[:BATCH_LIMIT + 1]
+        )
+        if len(enrollments) > BATCH_LIMIT:
+            raise ValueError(f"More than {BATCH_LIMIT} students match. Narrow the batch by program, section or year level.")
+        if not enrollments:
+            return []
+
+        grades_by_student = {}
+        grades = Grade.objects.filter(
+            term_id=term_id,
+            student_id__in=[e.student_id for e in enrollments],
+            advising_status='APPROVED'
+        ).select_related('subject')
+        for grade in grades:
+            grades_by_student.setdefault(grade.student_id, []).append(grade)
+
+        # The student's own section's slot when there is one, else the subject's first slot of the term
+        by_section, by_subject = {}, {}
+        schedules = Schedule.objects.filter(
+            term_id=term_id,
+            subject_id__in={grade.subject_id for student_grades in grades_by_student.values() for grade in student_grades}
+        ).select_related('room').order_by('id')
+        for schedule in schedules:
+            by_section.setdefault((schedule.subject_id, schedule.section_id), schedule)
+            by_subject.setdefault(schedule.subject_id, schedule)
+
+        documents = []
+        for enrollment in enrollments:
+            student_grades = grades_by_student.get(enrollment.student_id)
+            if not student_grades:
+                continue
+            student = enrollment.student
+            rows = []
+            for g in student_grades:
+                sch = by_section.get((g.subject_id, g.section_id)) or by_subject.get(g.subject_id)
+                rows.append((
+                    g.subject.code, g.subject.description, g.subject.total_units,
+                    cls.schedule_text(sch), sch.room.name if sch and sch.room else "TBA"
+                ))
+            documents.append({
+                'student_id': student.id,
+                'idn': student.idn,
+                'name': student.user.get_full_name(),
+                'program': student.program.code,
+                'term': enrollment.term.code,
+                'rows': rows,
+            })
+        return documents
+
+    @staticmethod
+    def merged_pdf(documents):
+        """Renders every document into one PDF (a page break between students)."""
+        return render_cors(documents)
+
+    @staticmethod
+    def render_each(documents, workers=None):
+        """
+        Yields (document, pdf_bytes) in document order, rendering in a process pool
+        when the batch is large enough to benefit.
+
+        Args:
+            workers (int|None): Worker processes; defaults to min(CPU count, MAX_WORKERS).
+                                1 renders in the calling process.
+        """
+        workers = workers or min(os.cpu_count() or 1, MAX_WORKERS)
+        if workers <= 1 or len(documents) < POOL_THRESHOLD:
+            for document in documents:
+                yield document, render_cor(document)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            chunksize = max(1, len(documents) // (workers * 4))
+            yield from zip(documents, pool.map(render_cor, documents, chunksize=chunksize))
+        finally:
+            # Also reached when a streamed download is abandoned
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def stream_zip(cls, documents, workers=None):
+        """
+        Yields a ZIP archive of one COR_<idn>.pdf per document, chunk by chunk,
+        as the PDFs are rendered.
+        """
+        sink = _ZipSink()
+        with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for document, pdf in cls.render_each(documents, workers):
+                archive.writestr(f"COR_{document['idn']}.pdf", pdf)
+                yield sink.drain()
+        yield sink.drain()
@@ -0,0 +1,62 @@
+"""
+Richwell Portal — COR PDF Rendering
+
+Renders Certificates of Registration from plain document dicts (see
+CORBatchService.documents). This module imports nothing from Django so that
+process-pool workers can import it without setting Django up, whatever the
+multiprocessing start method.
+
+A document is:
+    {'idn', 'name', 'program', 'term', 'rows': [(code, description, units, schedule, room), ...]}
+
+Usage:
+    pdf_bytes = render_cor(document)
+    merged_bytes = render_cors(documents)   # one PDF, a page break between students
+"""
+
+import io
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+
+
+def cor_story(document, styles):
+    """Returns the flowables of one COR."""
+    elements = [Paragraph("<b>RICHWELL COLLEGES, INC.</b>", ParagraphStyle('Title', alignment=1, fontSize=14, spaceAfter=20))]
+
+    # Student Info
+    data = [[f"ID: {document['idn']}", f"NAME: {document['name'].upper()}"], [f"PROG: {document['program']}", f"TERM: {document['term']}"]]
+    elements.append(Table(data, colWidths=[2.5*inch, 4.5*inch]))
+    elements.append(Spacer(1, 0.2*inch))
+
+    # Subjects
+    rows = [["CODE", "DESCRIPTION", "UNITS", "SCHEDULE", "ROOM"]]
+    for code, description, units, schedule, room in document['rows']:
+        rows.append([code, Paragraph(description, styles['Normal']), str(units), schedule, room])
+
+    t = Table(rows, colWidths=[1*inch, 2.5*inch, 0.6*inch, 2*inch, 1*inch])
+    t.setStyle(TableStyle([('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0F172A')), ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke), ('GRID', (0,0), (-1,-1), 0.5, colors.grey)]))
+    elements.append(t)
+    return elements
+
+
+def render_cors(documents):
+    """Renders one or more CORs into a single PDF and returns its bytes."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch)
+    styles = getSampleStyleSheet()
+    elements = []
+    for index, document in enumerate(documents):
+        if index:
+            elements.append(PageBreak())
+        elements.extend(cor_story(document, styles))
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def render_cor(document):
+    """Renders one COR and returns the PDF bytes. Used as the process-pool task."""
+    return render_cors([document])
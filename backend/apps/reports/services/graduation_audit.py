@@ -0,0 +1,183 @@
+"""
+Richwell Portal — Cohort Graduation Audit
+
+Graduation eligibility for a whole cohort (the students of a program, the students
+enrolled in a term, or both) in one pass. Three queries load everything: the cohort's
+students, the subjects of every curriculum they follow and their PASSED grades
+(regular, credited and historical alike). Eligibility is then a set difference per
+student: missing = curriculum subject IDs − passed subject IDs. Unit totals follow
+ReportService.graduation_check: earned sums every PASSED grade, required sums the
+curriculum.
+
+Audits are cached per cohort under a version token that Grade, Subject, Student and
+StudentEnrollment changes replace (apps.reports.signals), plus the bulk grade writers
+that can pass grades without signals.
+
+Usage:
+    audit = GraduationAudit.for_cohort(program_id=program.id)             # cached
+    audit['students'][0]['is_eligible'], audit['summary']['eligible']
+    workbook_file = GraduationAudit.export_excel(audit)
+    csv_chunks = GraduationAudit.stream_csv(audit)
+"""
+
+from django.core.cache import cache
+from apps.academics.models import Subject
+from apps.grades.models import Grade
+from apps.reports.services import tabular_export
+from apps.students.models import Student
+from core.cache import current_token, rotate_token
+
+
+CACHE_KEY = 'graduation_audit:{version}:{program_id}:{term_id}'
+VERSION_KEY = 'graduation_audit_version'
+CACHE_TIMEOUT = 60 * 60 * 6
+
+# Students considered graduation candidates; applicants, rejected and graduated students are left out
+COHORT_STATUSES = ('ADMITTED', 'ENROLLED', 'INACTIVE')
+
+EXPORT_HEADERS = [
+    "ID Number", "Name", "Program", "Status", "Eligible",
+    "Units Earned", "Units Required", "Missing Count", "Missing Subjects"
+]
+
+
+class GraduationAudit:
+    """
+    Set-based graduation eligibility for cohorts of students.
+    """
+
+    @staticmethod
+    def audit(students):
+        """
+        Audits the given students with three queries.
+
+        Args:
+            students (QuerySet[Student]): The cohort; any filtered Student queryset.
+
+        Returns:
+            list[dict]: Per student, ordered by IDN: student_id, idn, name, program,
+                        status, is_eligible, total_units_earned, total_units_required
+                        and missing_subjects ([{code, name, year_level, semester}]).
+        """
+        rows = list(students.order_by('idn').values(
+            'id', 'idn', 'user__first_name', 'user__last_name', 'program__code', 'status', 'curriculum_id'
+        ))
+        if not rows:
+            return []
+
+        subjects_by_curriculum = {}
+        subjects = Subject.objects.filter(
+            curriculum_id__in={row['curriculum_id'] for row in rows}
+        ).order_by('year_level', 'semester', 'id').values(
+            'id', 'curriculum_id', 'code', 'description', 'year_level', 'semester', 'total_units'
+        )
+        for subject in subjects:
+            subjects_by_curriculum.setdefault(subject['curriculum_id'], []).append(subject)
+        required_ids = {cid: {s['id'] for s in subs} for cid, subs in subjects_by_curriculum.items()}
+        required_units = {cid: sum(s['total_units'] for s in subs) for cid, subs in subjects_by_curriculum.items()}
+
+        passed_ids, earned_units = {}, {}
+        passed = Grade.objects.filter(
+            student__in=students, grade_status=Grade.STATUS_PASSED
+        ).values_list('student_id', 'subject_id', 'subject__total_units')
+        for student_id, subject_id, units in passed:
+            passed_ids.setdefault(student_id, set()).add(subject_id)
+            earned_units[student_id] = earned_units.get(student_id, 0) + units
+
+        results = []
+        for row in rows:
+            curriculum_id = row['curriculum_id']
+            missing = required_ids.get(curriculum_id, set()) - passed_ids.get(row['id'], set())
+            results.append({
+                "student_id": row['id'],
+                "idn": row['idn'],
+                "name": f"{row['user__first_name']} {row['user__last_name']}".strip(),
+                "program": row['program__code'],
+                "status": row['status'],
+                "is_eligible": not missing,
+                "total_units_earned": earned_units.get(row['id'], 0),
+                "total_units_required": required_units.get(curriculum_id, 0),
+                "missing_subjects": [
+                    {
+                        "code": s['code'],
+                        "name": s['description'],
+                        "year_level": s['year_level'],
+                        "semester": s['semester'],
+                    }
+                    for s in subjects_by_curriculum.get(curriculum_id, []) if s['id'] in missing
+                ],
+            })
+        return results
+
+    @staticmethod
+    def cohort(program_id=None, term_id=None):
+        """
+        Returns the candidate students of a program, of a term's enrollments, or both.
+
+        Raises:
+            ValueError: Neither program_id nor term_id is given.
+        """
+        if not program_id and not term_id:
+            raise ValueError("A program_id or term_id is required to select a cohort.")
+        students = Student.objects.filter(status__in=COHORT_STATUSES)
+        if program_id:
+            students = students.filter(program_id=program_id)
+        if term_id:
+            students = students.filter(enrollments__term_id=term_id)
+        return students
+
+    @staticmethod
+    def _version():
+        return current_token(VERSION_KEY)
+
+    @classmethod
+    def for_cohort(cls, program_id=None, term_id=None):
+        """
+        Returns the cached audit of a cohort, running it on a miss.
+
+        Returns:
+            dict: {cohort: {program_id, term_id}, summary: {total, eligible, ineligible},
+                   students: [see `audit`]}
+        """
+        program_id = int(program_id) if program_id else None
+        term_id = int(term_id) if term_id else None
+        key = CACHE_KEY.format(version=cls._version(), program_id=program_id, term_id=term_id)
+        result = cache.get(key)
+        if result is None:
+            students = cls.audit(cls.cohort(program_id, term_id))
+            eligible = sum(1 for student in students if student['is_eligible'])
+            result = {
+                "cohort": {"program_id": program_id, "term_id": term_id},
+                "summary": {"total": len(students), "eligible": eligible, "ineligible": len(students) - eligible},
+                "students": students,
+            }
+            cache.set(key, result, CACHE_TIMEOUT)
+        return result
+
+    @staticmethod
+    def invalidate():
+        """Retires every cached cohort audit (see core.cache)."""
+        rotate_token(VERSION_KEY)
+
+    # ── Export ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def export_rows(audit):
+        for student in audit['students']:
+            yield [
+                student['idn'], student['name'], student['program'], student['status'],
+                "Yes" if student['is_eligible'] else "No",
+                student['total_units_earned'], student['total_units_required'],
+                len(student['missing_subjects']),
+                ", ".join(subject['code'] for subject in student['missing_subjects']),
+            ]
+
+    @classmethod
+    def export_excel(cls, audit):
+        """Writes an audit as a write-only workbook; returns a temporary file at position 0."""
+        return tabular_export.write_xlsx("Graduation Audit", EXPORT_HEADERS, cls.export_rows(audit))
+
+    @classmethod
+    def stream_csv(cls, audit, chunk_size=tabular_export.CSV_CHUNK_SIZE):
+        """Yields an audit as CSV text in chunks of rows, for a StreamingHttpResponse."""
+        return tabular_export.stream_csv(EXPORT_HEADERS, cls.export_rows(audit), chunk_size)
@@ -6,127 +6,89 @@ Handles complex GPA calculations, curriculum audits, and dashboard statistics.
 """
 
 import io
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.units import inch
-from django.db.models import Sum, Count
+from django.db.models import Sum
 from apps.students.models import Student, StudentEnrollment
-from apps.grades.models import Grade
-from apps.scheduling.models import Schedule
-from apps.academics.models import Subject, Program
+from apps.academics.models import Program
 from apps.facilities.models import Room
 from apps.faculty.models import Professor
 from apps.finance.models import Payment
 from apps.terms.models import Term
 from apps.auditing.models import AuditLog
+from apps.reports.services.cor_batch import CORBatchService
+from apps.reports.services.cor_pdf import render_cor
+from apps.reports.services.graduation_audit import GraduationAudit
+from apps.reports.services.tabular_export import write_xlsx, stream_csv
+from apps.reports.services.transcript import TranscriptProjection
 from django.utils import timezone
 
+
+MASTERLIST_HEADERS = ["ID Number", "Last Name", "First Name", "Middle Name", "Program", "Year", "Gender", "Status"]
+# Rows fetched per database round trip (and per CSV chunk) in masterlist exports
+MASTERLIST_CHUNK_SIZE = 2000
+
+
 class ReportService:
     """
     Service for all report-related business logic and document generation.
     """
 
     @staticmethod
-    def generate_masterlist_excel(term_id, program_id=None, year_level=None):
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Masterlist"
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="0F172A", end_color="0F172A", fill_type="solid")
-        border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-
-        headers = ["ID Number", "Last Name", "First Name", "Middle Name", "Program", "Year", "Gender", "Status"]
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.font, cell.fill, cell.alignment, cell.border = header_font, header_fill, Alignment(horizontal="center"), border
-
+    def masterlist_rows(term_id, program_id=None, year_level=None):
+        """
+        Yields the masterlist rows of a term (see MASTERLIST_HEADERS) from one joined
+        query read in chunks, so memory stays flat however many students there are.
+        """
         enrollments = StudentEnrollment.objects.filter(term_id=term_id)
         if program_id: enrollments = enrollments.filter(student__program_id=program_id)
         if year_level: enrollments = enrollments.filter(year_level=year_level)
 
-        for row_num, enrollment in enumerate(enrollments, 2):
-            s = enrollment.student
-            vals = [s.idn, s.user.last_name, s.user.first_name, s.middle_name or "", s.program.code, f"Year {enrollment.year_level}", s.get_gender_display(), s.get_status_display()]
-            for i, v in enumerate(vals, 1):
-                cell = ws.cell(row=row_num, column=i, value=v)
-                cell.border = border
+        genders, statuses = dict(Student.GENDER_CHOICES), dict(Student.STATUS_CHOICES)
+        rows = enrollments.values_list(
+            'student__idn', 'student__user__last_name', 'student__user__first_name', 'student__middle_name',
+            'student__program__code', 'year_level', 'student__gender', 'student__status'
+        ).iterator(chunk_size=MASTERLIST_CHUNK_SIZE)
+        for idn, last_name, first_name, middle_name, program, year, gender, student_status in rows:
+            yield [idn, last_name, first_name, middle_name or "", program, f"Year {year}",
+                   genders.get(gender, gender), statuses.get(student_status, student_status)]
+
+    @staticmethod
+    def generate_masterlist_excel(term_id, program_id=None, year_level=None):
+        """
+        Writes the masterlist as a write-only workbook (see tabular_export.write_xlsx).
+
+        Returns:
+            file: The .xlsx contents in a temporary file, positioned at the start.
+        """
+        return write_xlsx("Masterlist", MASTERLIST_HEADERS, ReportService.masterlist_rows(term_id, program_id, year_level))
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output
+    @staticmethod
+    def stream_masterlist_csv(term_id, program_id=None, year_level=None):
+        """
+        Yields the masterlist as CSV text, one chunk of rows at a time, for a
+        StreamingHttpResponse.
+        """
+        return stream_csv(
+            MASTERLIST_HEADERS, ReportService.masterlist_rows(term_id, program_id, year_level), MASTERLIST_CHUNK_SIZE
+        )
 
     @staticmethod
     def generate_cor_pdf(student_id, term_id):
-        student, enrollment = Student.objects.get(id=student_id), StudentEnrollment.objects.get(student_id=student_id, term_id=term_id)
-        grades = Grade.objects.filter(student_id=student_id, term_id=term_id, advising_status='APPROVED')
-        if not grades.exists():
+        enrollment = StudentEnrollment.objects.get(student_id=student_id, term_id=term_id)
+        documents = CORBatchService.documents(term_id, enrollments=StudentEnrollment.objects.filter(pk=enrollment.pk))
+        if not documents:
             raise ValueError("No approved subjects found for this student in the selected term. Ensure advising is complete and approved.")
-        
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch)
-        elements, styles = [], getSampleStyleSheet()
-        elements.append(Paragraph("<b>RICHWELL COLLEGES, INC.</b>", ParagraphStyle('Title', alignment=1, fontSize=14, spaceAfter=20)))
-        
-        # Student Info
-        data = [[f"ID: {student.idn}", f"NAME: {student.user.get_full_name().upper()}"], [f"PROG: {student.program.code}", f"TERM: {enrollment.term.code}"]]
-        elements.append(Table(data, colWidths=[2.5*inch, 4.5*inch]))
-        elements.append(Spacer(1, 0.2*inch))
-
-        # Subjects
-        rows = [["CODE", "DESCRIPTION", "UNITS", "SCHEDULE", "ROOM"]]
-        for g in grades:
-            sch = Schedule.objects.filter(subject=g.subject, term_id=term_id).first()
-            rows.append([g.subject.code, Paragraph(g.subject.description, styles['Normal']), str(g.subject.total_units), f"{''.join(sch.days)} {sch.start_time.strftime('%I:%M%p')}" if sch else "TBA", sch.room.name if sch and sch.room else "TBA"])
-        
-        t = Table(rows, colWidths=[1*inch, 2.5*inch, 0.6*inch, 2*inch, 1*inch])
-        t.setStyle(TableStyle([('BACKGROUND', (0,0), (-1,0), colors.HexColor('#0F172A')), ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke), ('GRID', (0,0), (-1,-1), 0.5, colors.grey)]))
-        elements.append(t)
-        
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer
+        return io.BytesIO(render_cor(documents[0]))
 
     @staticmethod
     def get_academic_summary(student_id):
-        student = Student.objects.select_related('user', 'program', 'curriculum').get(id=student_id)
+        """
+        Returns a student's header details and transcript (GPA, units earned and the
+        per-semester curriculum breakdown). The transcript part comes from
+        TranscriptProjection, cached per student until their grades or curriculum change.
+        """
+        student = Student.objects.select_related('user', 'program').get(id=student_id)
         enrollment = student.enrollments.order_by('-enrollment_date').first()
-        grades = Grade.objects.filter(student=student).select_related('subject', 'term')
-        
-        passed = grades.filter(grade_status='PASSED')
-        units_earned = passed.aggregate(total=Sum('subject__total_units'))['total'] or 0
-        numeric = grades.filter(final_grade__isnull=False)
-        gpa = round(sum(g.final_grade * g.subject.total_units for g in numeric) / sum(g.subject.total_units for g in numeric), 2) if numeric.exists() else 0
-        
-        # Semester grouping
-        semesters = []
-        cur_subs = Subject.objects.filter(curriculum=student.curriculum).order_by('year_level', 'semester')
-        grade_map = {g.subject_id: g for g in grades}
-        
-        for year in range(1, 6):
-            for sem in ['1', '2', 'S']:
-                subs = cur_subs.filter(year_level=year, semester=sem)
-                if not subs.exists(): continue
-                
-                sem_grades = []
-                for s in subs:
-                    g = grade_map.get(s.id)
-                    sem_grades.append({
-                        "code": s.code, "subject": s.description, "units": s.total_units,
-                        "grade": str(g.final_grade) if g and g.final_grade else (g.get_grade_status_display() if g else "--"),
-                        "status": g.get_grade_status_display() if g else "Not Taken",
-                        "status_code": g.grade_status if g else "NOT_TAKEN"
-                    })
-                sem_title = f"{'1st' if sem == '1' else '2nd' if sem == '2' else 'Summer'} Semester"
-                semesters.append({
-                    "title": sem_title, 
-                    "year_level": f"Year {year}", 
-                    "grades": sem_grades
-                })
+        transcript = TranscriptProjection.for_student(student)
 
         return {
             "student": {
@@ -135,10 +97,10 @@ class ReportService:
                 "program": student.program.code, 
                 "year_level": enrollment.year_level if enrollment else 1,
                 "academic_standing": student.get_status_display(),
-                "units_earned": units_earned
+                "units_earned": transcript["units_earned"]
             },
-            "stats": {"gpa": gpa, "passed": passed.count()},
-            "semesters": semesters,
+            "stats": {"gpa": transcript["gpa"], "passed": transcript["passed"]},
+            "semesters": transcript["semesters"],
             "curriculum_progress": [] # Placeholder or real progress if needed
         }
 
@@ -186,7 +148,8 @@ class ReportService:
 
         Compares all subjects in the student's assigned CurriculumVersion against their
         passed Grade records (including credited and historical entries). Returns a
-        structured result the graduation audit UI can render directly.
+        structured result the graduation audit UI can render directly. Runs the cohort
+        engine (GraduationAudit.audit) on a cohort of one.
 
         Args:
             student_id (int): Primary key of the Student record to audit.
@@ -200,35 +163,8 @@ class ReportService:
                                          year_level (int), and semester (str).
             }
         """
-        student = Student.objects.get(id=student_id)
-        curriculum_subjects = Subject.objects.filter(curriculum=student.curriculum)
-
-        passed_ids = set(
-            Grade.objects.filter(student=student, grade_status='PASSED')
-            .values_list('subject_id', flat=True)
-        )
-        missing = curriculum_subjects.exclude(id__in=passed_ids)
-
-        total_units_earned = (
-            Grade.objects.filter(student=student, grade_status='PASSED')
-            .select_related('subject')
-            .aggregate(total=Sum('subject__total_units'))['total'] or 0
-        )
-        total_units_required = (
-            curriculum_subjects.aggregate(total=Sum('total_units'))['total'] or 0
-        )
-
-        return {
-            "is_eligible": not missing.exists(),
-            "total_units_earned": total_units_earned,
-            "total_units_required": total_units_required,
-            "missing_subjects": [
-                {
-                    "code": m.code,
-                    "name": m.description,
-                    "year_level": m.year_level,
-                    "semester": m.semester,
-                }
-                for m in missing.order_by('year_level', 'semester')
-            ],
-        }
+        results = GraduationAudit.audit(Student.objects.filter(id=student_id))
+        if not results:
+            raise Student.DoesNotExist("Student matching query does not exist.")
+        result = results[0]
+        return {key: result[key] for key in ('is_eligible', 'total_units_earned', 'total_units_required', 'missing_subjects')}
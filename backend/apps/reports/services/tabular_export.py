@@ -0,0 +1,69 @@
+"""
+Richwell Portal — Tabular Exports
+
+Row-streaming Excel and CSV writers shared by the list exports (masterlist,
+graduation audit). Rows may come from any iterable, including a chunked query,
+and are never all held in memory by the writers.
+
+Usage:
+    workbook_file = write_xlsx("Masterlist", headers, rows)
+    response = StreamingHttpResponse(stream_csv(headers, rows), content_type='text/csv')
+"""
+
+import csv
+import io
+import tempfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill
+
+
+# Workbooks larger than this are spooled to a temporary file on disk
+SPOOL_SIZE = 8 * 1024 * 1024
+# Rows per yielded CSV chunk
+CSV_CHUNK_SIZE = 2000
+
+
+def write_xlsx(sheet_title, headers, rows):
+    """
+    Writes one sheet with openpyxl's write-only mode, which streams rows to disk
+    instead of keeping a cell object per value. Only the header row is styled.
+
+    Returns:
+        file: The .xlsx contents in a temporary file, positioned at the start.
+              Small exports stay in memory; large ones spill to disk.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="0F172A", end_color="0F172A", fill_type="solid")
+
+    header = []
+    for title in headers:
+        cell = WriteOnlyCell(ws, value=title)
+        cell.font, cell.fill, cell.alignment = header_font, header_fill, Alignment(horizontal="center")
+        header.append(cell)
+    ws.append(header)
+
+    for row in rows:
+        ws.append(row)
+
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    wb.save(output)
+    output.seek(0)
+    return output
+
+
+def stream_csv(headers, rows, chunk_size=CSV_CHUNK_SIZE):
+    """Yields the rows as CSV text, one chunk of rows at a time, for a StreamingHttpResponse."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
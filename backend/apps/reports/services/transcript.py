@@ -0,0 +1,138 @@
+"""
+Richwell Portal — Transcript Projection
+
+The grade part of a student's academic summary: GPA, units earned, passed count and
+the per-semester curriculum breakdown. A projection is built from one grade query and
+one curriculum query and cached per student, so student grade pages and registrar
+lookups reuse it until something it depends on changes.
+
+A student's entry is dropped by the Grade save/delete signals and by the bulk grade
+writers that bypass them (advising approval, the INC sweep, spreadsheet imports).
+Every entry also records the curriculum it was built for and that curriculum's
+version token, which the Subject signals replace, so curriculum edits and curriculum
+reassignments are noticed as well.
+
+Usage:
+    transcript = TranscriptProjection.for_student(student)
+    transcript['gpa'], transcript['units_earned'], transcript['semesters']
+    TranscriptProjection.invalidate(*student_ids)
+"""
+
+from django.core.cache import cache
+
+from apps.academics.models import Subject
+from apps.grades.models import Grade
+from core.cache import current_token, drop_now_and_on_commit, rotate_token
+
+
+CACHE_KEY = 'transcript:{student_id}'
+VERSION_KEY = 'transcript_curriculum_version:{curriculum_id}'
+CACHE_TIMEOUT = 60 * 60 * 24  # Safety net; entries are invalidated on change
+
+YEAR_LEVELS = range(1, 6)
+SEMESTERS = (('1', '1st Semester'), ('2', '2nd Semester'), ('S', 'Summer Semester'))
+STATUS_LABELS = dict(Grade.GRADE_STATUS_CHOICES)
+
+
+class TranscriptProjection:
+    """
+    Builds and caches the transcript part of the academic summary.
+    """
+
+    @staticmethod
+    def project(grades, curriculum_subjects):
+        """
+        Computes the transcript from plain rows.
+
+        Args:
+            grades (list[dict]): The student's grades in the default Grade ordering, with
+                                 subject_id, subject__total_units, final_grade and grade_status.
+            curriculum_subjects (list[dict]): Curriculum subjects ordered by year level and
+                                              semester, with id, code, description,
+                                              total_units, year_level and semester.
+
+        Returns:
+            dict: {gpa, units_earned, passed, semesters: [{title, year_level, grades}]}
+        """
+        passed = [g for g in grades if g['grade_status'] == Grade.STATUS_PASSED]
+        numeric = [g for g in grades if g['final_grade'] is not None]
+        numeric_units = sum(g['subject__total_units'] for g in numeric)
+        gpa = round(
+            sum(g['final_grade'] * g['subject__total_units'] for g in numeric) / numeric_units, 2
+        ) if numeric_units else 0
+
+        # The last grade of a subject (latest term) is the one shown
+        grade_map = {g['subject_id']: g for g in grades}
+        by_semester = {}
+        for subject in curriculum_subjects:
+            by_semester.setdefault((subject['year_level'], subject['semester']), []).append(subject)
+
+        semesters = []
+        for year in YEAR_LEVELS:
+            for sem, title in SEMESTERS:
+                subjects = by_semester.get((year, sem))
+                if not subjects:
+                    continue
+                sem_grades = []
+                for s in subjects:
+                    g = grade_map.get(s['id'])
+                    label = STATUS_LABELS.get(g['grade_status'], g['grade_status']) if g else None
+                    sem_grades.append({
+                        "code": s['code'], "subject": s['description'], "units": s['total_units'],
+                        "grade": str(g['final_grade']) if g and g['final_grade'] else (label if g else "--"),
+                        "status": label if g else "Not Taken",
+                        "status_code": g['grade_status'] if g else "NOT_TAKEN"
+                    })
+                semesters.append({"title": title, "year_level": f"Year {year}", "grades": sem_grades})
+
+        return {
+            "gpa": gpa,
+            "units_earned": sum(g['subject__total_units'] for g in passed),
+            "passed": len(passed),
+            "semesters": semesters,
+        }
+
+    @staticmethod
+    def _curriculum_version(curriculum_id):
+        return current_token(VERSION_KEY.format(curriculum_id=curriculum_id))
+
+    @classmethod
+    def build(cls, student):
+        """Computes a student's transcript with one grade query and one curriculum query."""
+        grades = list(Grade.objects.filter(student_id=student.id).values(
+            'subject_id', 'subject__total_units', 'final_grade', 'grade_status'
+        ))
+        curriculum_subjects = list(Subject.objects.filter(curriculum_id=student.curriculum_id).order_by(
+            'year_level', 'semester', 'id'
+        ).values('id', 'code', 'description', 'total_units', 'year_level', 'semester'))
+        return cls.project(grades, curriculum_subjects)
+
+    @classmethod
+    def for_student(cls, student):
+        """
+        Returns the cached transcript of a student, building it on a miss.
+
+        Args:
+            student (Student): Only `id` and `curriculum_id` are read.
+        """
+        key = CACHE_KEY.format(student_id=student.id)
+        version = cls._curriculum_version(student.curriculum_id)
+        entry = cache.get(key)
+        if entry is not None and entry[:2] == (student.curriculum_id, version):
+            return entry[2]
+
+        transcript = cls.build(student)
+        cache.set(key, (student.curriculum_id, version, transcript), CACHE_TIMEOUT)
+        return transcript
+
+    @staticmethod
+    def invalidate(*student_ids):
+        """Drops the cached transcripts of the given students (see core.cache)."""
+        drop_now_and_on_commit(*(CACHE_KEY.format(student_id=sid) for sid in student_ids if sid is not None))
+
+    @staticmethod
+    def invalidate_curriculum(curriculum_id):
+        """Retires the transcripts of every student on a curriculum."""
+        if curriculum_id is None:
+            return
+        rotate_token(VERSION_KEY.format(curriculum_id=curriculum_id))
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.academics.models import Subject
+from apps.grades.models import Grade
+from apps.reports.services.graduation_audit import GraduationAudit
+from apps.reports.services.transcript import TranscriptProjection
+from apps.students.models import Student, StudentEnrollment
+
+
+@receiver(post_save, sender=Grade)
+@receiver(post_delete, sender=Grade)
+def invalidate_transcript_on_grade_change(sender, instance, **kwargs):
+    TranscriptProjection.invalidate(instance.student_id)
+    GraduationAudit.invalidate()
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_transcripts_on_subject_change(sender, instance, **kwargs):
+    TranscriptProjection.invalidate_curriculum(instance.curriculum_id)
+    GraduationAudit.invalidate()
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=StudentEnrollment)
+@receiver(post_delete, sender=StudentEnrollment)
+def invalidate_graduation_audits_on_cohort_change(sender, instance, **kwargs):
+    GraduationAudit.invalidate()
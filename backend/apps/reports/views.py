@@ -6,12 +6,14 @@ dashboard statistics for different administrative roles. It coordinates
 generation tasks via the ReportService.
 """
 
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .services.report_service import ReportService
 from .services.admission_report_service import AdmissionReportService
+from .services.cor_batch import CORBatchService
+from .services.graduation_audit import GraduationAudit
 from apps.students.models import Student
 from apps.terms.models import Term
 from apps.auditing.models import AuditLog
@@ -29,7 +31,7 @@ class ReportViewSet(viewsets.ViewSet):
         """
         Applies role-based constraints for specific document types.
         """
-        if self.action == 'masterlist':
+        if self.action in ['masterlist', 'cor_batch', 'graduation_audit']:
             from core.permissions import IsRegistrar
             return [IsRegistrar()]
         if self.action in ['cor', 'academic_summary']:
@@ -43,17 +45,26 @@ class ReportViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def masterlist(self, request):
         """
-        Generates a master list of students for a specific term, program, and year level in Excel format.
+        Generates a master list of students for a specific term, program, and year level in
+        Excel format, or as streamed CSV with output=csv. Both are written row by row from a
+        chunked query, so large terms export with bounded memory.
         Records a RELEASE audit log entry to ensure document generation is traceable.
 
         @param request - Authenticated DRF request; must include term_id query param.
-        @returns {HttpResponse} - Excel file attachment, or 400 if term_id is missing.
+        @returns {FileResponse|StreamingHttpResponse} - Excel or CSV attachment, or 400 if term_id is missing,
+                 not a known term, or a filter is not an integer.
         """
         if not (tid := request.query_params.get('term_id')): return Response({"error": "term_id required"}, 400)
         program_id = request.query_params.get('program_id')
         year_level = request.query_params.get('year_level')
-
-        excel = self.service.generate_masterlist_excel(tid, program_id, year_level)
+        output = request.query_params.get('output', 'xlsx')
+        if output not in ('xlsx', 'csv'): return Response({"error": "output must be 'xlsx' or 'csv'"}, 400)
+        # Validated up front: a streamed CSV has already answered 200 by the time its query runs
+        try:
+            tid, program_id, year_level = (int(value) if value else None for value in (tid, program_id, year_level))
+        except ValueError:
+            return Response({"error": "term_id, program_id and year_level must be integers"}, 400)
+        if not Term.objects.filter(pk=tid).exists(): return Response({"error": "Term not found"}, 400)
 
         # AUDIT: Log document release — masterlist downloads are not model-saves,
         # so we must manually create an audit entry for compliance.
@@ -67,14 +78,21 @@ class ReportViewSet(viewsets.ViewSet):
                 'document': 'masterlist',
                 'term_id': str(tid),
                 'program_id': str(program_id),
-                'year_level': str(year_level)
+                'year_level': str(year_level),
+                'output': output
             },
             ip_address=get_current_ip()
         )
 
-        res = HttpResponse(excel, content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        res['Content-Disposition'] = 'attachment; filename="masterlist.xlsx"'
-        return res
+        if output == 'csv':
+            res = StreamingHttpResponse(self.service.stream_masterlist_csv(tid, program_id, year_level), content_type='text/csv')
+            res['Content-Disposition'] = 'attachment; filename="masterlist.csv"'
+            return res
+        excel = self.service.generate_masterlist_excel(tid, program_id, year_level)
+        return FileResponse(
+            excel, as_attachment=True, filename="masterlist.xlsx",
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
 
     @action(detail=False, methods=['get'])
     def cor(self, request):
@@ -116,6 +134,57 @@ class ReportViewSet(viewsets.ViewSet):
         except (ValueError, Student.DoesNotExist, Exception) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'], url_path='cor-batch')
+    def cor_batch(self, request):
+        """
+        Generates the CORs of a term in one download, optionally narrowed by program,
+        section or year level: a single merged PDF (output=pdf, default) or a streamed
+        ZIP with one PDF per student (output=zip). Records one summary RELEASE audit
+        entry for the whole batch.
+
+        @param request - Authenticated DRF request; must include term_id.
+        @returns {HttpResponse|StreamingHttpResponse} - PDF or ZIP attachment, or 400.
+        """
+        q = request.query_params
+        if not (tid := q.get('term_id')): return Response({"error": "term_id required"}, 400)
+        output = q.get('output', 'pdf')
+        if output not in ('pdf', 'zip'): return Response({"error": "output must be 'pdf' or 'zip'"}, 400)
+        filters = {key: q.get(key) for key in ('program_id', 'section_id', 'year_level')}
+
+        try:
+            documents = CORBatchService.documents(tid, **filters)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not documents:
+            return Response({"error": "No students with approved subjects match this batch."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # AUDIT: one RELEASE entry for the batch instead of one per student
+        AuditLog.objects.create(
+            user=request.user,
+            action='RELEASE',
+            model_name='COR',
+            object_id=str(tid),
+            object_repr=f"COR batch | Term: {tid} | {len(documents)} students",
+            changes={
+                'document': 'cor_batch',
+                'term_id': str(tid),
+                **{key: str(value) for key, value in filters.items()},
+                'output': output,
+                'count': len(documents),
+                'student_ids': [document['student_id'] for document in documents],
+                'generated_by_role': request.user.role
+            },
+            ip_address=get_current_ip()
+        )
+
+        if output == 'zip':
+            res = StreamingHttpResponse(CORBatchService.stream_zip(documents), content_type='application/zip')
+            res['Content-Disposition'] = f'attachment; filename="COR_batch_{tid}.zip"'
+            return res
+        res = HttpResponse(CORBatchService.merged_pdf(documents), content_type='application/pdf')
+        res['Content-Disposition'] = f'attachment; filename="COR_batch_{tid}.pdf"'
+        return res
+
     @action(detail=False, methods=['get'], url_path='academic-summary')
     def academic_summary(self, request):
         """
@@ -139,6 +208,57 @@ class ReportViewSet(viewsets.ViewSet):
         except (Student.DoesNotExist, Exception) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'], url_path='graduation-audit')
+    def graduation_audit(self, request):
+        """
+        Audits the graduation eligibility of a whole cohort — a program's students, a
+        term's enrolled students, or both — in one pass. Results are cached per cohort
+        until grades, subjects or students change. Returns JSON by default, or an Excel
+        (output=xlsx) or streamed CSV (output=csv) export; exports record a RELEASE
+        audit log entry.
+
+        @param request - Authenticated DRF request; must include program_id and/or term_id.
+        @returns {Response|FileResponse|StreamingHttpResponse} - Audit JSON or export, or 400.
+        """
+        q = request.query_params
+        program_id, term_id = q.get('program_id'), q.get('term_id')
+        if not program_id and not term_id: return Response({"error": "program_id or term_id required"}, 400)
+        output = q.get('output', 'json')
+        if output not in ('json', 'xlsx', 'csv'): return Response({"error": "output must be 'json', 'xlsx' or 'csv'"}, 400)
+        try:
+            audit = GraduationAudit.for_cohort(program_id, term_id)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if output == 'json':
+            return Response(audit)
+
+        # AUDIT: exported audits leave the system like any other released document
+        AuditLog.objects.create(
+            user=request.user,
+            action='RELEASE',
+            model_name='GraduationAudit',
+            object_id=str(program_id or term_id),
+            object_repr=f"Graduation audit | Program: {program_id} | Term: {term_id} | {audit['summary']['total']} students",
+            changes={
+                'document': 'graduation_audit',
+                'program_id': str(program_id),
+                'term_id': str(term_id),
+                'output': output,
+                'count': audit['summary']['total'],
+                'eligible': audit['summary']['eligible']
+            },
+            ip_address=get_current_ip()
+        )
+
+        if output == 'csv':
+            res = StreamingHttpResponse(GraduationAudit.stream_csv(audit), content_type='text/csv')
+            res['Content-Disposition'] = 'attachment; filename="graduation_audit.csv"'
+            return res
+        return FileResponse(
+            GraduationAudit.export_excel(audit), as_attachment=True, filename="graduation_audit.xlsx",
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """
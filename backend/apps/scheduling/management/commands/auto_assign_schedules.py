@@ -37,8 +37,16 @@ class Command(BaseCommand):
         for term in active_published_terms:
             self.stdout.write(self.style.WARNING(f"Processing manual-triggered assignment for Term: {term.code}"))
             try:
-                assigned_count = picking_service.auto_assign_remaining(term)
-                self.stdout.write(self.style.SUCCESS(f"Successfully assigned {assigned_count} students for {term.code}."))
+                report = picking_service.auto_assign_remaining(term)
+                self.stdout.write(self.style.SUCCESS(f"Successfully assigned {report['assigned']} students for {term.code}."))
+                for cluster in report['clusters']:
+                    line = f"  {cluster['program']} Y{cluster['year_level']}: {cluster['assigned']} assigned, {cluster['overflow']} overflow"
+                    if cluster['overflow']:
+                        self.stdout.write(self.style.WARNING(f"{line} ({', '.join(cluster['overflow_students'])})"))
+                    else:
+                        self.stdout.write(line)
+                if report['irregular_skipped']:
+                    self.stdout.write(f"  {report['irregular_skipped']} irregular students left for the individual picker.")
                 
                 # NOTE: We don't "close" the term here because new students might 
                 # still be advised/enrolled late and need auto-assignment in future runs.
@@ -0,0 +1,145 @@
+"""
+Richwell Portal — Faculty Load Rollup
+
+Keeps one `FacultyLoad` row per (term, professor) with the professor's weekly
+hours, scheduled hours per day, section count and overload warnings, so the
+Dean's load screen reads a single table instead of aggregating every
+professor's schedules on each request.
+
+Rows are recomputed for the professors a write touches: the Schedule pre_save
+and post_save signals in apps.scheduling.signals refresh the previous and the new
+professor on every save (pre_save costs one extra query per save to read the
+previous professor), `_save_slots` refreshes everyone the randomizer moved, since
+bulk_update skips signals, and the post_delete signal refreshes the professor of
+a deleted slot.
+A term without rows (or with active professors missing) is built on first read.
+
+Usage:
+    FacultyLoadService.refresh(term, [prof.id])
+    FacultyLoadService.rebuild(term)
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Q
+
+from apps.faculty.models import FacultyLoad, Professor
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.schedule_index import to_minutes
+from apps.scheduling.services.week_grid import DAYS
+
+
+# Weekly teaching hours expected per employment status
+LOAD_TARGETS = {'FULL_TIME': 24, 'PART_TIME': 12}
+# Scheduled hours in a single day above which a warning is raised
+DAILY_HOUR_LIMIT = 8
+
+
+def load_target(employment_status):
+    """Returns the weekly target hours for an employment status."""
+    return LOAD_TARGETS.get(employment_status, LOAD_TARGETS['PART_TIME'])
+
+
+class FacultyLoadService:
+    """
+    Recomputes FacultyLoad rows from the Schedule table.
+    """
+
+    @staticmethod
+    def _compute(term_id, professor_ids):
+        """
+        Aggregates the professors' schedules in one query.
+
+        Returns:
+            dict: professor_id -> {'total_hours', 'day_hours', 'section_count'}
+        """
+        loads = {
+            prof_id: {'total_hours': Decimal('0'), 'day_minutes': defaultdict(int), 'sections': set()}
+            for prof_id in professor_ids
+        }
+        rows = Schedule.objects.filter(term_id=term_id, professor_id__in=professor_ids).values_list(
+            'professor_id', 'section_id', 'subject__hrs_per_week', 'days', 'start_time', 'end_time'
+        )
+        for prof_id, section_id, hours, days, start, end in rows:
+            load = loads[prof_id]
+            load['total_hours'] += hours or 0
+            load['sections'].add(section_id)
+            if days and start and end:
+                for day in days:
+                    load['day_minutes'][day] += to_minutes(end) - to_minutes(start)
+
+        return {
+            prof_id: {
+                'total_hours': load['total_hours'],
+                'day_hours': {
+                    day: round(minutes / 60, 2)
+                    for day, minutes in sorted(
+                        load['day_minutes'].items(),
+                        key=lambda item: DAYS.index(item[0]) if item[0] in DAYS else len(DAYS)
+                    )
+                },
+                'section_count': len(load['sections']),
+            }
+            for prof_id, load in loads.items()
+        }
+
+    @staticmethod
+    def _warnings(employment_status, total_hours, day_hours):
+        target = load_target(employment_status)
+        warnings = []
+        if total_hours > target:
+            warnings.append({
+                'code': 'WEEKLY_OVERLOAD',
+                'message': f"{float(total_hours):g} weekly hours exceed the {target}-hour target.",
+            })
+        for day, hours in day_hours.items():
+            if hours > DAILY_HOUR_LIMIT:
+                warnings.append({
+                    'code': 'DAILY_OVERLOAD',
+                    'day': day,
+                    'message': f"{hours:g} hours on {day} exceed the {DAILY_HOUR_LIMIT}-hour daily limit.",
+                })
+        return warnings
+
+    @classmethod
+    def refresh(cls, term, professor_ids):
+        """
+        Recomputes the rollup rows of the given professors with one read and one upsert.
+
+        Args:
+            term (Term|int): The term or its primary key.
+            professor_ids (Iterable[int]): Professors to refresh; None entries are ignored.
+        """
+        term_id = getattr(term, 'id', term)
+        professor_ids = {prof_id for prof_id in professor_ids if prof_id}
+        if not professor_ids:
+            return
+
+        statuses = dict(Professor.objects.filter(id__in=professor_ids).values_list('id', 'employment_status'))
+        loads = cls._compute(term_id, statuses)
+        FacultyLoad.objects.bulk_create(
+            [
+                FacultyLoad(
+                    term_id=term_id, professor_id=prof_id,
+                    total_hours=load['total_hours'], day_hours=load['day_hours'],
+                    section_count=load['section_count'],
+                    warnings=cls._warnings(statuses[prof_id], load['total_hours'], load['day_hours']),
+                )
+                for prof_id, load in loads.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['term', 'professor'],
+            update_fields=['total_hours', 'day_hours', 'section_count', 'warnings', 'updated_at'],
+        )
+
+    @classmethod
+    def rebuild(cls, term):
+        """Recomputes the rows of every active professor and every professor scheduled in the term."""
+        term_id = getattr(term, 'id', term)
+        professor_ids = set(
+            Professor.objects.filter(
+                Q(is_active=True) | Q(schedules__term_id=term_id)
+            ).values_list('id', flat=True).distinct()
+        )
+        cls.refresh(term_id, professor_ids)
@@ -2,9 +2,13 @@ from django.db import transaction, models
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
 from apps.grades.models import Grade
 from apps.students.models import StudentEnrollment
 from apps.scheduling.models import Schedule
+from apps.scheduling.services.report_service import ReportService
+from apps.scheduling.services.week_grid import WeekGrid
 from apps.notifications.services.notification_service import NotificationService
 from core.exceptions import ConflictError
 
@@ -31,21 +35,9 @@ class PickingService:
         return enrollment
 
     @staticmethod
-    def _schedule_to_ranges(schedule):
-        if not schedule.start_time or not schedule.end_time:
-            return []
-        start = schedule.start_time.hour * 60 + schedule.start_time.minute
-        end = schedule.end_time.hour * 60 + schedule.end_time.minute
-        return [(day, start, end) for day in schedule.days]
-
-    @classmethod
-    def _has_conflict(cls, candidate_schedules, existing_ranges):
-        for schedule in candidate_schedules:
-            for day, start, end in cls._schedule_to_ranges(schedule):
-                for existing_day, existing_start, existing_end in existing_ranges:
-                    if day == existing_day and start < existing_end and existing_start < end:
-                        return True
-        return False
+    def _has_conflict(candidate_schedules, taken_grid):
+        """True if any candidate schedule overlaps the already-selected WeekGrid."""
+        return taken_grid.overlaps(WeekGrid.from_schedules(candidate_schedules))
 
 
     @transaction.atomic
@@ -68,34 +60,31 @@ class PickingService:
         if not enrollment.is_regular:
             raise ValidationError({'detail': 'Student is classified as Irregular. Please use the individual schedule picker.'})
 
-        # 2. Find available sections for the preferred session
-        sections = Section.objects.select_for_update().filter(
-            term=term, 
-            program=student.program, 
-            year_level=enrollment.year_level,
-            session=preferred_session
-        ).annotate(
-            current_students=models.Count('student_assignments')
-        ).filter(current_students__lt=models.F('max_students')).order_by('current_students', 'id')
-
-        target_section = sections.first()
+        # 2. Reserve a seat in the least-filled section of the preferred session.
+        # Each reservation is one conditional UPDATE on the section's counter, so no
+        # section is locked or recounted; a section filled by a concurrent pick is skipped.
+        def open_sections(session):
+            return Section.objects.filter(
+                term=term,
+                program=student.program,
+                year_level=enrollment.year_level,
+                session=session,
+                is_active=True,
+                student_count__lt=models.F('max_students')
+            ).order_by('student_count', 'id').values_list('id', flat=True)
+
+        target_id = SeatCounter.reserve_first(open_sections(preferred_session))
         redirected = False
 
         # 3. If preferred session is full, try the alternative
-        if not target_section:
+        if not target_id:
             alt_session = 'PM' if preferred_session == 'AM' else 'AM'
-            target_section = Section.objects.select_for_update().filter(
-                term=term, 
-                program=student.program, 
-                year_level=enrollment.year_level,
-                session=alt_session
-            ).annotate(
-                current_students=models.Count('student_assignments')
-            ).filter(current_students__lt=models.F('max_students')).order_by('current_students', 'id').first()
+            target_id = SeatCounter.reserve_first(open_sections(alt_session))
             redirected = True
 
-        if not target_section:
+        if not target_id:
             raise ConflictError("All available sections for your program and year level are currently full. Please contact the Registrar.")
+        target_section = Section.objects.get(id=target_id)
 
         # 4. Assign student to this section for ALL their subjects in this term
         Grade.objects.filter(
@@ -105,20 +94,7 @@ class PickingService:
         ).update(section=target_section)
         
         # 5. Set Home Section assignment (term field is stored directly for clean isolation)
-        existing = SectionStudent.objects.select_for_update().filter(
-            student=student,
-            term=term
-        ).first()
-        if existing:
-            existing.section = target_section
-            existing.save()
-        else:
-            SectionStudent.objects.create(
-                student=student,
-                section=target_section,
-                term=term,
-                is_home_section=True
-            )
+        self._save_home_section(student, term, target_section)
 
         # 6. NOTIF-02: Notify the student if their preferred session was not available
         if redirected:
@@ -153,7 +129,7 @@ class PickingService:
         ).select_related('subject')
         approved_grade_map = {grade.subject_id: grade for grade in approved_grades}
 
-        existing_ranges = []
+        taken_grid = WeekGrid()
         selected_sections = {}
 
         for item in selections:
@@ -163,11 +139,10 @@ class PickingService:
                 raise PermissionDenied("You can only pick sections for approved subjects in this term.")
             
             try:
-                section = Section.objects.select_for_update().get(id=section_id, term=term)
+                section = Section.objects.get(id=section_id, term=term)
             except Section.DoesNotExist as exc:
                 raise ValidationError({'detail': 'Selected section is invalid for this term.'}) from exc
-            current_students = section.student_assignments.select_for_update().count()
-            if current_students >= section.max_students:
+            if section.student_count >= section.max_students:
                 raise ConflictError(f"Section {section.name} is full.")
 
             matching_schedules = list(Schedule.objects.filter(
@@ -178,14 +153,10 @@ class PickingService:
             if not matching_schedules:
                 raise ValidationError({'detail': f"Section {section.name} does not offer the selected subject in this term."})
 
-            if self._has_conflict(matching_schedules, existing_ranges):
+            if self._has_conflict(matching_schedules, taken_grid):
                 raise ConflictError(f"Section {section.name} conflicts with another selected subject.")
 
-            existing_ranges.extend(
-                time_range
-                for schedule in matching_schedules
-                for time_range in self._schedule_to_ranges(schedule)
-            )
+            taken_grid.update(WeekGrid.from_schedules(matching_schedules))
             selected_sections[subject_id] = section
 
         # For irregulars, 'home section' is less strict, but we can assign them to one 
@@ -200,44 +171,165 @@ class PickingService:
 
         if selections:
             first_section = selected_sections[selections[0]['subject_id']]
-            existing = SectionStudent.objects.select_for_update().filter(
-                student=student,
-                term=term
-            ).first()
-            if existing:
-                existing.section = first_section
-                existing.save()
-            else:
-                SectionStudent.objects.create(
-                    student=student,
-                    section=first_section,
-                    term=term,
-                    is_home_section=True
-                )
+            # The home section takes a seat; the conditional UPDATE catches a concurrent fill
+            if not SeatCounter.reserve(first_section.id):
+                raise ConflictError(f"Section {first_section.name} is full.")
+            self._save_home_section(student, term, first_section)
 
         return True
 
+    @staticmethod
+    def _save_home_section(student, term, section):
+        """
+        Creates or moves the student's home SectionStudent row for a section whose
+        seat was already reserved with SeatCounter.reserve().
+        """
+        assignment = SectionStudent.objects.select_for_update().filter(
+            student=student,
+            term=term
+        ).first()
+        if assignment and assignment.section_id == section.id:
+            SeatCounter.release(section.id)  # already seated here; give the reservation back
+            return assignment
+        if assignment:
+            assignment.section = section
+        else:
+            assignment = SectionStudent(student=student, section=section, term=term, is_home_section=True)
+        # Tell the seat-counter signal not to count this seat a second time
+        assignment._seat_reserved = True
+        assignment.save()
+        return assignment
+
     @transaction.atomic
     def auto_assign_remaining(self, term):
         """
-        Automatically assigns unpicked students to available slots after the picking deadline.
+        Automatically assigns unpicked regular students to available slots after the
+        picking deadline.
+
+        Every unassigned approved enrollment and every open section is loaded once and
+        seats are allocated in memory: within each (program, year_level) cluster a
+        student goes to the session with the lower fill ratio, then to its least-filled
+        section. SectionStudent rows, Grade.section and the seat counters are written
+        in bulk. Irregular students keep picking per subject and are only counted.
+        Students placed in PM because their cluster's AM sections had no seat left get
+        the session-redirection notice, sent in bulk; those balanced into PM are not told
+        AM was full.
+
+        Returns:
+            dict: {'assigned', 'overflow', 'irregular_skipped', 'clusters': [...]} where each
+                  cluster lists its assigned/overflow counts and the IDNs that did not fit.
         """
-        unassigned_enrollments = StudentEnrollment.objects.filter(
-            term=term,
-            advising_status='APPROVED'
-        ).exclude(
-            student__section_assignments__term=term
+        # Lock the enrollments first, like a regular pick does, so concurrent pickers wait
+        enrollments = list(
+            StudentEnrollment.objects.select_for_update(of=('self',)).filter(
+                term=term,
+                advising_status='APPROVED'
+            ).exclude(
+                student__section_assignments__term=term
+            ).select_related('student__program').order_by('student__idn')
         )
+        # Re-read after locking: a pick may have committed while we waited
+        seated = set(SectionStudent.objects.filter(term=term).values_list('student_id', flat=True))
 
-        assigned_count = 0
-        for enrollment in unassigned_enrollments:
-            try:
-                # Default to AM, the service will fallback to PM if full
-                # Admin bypass: Allow assignment even before the picking period is officially 'open'
-                self.pick_schedule_regular(enrollment.student, term, 'AM', bypass_period_validation=True)
-                assigned_count += 1
-            except Exception:
-                # Log or handle full capacity at program/year level
+        sections = Section.objects.select_for_update().filter(
+            term=term,
+            is_active=True,
+            student_count__lt=models.F('max_students')
+        ).order_by('id')
+        open_seats = {}
+        for section in sections:
+            open_seats.setdefault((section.program_id, section.year_level), {'AM': [], 'PM': []})[
+                section.session
+            ].append(section)
+
+        clusters = {}
+        assignments = {}
+        redirected = []
+        irregular_skipped = 0
+        for enrollment in enrollments:
+            student = enrollment.student
+            if student.id in seated:
                 continue
-        
-        return assigned_count
+            if not enrollment.is_regular:
+                irregular_skipped += 1
+                continue
+
+            key = (student.program_id, enrollment.year_level)
+            report = clusters.setdefault(key, {
+                'program_id': student.program_id,
+                'program': student.program.code,
+                'year_level': enrollment.year_level,
+                'assigned': 0,
+                'overflow': 0,
+                'overflow_students': [],
+            })
+            sessions = open_seats.get(key)
+            am_full = not sessions or not any(s.student_count < s.max_students for s in sessions['AM'])
+            section = self._allocate_seat(sessions)
+            if section is None:
+                report['overflow'] += 1
+                report['overflow_students'].append(student.idn)
+                continue
+
+            report['assigned'] += 1
+            assignments.setdefault(section, []).append(student)
+            if section.session == 'PM' and am_full:
+                redirected.append(student)
+
+        created = SectionStudent.objects.bulk_create([
+            SectionStudent(student=student, section=section, term=term, is_home_section=True)
+            for section, students in assignments.items()
+            for student in students
+        ])
+        for section, students in assignments.items():
+            Grade.objects.filter(
+                student__in=students,
+                term=term,
+                advising_status=Grade.ADVISING_APPROVED
+            ).update(section=section)
+            # bulk_create skips the seat-counter signals
+            SeatCounter.add(section.id, len(students))
+        SectionStudent.bulk_audit(created, 'CREATE')
+        ReportService.invalidate_capacity_bottlenecks(term.id)
+        SectioningSnapshot.mark_dirty(term.id, 'sections', 'backlog')
+
+        # Auto-assignment places students for AM by default; tell those pushed into PM by a
+        # full AM, as a regular pick redirected out of its preferred session does
+        if redirected:
+            NotificationService.notify_session_redirections(redirected, 'AM', 'PM', defer=True)
+
+        cluster_reports = [clusters[key] for key in sorted(clusters)]
+        return {
+            'assigned': len(created),
+            'overflow': sum(report['overflow'] for report in cluster_reports),
+            'irregular_skipped': irregular_skipped,
+            'clusters': cluster_reports,
+        }
+
+    @staticmethod
+    def _allocate_seat(sessions):
+        """
+        Takes one seat from a cluster's open sections ({'AM': [...], 'PM': [...]}), whose
+        `student_count` is advanced in memory. Returns the section, or None when full.
+        """
+        if not sessions:
+            return None
+
+        def fill_ratio(session):
+            seats = [s for s in sessions[session] if s.student_count < s.max_students]
+            if not seats:
+                return None
+            return sum(s.student_count for s in sessions[session]) / sum(s.max_students for s in sessions[session])
+
+        ratios = {session: fill_ratio(session) for session in ('AM', 'PM')}
+        candidates = [session for session, ratio in ratios.items() if ratio is not None]
+        if not candidates:
+            return None
+
+        session = min(candidates, key=lambda name: (ratios[name], name))
+        section = min(
+            (s for s in sessions[session] if s.student_count < s.max_students),
+            key=lambda s: (s.student_count / s.max_students, s.student_count, s.id)
+        )
+        section.student_count += 1
+        return section
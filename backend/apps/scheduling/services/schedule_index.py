@@ -0,0 +1,215 @@
+"""
+Richwell Portal — Schedule Interval Index
+
+Term-scoped, in-memory index of every timed Schedule slot, keyed by
+(resource kind, resource id, day) and sorted by start minute. It answers
+"is this professor/room/section free?" and "which resources are free for this
+slot?" with a binary search instead of one database query per resource.
+
+The index is built from a single joined query and cached per term. A cached index
+is reused only while the term's schedule fingerprint (row count + latest
+`updated_at`) is unchanged, and Schedule save/delete signals drop it eagerly, so
+every process sees writes made by the others.
+
+Usage:
+    index = ScheduleIndex.for_term(term)
+    conflict = index.find_conflict('professor', prof.id, ['M', 'W'], 480, 600)
+    free_rooms = index.free_resources('room', room_ids, ['M'], 480, 600)
+    prof_grid = index.grid('professor', prof.id)   # WeekGrid bitmap
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
+from itertools import accumulate
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.week_grid import WeekGrid
+from core.cache import drop_now_and_on_commit
+
+
+CACHE_KEY = 'schedule_index:{term_id}'
+CACHE_TIMEOUT = 60 * 60
+
+RESOURCE_KINDS = ('professor', 'room', 'section')
+
+# Plain-value snapshot of one Schedule row, enough to build a conflict payload
+ScheduleEntry = namedtuple('ScheduleEntry', [
+    'id', 'section_id', 'professor_id', 'room_id', 'days', 'start', 'end',
+    'start_time', 'end_time', 'subject', 'section', 'professor', 'room',
+])
+
+
+def to_minutes(value):
+    """Converts a datetime.time to minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+class _DayIntervals:
+    """Intervals of one resource on one day, sorted by start, with a running max of ends."""
+
+    __slots__ = ('starts', 'entries', 'max_ends')
+
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda e: (e.start, e.id))
+        self.starts = [e.start for e in self.entries]
+        self.max_ends = list(accumulate((e.end for e in self.entries), max))
+
+    def first_overlap(self, start, end, exclude_id=None):
+        """Returns the earliest-starting entry overlapping [start, end), or None."""
+        upper = bisect_left(self.starts, end)              # entries starting before `end`
+        lower = bisect_right(self.max_ends, start, 0, upper)  # first entry that can end after `start`
+        for i in range(lower, upper):
+            entry = self.entries[i]
+            if entry.end > start and entry.id != exclude_id:
+                return entry
+        return None
+
+
+class ScheduleIndex:
+    """
+    Interval index over the timed schedules of one term.
+
+    Args:
+        term_id (int): The term the index covers.
+        entries (Iterable[ScheduleEntry]): Every timed schedule slot of the term.
+        fingerprint (tuple): (row count, latest updated_at) of the term's schedules.
+    """
+
+    def __init__(self, term_id, entries, fingerprint=None):
+        self.term_id = term_id
+        self.fingerprint = fingerprint
+        self.entries = {e.id: e for e in entries}
+
+        grouped = defaultdict(list)
+        for entry in self.entries.values():
+            for day in entry.days:
+                if entry.professor_id:
+                    grouped[('professor', entry.professor_id, day)].append(entry)
+                if entry.room_id:
+                    grouped[('room', entry.room_id, day)].append(entry)
+                grouped[('section', entry.section_id, day)].append(entry)
+        self._intervals = {key: _DayIntervals(items) for key, items in grouped.items()}
+
+        # Week occupancy bitmaps per resource, shared by the randomizer and availability checks
+        self._grids = {}
+        for entry in self.entries.values():
+            for kind, resource_id in (('professor', entry.professor_id), ('room', entry.room_id), ('section', entry.section_id)):
+                if resource_id:
+                    self._grids.setdefault((kind, resource_id), WeekGrid()).add(entry.days, entry.start, entry.end)
+
+    # ── Building & caching ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _fingerprint(term_id):
+        stats = Schedule.objects.filter(term_id=term_id).aggregate(
+            count=Count('id'), last_updated=Max('updated_at')
+        )
+        return (stats['count'], stats['last_updated'])
+
+    @classmethod
+    def build(cls, term_id, fingerprint=None, exclude_ids=()):
+        """
+        Builds the index from a single joined query.
+
+        Args:
+            exclude_ids (Iterable[int]): Schedule IDs left out, e.g. slots being re-solved.
+        """
+        schedules = Schedule.objects.filter(
+            term_id=term_id, start_time__isnull=False, end_time__isnull=False
+        ).exclude(id__in=list(exclude_ids)).select_related('subject', 'section', 'room', 'professor__user')
+
+        entries = [
+            ScheduleEntry(
+                id=s.id,
+                section_id=s.section_id,
+                professor_id=s.professor_id,
+                room_id=s.room_id,
+                days=list(s.days or []),
+                start=to_minutes(s.start_time),
+                end=to_minutes(s.end_time),
+                start_time=s.start_time,
+                end_time=s.end_time,
+                subject=f"{s.subject.code} - {s.subject.description}",
+                section=s.section.name,
+                professor=f"Prof. {s.professor.user.last_name}" if s.professor else None,
+                room=s.room.name if s.room else None,
+            )
+            for s in schedules
+        ]
+        return cls(term_id, entries, fingerprint)
+
+    @classmethod
+    def for_term(cls, term):
+        """
+        Returns the cached index of a term, rebuilding it when the term's schedules changed.
+
+        Args:
+            term (Term|int): The term or its primary key.
+        """
+        term_id = getattr(term, 'id', term)
+        fingerprint = cls._fingerprint(term_id)
+        key = CACHE_KEY.format(term_id=term_id)
+
+        index = cache.get(key)
+        if index is None or index.fingerprint != fingerprint:
+            index = cls.build(term_id, fingerprint)
+            cache.set(key, index, CACHE_TIMEOUT)
+        return index
+
+    @staticmethod
+    def invalidate(term_id):
+        """Drops the cached index of a term (see core.cache)."""
+        drop_now_and_on_commit(CACHE_KEY.format(term_id=term_id))
+
+    # ── Queries ────────────────────────────────────────────────────────────
+
+    def find_conflict(self, kind, resource_id, days, start, end, exclude_id=None):
+        """
+        Returns the first ScheduleEntry of a resource overlapping the slot, or None.
+
+        Args:
+            kind (str): 'professor', 'room' or 'section'.
+            resource_id (int): Primary key of the resource.
+            days (list[str]): Day codes of the slot (e.g. ['M', 'W']).
+            start (int), end (int): Slot bounds in minutes since midnight.
+            exclude_id (int|None): Schedule ID to ignore (the slot being edited).
+        """
+        exclude_id = int(exclude_id) if exclude_id else None
+        for day in days or []:
+            intervals = self._intervals.get((kind, resource_id, day))
+            if intervals:
+                entry = intervals.first_overlap(start, end, exclude_id)
+                if entry:
+                    return entry
+        return None
+
+    def grid(self, kind, resource_id):
+        """Returns the WeekGrid of a resource (empty if it has no timed slots)."""
+        return self._grids.get((kind, resource_id)) or WeekGrid()
+
+    def is_free(self, kind, resource_id, days, start, end, exclude_id=None):
+        """True if the resource has no overlapping slot on any of the given days."""
+        return self.find_conflict(kind, resource_id, days, start, end, exclude_id) is None
+
+    def busy_resources(self, kind, days, start, end, exclude_id=None):
+        """
+        Returns {resource_id: conflicting ScheduleEntry} for every resource of `kind`
+        that is busy during the slot.
+        """
+        busy = {}
+        exclude_id = int(exclude_id) if exclude_id else None
+        for (k, resource_id, day), intervals in self._intervals.items():
+            if k != kind or day not in (days or []) or resource_id in busy:
+                continue
+            entry = intervals.first_overlap(start, end, exclude_id)
+            if entry:
+                busy[resource_id] = entry
+        return busy
+
+    def free_resources(self, kind, resource_ids, days, start, end, exclude_id=None):
+        """Returns the subset of `resource_ids` that is free for the slot."""
+        busy = self.busy_resources(kind, days, start, end, exclude_id)
+        return [rid for rid in resource_ids if rid not in busy]
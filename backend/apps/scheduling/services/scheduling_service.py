@@ -8,21 +8,35 @@ the automatic randomization engine for section schedules.
 It implements complex conflict detection for Professors, Rooms, and Sections.
 """
 
+import heapq
+
 from django.db import transaction, models
 from django.conf import settings
+from django.forms.models import model_to_dict
+from django.utils import timezone
 from apps.scheduling.models import Schedule
+from apps.scheduling.services.faculty_load import FacultyLoadService
+from apps.scheduling.services.schedule_index import ScheduleIndex, to_minutes
+from apps.scheduling.services.timetable import FIELDS as TIMETABLE_FIELDS, TimetableProjection
+from apps.scheduling.services.week_grid import WeekGrid, slot_mask
 from apps.facilities.models import Room
 from apps.faculty.models import Professor
 from apps.sections.models import Section
+from core.exceptions import ConflictError
 
 
 class SchedulingService:
+    # Upper bound for the term-wide solver's search time (seconds)
+    MAX_TIME_BUDGET = 60.0
+
     @staticmethod
     @transaction.atomic
-    def publish_schedule(term):
+    def publish_schedule(term, defer_notifications=False):
         """
         Marks the schedule as published, opening student picking.
-        Notifies all students with approved advising for this term.
+        Notifies all students with approved advising for this term through
+        NotificationService.notify_many; with `defer_notifications` the fan-out
+        runs after this transaction commits instead of inside it.
         """
         term.schedule_published = True
         term.save(update_fields=['schedule_published'])
@@ -30,24 +44,26 @@ class SchedulingService:
         # Notify students with approved advising
         from apps.students.models import StudentEnrollment
         from apps.notifications.models import Notification
+        from apps.notifications.services.notification_service import NotificationService
 
-        enrollments = StudentEnrollment.objects.filter(
+        recipient_ids = StudentEnrollment.objects.filter(
             term=term,
-            advising_status='APPROVED'
-        ).select_related('student__user')
+            advising_status='APPROVED',
+            student__user__isnull=False
+        ).values_list('student__user_id', flat=True)
 
         frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:5173')
         link_url = f"{frontend_url}/student/picking"
 
-        for enrollment in enrollments:
-            if enrollment.student.user_id:
-                Notification.objects.create(
-                    recipient=enrollment.student.user,
-                    title="Schedule Published",
-                    message=f"Class schedules for {term.code} are now available. You may now view your assigned schedule or pick your preferred section (if applicable).",
-                    type=Notification.NotificationType.SCHEDULE,
-                    link_url=link_url
-                )
+        NotificationService.notify_many(
+            recipients=recipient_ids,
+            notification_type=Notification.NotificationType.SCHEDULE,
+            title="Schedule Published",
+            message=f"Class schedules for {term.code} are now available. You may now view your assigned schedule or pick your preferred section (if applicable).",
+            link_url=link_url,
+            defer=defer_notifications
+        )
+
     @transaction.atomic
     def create_or_update_schedule(self, term, section, subject, component_type, professor=None, room=None, days=None, start_time=None, end_time=None, exclude_id=None):
         """
@@ -58,14 +74,15 @@ class SchedulingService:
         
         # 1. Conflict Checks (only if days and times are provided)
         if days and start_time and end_time:
+            index = ScheduleIndex.for_term(term)
             if professor:
-                err = self.check_professor_conflict(professor, term, days, start_time, end_time, exclude_id=exclude_id)
+                err = self.check_professor_conflict(professor, term, days, start_time, end_time, exclude_id=exclude_id, index=index)
                 if err: raise ValueError(err)
             if room:
-                err = self.check_room_conflict(room, term, days, start_time, end_time, exclude_id=exclude_id)
+                err = self.check_room_conflict(room, term, days, start_time, end_time, exclude_id=exclude_id, index=index)
                 if err: raise ValueError(err)
             if section:
-                err = self.check_section_conflict(section, term, days, start_time, end_time, exclude_id=exclude_id)
+                err = self.check_section_conflict(section, term, days, start_time, end_time, exclude_id=exclude_id, index=index)
                 if err: raise ValueError(err)
 
         # 2. Update existing schedule slot or create a new one
@@ -76,95 +93,75 @@ class SchedulingService:
             component_type=component_type,
             defaults={'days': days}
         )
-        
         schedule.professor = professor
         schedule.room = room
         schedule.days = days
         schedule.start_time = start_time
         schedule.end_time = end_time
+        # Saving refreshes the load rollup of both the old and the new professor (apps.scheduling.signals)
         schedule.save()
         
         return schedule
 
-    def check_professor_conflict(self, professor, term, days, start_time, end_time, exclude_id=None):
+    @staticmethod
+    def _conflict_payload(conflict_type, message, entry, **overrides):
+        """Formats a ScheduleEntry from the interval index as a conflict response."""
+        payload = {
+            "type": conflict_type,
+            "message": message,
+            "time": f"{entry.days} {entry.start_time.strftime('%H:%M')} - {entry.end_time.strftime('%H:%M')}",
+            "subject": entry.subject,
+            "section": entry.section,
+            "professor": entry.professor or "TBA",
+            "room": entry.room or "TBA"
+        }
+        payload.update(overrides)
+        return payload
+
+    def check_professor_conflict(self, professor, term, days, start_time, end_time, exclude_id=None, index=None):
         """
         A professor cannot be in two places at the same time on the same day.
+        Answered from the term's ScheduleIndex; pass `index` to reuse one across checks.
         """
-        conflicts = Schedule.objects.filter(
-            term=term,
-            professor=professor,
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).select_related('subject', 'section', 'room')
-
-        if exclude_id:
-            conflicts = conflicts.exclude(id=exclude_id)
-            
-        for conflict in conflicts:
-            if any(day in conflict.days for day in days):
-                return {
-                    "type": "professor_conflict",
-                    "message": "Professor is currently using this slot:",
-                    "time": f"{conflict.days} {conflict.start_time.strftime('%H:%M')} - {conflict.end_time.strftime('%H:%M')}",
-                    "subject": f"{conflict.subject.code} - {conflict.subject.description}",
-                    "section": conflict.section.name,
-                    "professor": f"Prof. {professor.user.last_name}",
-                    "room": conflict.room.name if conflict.room else "TBA"
-                }
+        index = index or ScheduleIndex.for_term(term)
+        conflict = index.find_conflict(
+            'professor', professor.id, days, to_minutes(start_time), to_minutes(end_time), exclude_id
+        )
+        if conflict:
+            return self._conflict_payload(
+                "professor_conflict", "Professor is currently using this slot:", conflict,
+                professor=f"Prof. {professor.user.last_name}"
+            )
         return None
 
-    def check_room_conflict(self, room, term, days, start_time, end_time, exclude_id=None):
+    def check_room_conflict(self, room, term, days, start_time, end_time, exclude_id=None, index=None):
         """
         A room cannot be used for two different schedules at the same time.
         """
-        conflicts = Schedule.objects.filter(
-            term=term,
-            room=room,
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).select_related('subject', 'section', 'professor__user')
-
-        if exclude_id:
-            conflicts = conflicts.exclude(id=exclude_id)
-            
-        for conflict in conflicts:
-            if any(day in conflict.days for day in days):
-                return {
-                    "type": "room_conflict",
-                    "message": "Room is already occupied by another session:",
-                    "time": f"{conflict.days} {conflict.start_time.strftime('%H:%M')} - {conflict.end_time.strftime('%H:%M')}",
-                    "subject": f"{conflict.subject.code} - {conflict.subject.description}",
-                    "section": conflict.section.name,
-                    "professor": f"Prof. {conflict.professor.user.last_name}" if conflict.professor else "TBA",
-                    "room": room.name
-                }
+        index = index or ScheduleIndex.for_term(term)
+        conflict = index.find_conflict(
+            'room', room.id, days, to_minutes(start_time), to_minutes(end_time), exclude_id
+        )
+        if conflict:
+            return self._conflict_payload(
+                "room_conflict", "Room is already occupied by another session:", conflict,
+                room=room.name
+            )
         return None
 
-    def check_section_conflict(self, section, term, days, start_time, end_time, exclude_id=None):
+    def check_section_conflict(self, section, term, days, start_time, end_time, exclude_id=None, index=None):
         """
         A section cannot have two different subjects at the same time.
         """
-        conflicts = Schedule.objects.filter(
-            term=term,
-            section=section,
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        ).select_related('subject', 'room', 'professor__user')
-
-        if exclude_id:
-            conflicts = conflicts.exclude(id=exclude_id)
-            
-        for conflict in conflicts:
-            if any(day in conflict.days for day in days):
-                return {
-                    "type": "section_conflict",
-                    "message": "Section already has a subject scheduled at this time:",
-                    "time": f"{conflict.days} {conflict.start_time.strftime('%H:%M')} - {conflict.end_time.strftime('%H:%M')}",
-                    "subject": f"{conflict.subject.code} - {conflict.subject.description}",
-                    "section": section.name,
-                    "professor": f"Prof. {conflict.professor.user.last_name}" if conflict.professor else "TBA",
-                    "room": conflict.room.name if conflict.room else "TBA"
-                }
+        index = index or ScheduleIndex.for_term(term)
+        conflict = index.find_conflict(
+            'section', section.id, days, to_minutes(start_time), to_minutes(end_time), exclude_id
+        )
+        if conflict:
+            return self._conflict_payload(
+                "section_conflict", "Section already has a subject scheduled at this time:", conflict,
+                section=section.name
+            )
         return None
 
     def auto_assign_room(self, subject, component_type, capacity_needed):
@@ -207,10 +204,12 @@ class SchedulingService:
         DAYS = ['M', 'T', 'W', 'TH', 'F', 'S']
         service = SchedulingService()
 
-        # 1. Initialize and clean existing assignments
-        slots = Schedule.objects.filter(term=term, section=section).select_related('subject').order_by('id')
-        if not slots.exists(): raise ValueError("No schedule slots found for this section.")
-        slots.update(days=[], start_time=None, end_time=None)
+        # 1. Initialize and clean existing assignments (snapshot first for the audit trail)
+        slots = list(Schedule.objects.filter(term=term, section=section).select_related('subject', 'section').order_by('id'))
+        if not slots: raise ValueError("No schedule slots found for this section.")
+        original_states = {slot.pk: model_to_dict(slot) for slot in slots}
+        Schedule.objects.filter(id__in=original_states).update(days=[], start_time=None, end_time=None)
+        ScheduleIndex.invalidate(term.id)
 
         # 2. Get Constraints and Configuration
         grid_start, grid_end = service._get_grid_bounds(section)
@@ -218,8 +217,8 @@ class SchedulingService:
         qualified_profs = service._get_qualified_profs(slots) if respect_professor else {}
         available_rooms = service._get_available_rooms(section) if respect_room else []
         
-        # Track occupied intervals per day for the current section
-        section_occupied = {d: [] for d in DAYS}
+        # Track occupied time of the current section as it is being filled
+        section_grid = WeekGrid()
 
         # 3. Group and Sort Subject Blocks
         # Group LEC and LAB components of the same subject to keep them together in the schedule
@@ -244,7 +243,7 @@ class SchedulingService:
                     grid_start=grid_start,
                     grid_end=grid_end,
                     constraints=constraints,
-                    section_occupied=section_occupied[day],
+                    section_occupied=section_grid,
                     qualified_profs=qualified_profs.get(item['subject_id'], []),
                     available_rooms=available_rooms,
                     respect_professor=respect_professor,
@@ -263,7 +262,7 @@ class SchedulingService:
                         respect_room=respect_room
                     )
                     
-                    section_occupied[day].append((gap_start, gap_start + item['total_minutes']))
+                    section_grid.add([day], gap_start, gap_start + item['total_minutes'])
                     day_index = (day_index + attempt + 1) % len(DAYS)
                     placed = True
                     break
@@ -279,7 +278,7 @@ class SchedulingService:
                     gap, _, _ = service._find_gap_for_subject_group(
                         day=d, total_duration=total_mins, slots_in_group=item['slots'],
                         section=section, grid_start=grid_start, grid_end=grid_end,
-                        constraints=constraints, section_occupied=section_occupied[d],
+                        constraints=constraints, section_occupied=section_grid,
                         qualified_profs={}, available_rooms=[],
                         respect_professor=False, respect_room=False
                     )
@@ -287,57 +286,200 @@ class SchedulingService:
                         can_fit_anywhere = True
                         break
                 
-                if not can_fit_anywhere:
-                    reason = f"the {section.session} session grid is physically full or contains too many gaps."
-                elif respect_professor and respect_room:
-                    reason = "professor or room availability constraints are too restrictive."
-                elif respect_professor:
-                    reason = "professor availability or existing schedule conflicts."
-                elif respect_room:
-                    reason = "no available rooms with sufficient capacity in this time slot."
-                else:
-                    reason = f"conflict with {total_mins // 60}h {total_mins % 60}m subject block."
+                reason = service._placement_failure_reason(
+                    section.session, total_mins, can_fit_anywhere, respect_professor, respect_room
+                )
 
                 raise ValueError(
                     f"Could not place {subject_code} — {reason} "
                     f"Try disabling 'Respect Professor/Room' or manually adjusting the grid."
                 )
 
+        # 5. Persist every placement at once
+        service._save_slots(term, slots, original_states)
+
         return Schedule.objects.filter(term=term, section=section).select_related(
             'subject', 'professor__user', 'room', 'section', 'term'
         )
 
+    @staticmethod
+    def _placement_failure_reason(session, total_mins, can_fit_anywhere, respect_professor, respect_room):
+        """Explains why a subject block could not be placed."""
+        if not can_fit_anywhere:
+            return f"the {session} session grid is physically full or contains too many gaps."
+        if respect_professor and respect_room:
+            return "professor or room availability constraints are too restrictive."
+        if respect_professor:
+            return "professor availability or existing schedule conflicts."
+        if respect_room:
+            return "no available rooms with sufficient capacity in this time slot."
+        return f"conflict with {total_mins // 60}h {total_mins % 60}m subject block."
+
+    @staticmethod
+    def randomize_term_schedule(term, respect_professor=False, respect_room=False, seed=None,
+                                time_budget=None, sections=None):
+        """
+        Auto-generates day/time assignments for every section of a term in one solve.
+
+        Unlike `randomize_section_schedule`, sections are not placed one after another:
+        the TermTimetableSolver searches all subject blocks together, so an early section
+        cannot take the only slot a later section's professor or room could use. Blocks
+        that cannot be placed are left unscheduled and reported instead of failing the term.
+
+        The slots are cleared in memory and the solve runs outside any transaction, so the
+        term's schedules stay unlocked for up to MAX_TIME_BUDGET; the cleared and placed
+        slots are then written together in one short atomic block. That block locks the
+        term's schedules and refuses the write if any of them changed during the solve,
+        since the result was computed against the earlier state.
+
+        Args:
+            term (Term): The academic term to schedule.
+            respect_professor (bool): Enforce qualified professors, availability and conflicts.
+            respect_room (bool): Enforce lecture rooms with enough capacity and room conflicts.
+            seed (int|None): Random seed; defaults to the term ID so reruns are reproducible.
+            time_budget (float|None): Search time limit in seconds (capped at MAX_TIME_BUDGET).
+            sections (QuerySet|None): Sections to solve; defaults to the term's active sections.
+
+        Returns:
+            dict: Solve report with placed counts and the unsatisfied blocks.
+
+        Raises:
+            ConflictError: A schedule of the term was saved or deleted during the solve.
+        """
+        from collections import defaultdict
+        from apps.scheduling.services.timetable_solver import Block, TermTimetableSolver
+
+        service = SchedulingService()
+        seed = term.id if seed is None else int(seed)
+        time_budget = min(
+            float(time_budget) if time_budget is not None else TermTimetableSolver.DEFAULT_TIME_BUDGET,
+            SchedulingService.MAX_TIME_BUDGET
+        )
+        if sections is None:
+            sections = Section.objects.filter(term=term, is_active=True)
+
+        # 1. Clear the sections' current assignments in memory (fixed professors/rooms are kept).
+        # The term's fingerprint is taken first so any later write is caught before saving.
+        fingerprint = ScheduleIndex._fingerprint(term.id)
+        slots = list(
+            Schedule.objects.filter(term=term, section__in=sections)
+            .select_related('subject', 'section').order_by('section_id', 'id')
+        )
+        if not slots: raise ValueError("No schedule slots found for this term.")
+        original_states = {slot.pk: model_to_dict(slot) for slot in slots}
+        for slot in slots:
+            slot.days, slot.start_time, slot.end_time = [], None, None
+
+        # 2. Shared constraints: occupancy of everything outside the solve, availability, candidates
+        constraints = service._prepare_constraints(
+            term, None, respect_professor, respect_room, exclude_ids=list(original_states)
+        )
+        qualified_profs = service._get_qualified_profs(slots) if respect_professor else {}
+        lecture_rooms = list(
+            Room.objects.filter(is_active=True, room_type='LECTURE')
+            .order_by('capacity', 'id').values_list('id', 'capacity')
+        ) if respect_room else []
+
+        # 3. One block per (section, subject), LEC + LAB kept together
+        grouped = defaultdict(lambda: defaultdict(list))
+        for slot in slots: grouped[slot.section_id][slot.subject_id].append(slot)
+
+        blocks = []
+        for subject_groups in grouped.values():
+            section = next(iter(subject_groups.values()))[0].section
+            grid_start, grid_end = service._get_grid_bounds(section)
+            for item in service._calculate_subject_durations(subject_groups, grid_start, grid_end):
+                group = item['slots']
+                fixed_prof_id = next((s.professor_id for s in group if s.professor_id), None)
+                fixed_room_id = next((s.room_id for s in group if s.room_id), None)
+                professors = [fixed_prof_id] if fixed_prof_id else (list(qualified_profs.get(item['subject_id'], [])) if respect_professor else [None])
+                rooms = [fixed_room_id] if fixed_room_id else ([r_id for r_id, capacity in lecture_rooms if capacity >= section.max_students] if respect_room else [None])
+                blocks.append(Block(
+                    section_id=section.id, session=section.session, subject_id=item['subject_id'],
+                    slots=group, minutes=item['total_minutes'], grid_start=grid_start, grid_end=grid_end,
+                    professors=professors or [None], rooms=rooms or [None],
+                ))
+
+        # 4. Solve and save
+        result = TermTimetableSolver(
+            blocks, constraints, respect_professor=respect_professor, respect_room=respect_room,
+            seed=seed, time_budget=time_budget
+        ).solve()
+
+        for block, placement in result.placements:
+            service._assign_slots_to_gap(
+                day=placement.day,
+                gap_start=placement.start,
+                total_duration=block.minutes,
+                slots=block.slots,
+                assigned_prof_id=placement.professor_id,
+                assigned_room_id=placement.room_id,
+                respect_professor=respect_professor,
+                respect_room=respect_room
+            )
+        # Unplaced slots are saved too, so their cleared times reach the database and audit trail
+        with transaction.atomic():
+            # Lock the term's schedules; an edit, insert or delete since the solve began moves
+            # the (count, latest updated_at) fingerprint and would be overwritten or double-booked
+            stamps = list(Schedule.objects.select_for_update().filter(term=term).values_list('updated_at', flat=True))
+            if (len(stamps), max(stamps, default=None)) != fingerprint:
+                raise ConflictError("The term's schedules changed while the timetable was being generated. Please run it again.")
+            service._save_slots(term, slots, original_states)
+
+        unsatisfied = []
+        for block, reason in result.unsatisfied:
+            first_slot = block.slots[0]
+            unsatisfied.append({
+                'section_id': block.section_id,
+                'section': first_slot.section.name,
+                'subject_id': block.subject_id,
+                'subject': first_slot.subject.code,
+                'minutes': block.minutes,
+                'schedule_ids': [s.id for s in block.slots],
+                'reason': service._placement_failure_reason(
+                    block.session, block.minutes, reason != 'section_full', respect_professor, respect_room
+                ),
+            })
+
+        return {
+            'term': term.code,
+            'seed': seed,
+            'sections': len(grouped),
+            'blocks': len(blocks),
+            'placed': len(result.placements),
+            'complete': not unsatisfied,
+            'unsatisfied': unsatisfied,
+            'nodes': result.nodes,
+            'elapsed_ms': result.elapsed_ms,
+            'budget_exhausted': result.budget_exhausted,
+        }
+
     def _get_grid_bounds(self, section):
         """Returns the (START, END) minutes for the section's session (AM/PM)."""
         if section.session == 'AM':
             return 7 * 60, 13 * 60 # 7:00 AM - 1:00 PM
         return 13 * 60, 19 * 60     # 1:00 PM - 7:00 PM
 
-    def _prepare_constraints(self, term, section, respect_prof, respect_room):
-        """Fetches existing schedules and availability grids to act as constraints."""
+    def _prepare_constraints(self, term, section, respect_prof, respect_room, exclude_ids=()):
+        """
+        Fetches existing schedules and availability grids to act as constraints.
+
+        Professor and room occupancy comes from a freshly built ScheduleIndex (one query),
+        whose per-resource WeekGrids are looked up with `index.grid(kind, id)`. The index is
+        built rather than taken from the cache because it is read inside the randomizer's
+        transaction, after the section's own slots were cleared. The term solver clears its
+        slots only in memory and passes their IDs as `exclude_ids` instead.
+        """
         from collections import defaultdict
         from apps.faculty.models import ProfessorAvailability
 
         constraints = {
-            'prof_schedules': defaultdict(list),
-            'room_schedules': defaultdict(list),
+            'index': None,
             'prof_availabilities': defaultdict(list)
         }
 
         if respect_prof or respect_room:
-            other_schedules = Schedule.objects.filter(
-                term=term, start_time__isnull=False, end_time__isnull=False
-            ).exclude(section=section)
-
-            for s in other_schedules:
-                duration_mins = (s.end_time.hour * 60 + s.end_time.minute) - (s.start_time.hour * 60 + s.start_time.minute)
-                sc_start = s.start_time.hour * 60 + s.start_time.minute
-                sc_end = sc_start + duration_mins
-                for d in s.days:
-                    if respect_prof and s.professor_id:
-                        constraints['prof_schedules'][s.professor_id].append((d, sc_start, sc_end))
-                    if respect_room and s.room_id:
-                        constraints['room_schedules'][s.room_id].append((d, sc_start, sc_end))
+            constraints['index'] = ScheduleIndex.build(term.id, exclude_ids=exclude_ids)
 
         if respect_prof:
             avails = ProfessorAvailability.objects.all() # Optimization: Could filter by profs in section
@@ -351,7 +493,10 @@ class SchedulingService:
         from collections import defaultdict
         from apps.faculty.models import ProfessorSubject
         qualified = defaultdict(list)
-        p_subs = ProfessorSubject.objects.filter(subject_id__in=[s.subject_id for s in slots])
+        # Ordered so the solver meets candidates in the same order for a given seed
+        p_subs = ProfessorSubject.objects.filter(
+            subject_id__in=[s.subject_id for s in slots]
+        ).order_by('subject_id', 'professor_id')
         for ps in p_subs: qualified[ps.subject_id].append(ps.professor_id)
         return qualified
 
@@ -377,7 +522,8 @@ class SchedulingService:
     def _find_gap_for_subject_group(self, **kwargs):
         """
         Internal logic to find a valid time gap on a specific day for a subject block.
-        Considers section, professor, and room constraints.
+        Considers section, professor, and room constraints. `section_occupied` is the
+        section's WeekGrid; professor and room grids come from constraints['index'].
         """
         import random
         # Extract params from kwargs for cleaner signature in long list
@@ -410,15 +556,20 @@ class SchedulingService:
                 if not has_avail: continue
             
             for r_id in candidate_rooms:
-                blocking = sorted(
-                    section_occupied + 
-                    ([(st, en) for d, st, en in constraints['prof_schedules'].get(p_id, []) if d == day] if respect_prof and p_id else []) +
-                    ([(st, en) for d, st, en in constraints['room_schedules'].get(r_id, []) if d == day] if respect_room and r_id else []),
-                    key=lambda x: x[0]
-                )
-                
+                # Section, professor and room occupancy for this block, read in place
+                grids = [section_occupied]
+                if respect_prof and p_id:
+                    grids.append(constraints['index'].grid('professor', p_id))
+                if respect_room and r_id:
+                    grids.append(constraints['index'].grid('room', r_id))
+                occupied_mask = 0
+                for grid in grids: occupied_mask |= grid.mask
+
+                # A gap whose slots share no bit with the occupancy is free without a range walk
                 candidate = grid_start
-                for occ_start, occ_end in blocking:
+                for occ_start, occ_end in heapq.merge(*(grid.ranges.get(day, ()) for grid in grids)):
+                    if candidate + total_duration > grid_end: break
+                    if not slot_mask([day], candidate, candidate + total_duration) & occupied_mask: return candidate, p_id, r_id
                     if candidate + total_duration <= occ_start: return candidate, p_id, r_id
                     candidate = max(candidate, occ_end)
                 
@@ -427,7 +578,10 @@ class SchedulingService:
         return None, None, None
 
     def _assign_slots_to_gap(self, **kwargs):
-        """Saves final assignments to the database for all slots in a subject block."""
+        """
+        Applies a subject block's day, times, professor and room to its slots in memory.
+        Nothing is written here; callers persist all slots at once with `_save_slots`.
+        """
         from datetime import time as dt_time
         day, current_start, total_duration = kwargs['day'], kwargs['gap_start'], kwargs['total_duration']
         slots, prof_id, room_id = kwargs['slots'], kwargs['assigned_prof_id'], kwargs['assigned_room_id']
@@ -448,33 +602,39 @@ class SchedulingService:
             if kwargs['respect_professor'] and not slot.professor_id and prof_id: slot.professor_id = prof_id
             if kwargs['respect_room'] and not slot.room_id and room_id: slot.room_id = room_id
                 
-            slot.save(update_fields=['days', 'start_time', 'end_time', 'professor', 'room'])
             current_start = slot_end
+        return slots
+
+    def _save_slots(self, term, slots, original_states):
+        """
+        Persists generated slots with one bulk UPDATE and writes their audit history
+        as one batch of entries (diffed against `original_states`, the model_to_dict
+        snapshots taken before generation). bulk_update bypasses save() and signals,
+        so `updated_at` is set here, the term's ScheduleIndex and timetables are dropped
+        and the affected professors' FacultyLoad rows are refreshed explicitly.
+        """
+        now = timezone.now()
+        professors = Professor.objects.select_related('user').in_bulk(
+            {slot.professor_id for slot in slots if slot.professor_id}
+        )
+        for slot in slots:
+            slot.updated_at = now
+            # Attach professor objects in one query so audit entries can describe the slots
+            if slot.professor_id: slot.professor = professors[slot.professor_id]
+
+        Schedule.objects.bulk_update(slots, ['days', 'start_time', 'end_time', 'professor', 'room', 'updated_at'])
+        Schedule.bulk_audit(slots, 'UPDATE', original_states)
+        ScheduleIndex.invalidate(term.id)
+        TimetableProjection.invalidate(term.id)
+        FacultyLoadService.refresh(term, {slot.professor_id for slot in slots} | {
+            state['professor'] for state in original_states.values()
+        })
+
     @staticmethod
     def get_schedule_insights(queryset):
         """
         Groups a list of schedules by day for the insight panels.
+        Reads only the needed columns in one joined query; the insight endpoints
+        use the cached TimetableProjection instead.
         """
-        days_map = {
-            'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 
-            'TH': 'Thursday', 'F': 'Friday', 'S': 'Saturday'
-        }
-        results = {name: [] for name in days_map.values()}
-        
-        for sched in queryset.order_by('start_time'):
-            if not sched.start_time or not sched.end_time:
-                continue
-                
-            time_str = f"{sched.start_time.strftime('%H:%M')} - {sched.end_time.strftime('%H:%M')}"
-            for d_code in sched.days:
-                day_name = days_map.get(d_code)
-                if day_name:
-                    results[day_name].append({
-                        "id": sched.id,
-                        "time": time_str,
-                        "subject": f"{sched.subject.code} - {sched.subject.description}",
-                        "section": sched.section.name,
-                        "room": sched.room.name if sched.room else "TBA",
-                        "professor": f"Prof. {sched.professor.user.last_name}" if sched.professor else "TBA"
-                    })
-        return results
+        return TimetableProjection.project(queryset.values(*TIMETABLE_FIELDS))
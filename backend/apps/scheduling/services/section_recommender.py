@@ -0,0 +1,270 @@
+"""
+Richwell Portal — Section Combination Recommender
+
+Read-only helper for irregular students. Given the student's approved subjects
+for a term, it searches the term's section offerings for conflict-free
+combinations (one section per subject, none of them full) and returns the best
+few, so students submit a combination that `pick_schedule_irregular` will accept
+instead of retrying the locked picking endpoint.
+
+Offerings come from a per-term `OfferingIndex` cached like the ScheduleIndex
+(same fingerprint, dropped by the Schedule signals); seat counts are read with a
+plain SELECT of `Section.student_count`. Nothing is locked or written.
+
+Usage:
+    report = SectionRecommender.recommend(student, term, rank='days', limit=5)
+    report['recommendations'][0]['selections']   # payload for pick-irregular
+"""
+
+from bisect import insort
+from collections import defaultdict, namedtuple
+
+from django.core.cache import cache
+from django.db.models import F
+
+from apps.grades.models import Grade
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.schedule_index import ScheduleIndex, to_minutes
+from apps.scheduling.services.week_grid import DAYS, WeekGrid
+from apps.sections.models import Section
+from core.cache import drop_now_and_on_commit
+
+
+CACHE_KEY = 'section_offerings:{term_id}'
+CACHE_TIMEOUT = 60 * 60
+
+# One section's slots for one subject; `slots` holds (days, start, end) of the timed schedules
+Offering = namedtuple('Offering', ['subject_id', 'section_id', 'section', 'session', 'slots', 'grid'])
+
+
+class OfferingIndex:
+    """
+    Every (subject, section) offering of one term, grouped by subject.
+
+    Args:
+        term_id (int): The term the index covers.
+        offerings (Iterable[Offering]): The term's offerings.
+        fingerprint (tuple): ScheduleIndex fingerprint of the term's schedules.
+    """
+
+    def __init__(self, term_id, offerings, fingerprint=None):
+        self.term_id = term_id
+        self.fingerprint = fingerprint
+        self.by_subject = defaultdict(list)
+        for offering in sorted(offerings, key=lambda o: (o.subject_id, o.section_id)):
+            self.by_subject[offering.subject_id].append(offering)
+
+    @classmethod
+    def build(cls, term_id, fingerprint=None):
+        """Builds the index from a single query."""
+        slots = defaultdict(list)
+        sections = {}
+        rows = Schedule.objects.filter(term_id=term_id).values_list(
+            'subject_id', 'section_id', 'section__name', 'section__session', 'days', 'start_time', 'end_time'
+        )
+        for subject_id, section_id, name, session, days, start, end in rows:
+            sections[(subject_id, section_id)] = (name, session)
+            if start and end and days:
+                slots[(subject_id, section_id)].append((tuple(days), to_minutes(start), to_minutes(end)))
+
+        offerings = []
+        for (subject_id, section_id), (name, session) in sections.items():
+            grid = WeekGrid()
+            for days, start, end in slots[(subject_id, section_id)]:
+                grid.add(days, start, end)
+            offerings.append(Offering(
+                subject_id, section_id, name, session, tuple(slots[(subject_id, section_id)]), grid
+            ))
+        return cls(term_id, offerings, fingerprint)
+
+    @classmethod
+    def for_term(cls, term):
+        """Returns the cached index of a term, rebuilding it when the term's schedules changed."""
+        term_id = getattr(term, 'id', term)
+        fingerprint = ScheduleIndex._fingerprint(term_id)
+        key = CACHE_KEY.format(term_id=term_id)
+
+        index = cache.get(key)
+        if index is None or index.fingerprint != fingerprint:
+            index = cls.build(term_id, fingerprint)
+            cache.set(key, index, CACHE_TIMEOUT)
+        return index
+
+    @staticmethod
+    def invalidate(term_id):
+        """Drops the cached offering index of a term (see core.cache)."""
+        drop_now_and_on_commit(CACHE_KEY.format(term_id=term_id))
+
+
+class SectionRecommender:
+    """
+    Branch-and-bound search for the top-k conflict-free section combinations.
+
+    Every ranking is a tuple of measures that can only grow as sections are added
+    (campus minutes, days on campus, distinct sections), so a partial combination
+    that already ranks behind the k-th best found is pruned with all its completions.
+
+    Rankings:
+        'compact': least time on campus (first start to last end, summed per day),
+                   then fewest days.
+        'days':    fewest days on campus, then least time on campus.
+    """
+
+    RANKINGS = ('compact', 'days')
+    DEFAULT_LIMIT = 5
+    MAX_LIMIT = 20
+    MAX_NODES = 20000
+
+    def __init__(self, candidates, rank='compact', limit=DEFAULT_LIMIT, max_nodes=MAX_NODES):
+        """
+        Args:
+            candidates (list[list[Offering]]): Open offerings per subject.
+            rank (str): One of RANKINGS.
+            limit (int): Number of combinations to keep.
+            max_nodes (int): Search budget; the best combinations found so far are kept.
+        """
+        # Most constrained subjects first: fewer branches near the root
+        self.candidates = sorted(candidates, key=lambda offerings: (len(offerings), offerings[0].subject_id))
+        self.rank = rank
+        self.limit = limit
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.best = []
+
+    def _score(self, spans, sections):
+        minutes = sum(end - start for start, end in spans.values())
+        if self.rank == 'days':
+            return (len(spans), minutes, len(sections))
+        return (minutes, len(spans), len(sections))
+
+    @staticmethod
+    def _extend(spans, offering):
+        spans = dict(spans)
+        for days, start, end in offering.slots:
+            for day in days:
+                first, last = spans.get(day, (start, end))
+                spans[day] = (min(first, start), max(last, end))
+        return spans
+
+    def search(self):
+        """
+        Runs the search.
+
+        Returns:
+            bool: True if the search space was exhausted (the result is exact).
+        """
+        self._search(0, WeekGrid(), {}, (), ())
+        return self.nodes <= self.max_nodes
+
+    def _search(self, depth, taken, spans, sections, chosen):
+        if depth == len(self.candidates):
+            score = self._score(spans, set(sections))
+            insort(self.best, (score, sections, chosen))
+            del self.best[self.limit:]
+            return
+
+        options = []
+        for offering in self.candidates[depth]:
+            if taken.overlaps(offering.grid):
+                continue
+            next_spans = self._extend(spans, offering)
+            next_sections = sections + (offering.section_id,)
+            options.append((self._score(next_spans, set(next_sections)), offering, next_spans, next_sections))
+        options.sort(key=lambda option: (option[0], option[1].section_id))
+
+        for score, offering, next_spans, next_sections in options:
+            self.nodes += 1
+            if self.nodes > self.max_nodes:
+                return
+            # Scores only grow deeper down, so this branch cannot beat the k-th best
+            if len(self.best) == self.limit and score >= self.best[-1][0]:
+                break
+            self._search(depth + 1, taken | offering.grid, next_spans, next_sections, chosen + (offering,))
+
+    @classmethod
+    def recommend(cls, student, term, rank='compact', limit=DEFAULT_LIMIT):
+        """
+        Recommends conflict-free section combinations for a student's approved subjects.
+
+        Args:
+            student (Student): The irregular student.
+            term (Term): The picking term.
+            rank (str): 'compact' or 'days'.
+            limit (int): Number of combinations to return (capped at MAX_LIMIT).
+
+        Returns:
+            dict: {'rank', 'subjects', 'unavailable', 'recommendations', 'exhaustive'}.
+                  Each recommendation has the `selections` payload for pick-irregular
+                  plus its days, campus minutes and slots per subject.
+        """
+        if rank not in cls.RANKINGS:
+            raise ValueError(f"Unknown ranking '{rank}'. Use one of: {', '.join(cls.RANKINGS)}.")
+        limit = max(1, min(int(limit), cls.MAX_LIMIT))
+
+        subjects = list(
+            Grade.objects.filter(
+                student=student, term=term, advising_status=Grade.ADVISING_APPROVED
+            ).order_by('subject__code').values_list('subject_id', 'subject__code')
+        )
+        index = OfferingIndex.for_term(term)
+        section_ids = {o.section_id for subject_id, _ in subjects for o in index.by_subject.get(subject_id, [])}
+        open_ids = set(
+            Section.objects.filter(
+                id__in=section_ids, is_active=True, student_count__lt=F('max_students')
+            ).values_list('id', flat=True)
+        )
+
+        candidates, unavailable = [], []
+        for subject_id, code in subjects:
+            offerings = index.by_subject.get(subject_id, [])
+            open_offerings = [o for o in offerings if o.section_id in open_ids]
+            if open_offerings:
+                candidates.append(open_offerings)
+            else:
+                unavailable.append({
+                    'subject_id': subject_id,
+                    'subject_code': code,
+                    'reason': 'full' if offerings else 'not_offered',
+                })
+
+        recommendations = []
+        exhaustive = True
+        if candidates:
+            search = cls(candidates, rank=rank, limit=limit)
+            exhaustive = search.search()
+            codes = dict(subjects)
+            for _, _, chosen in search.best:
+                spans = {}
+                for offering in chosen:
+                    spans = cls._extend(spans, offering)
+                ordered = sorted(chosen, key=lambda o: codes[o.subject_id])
+                recommendations.append({
+                    'selections': [{'subject_id': o.subject_id, 'section_id': o.section_id} for o in ordered],
+                    'subjects': [
+                        {
+                            'subject_id': o.subject_id,
+                            'subject_code': codes[o.subject_id],
+                            'section_id': o.section_id,
+                            'section': o.section,
+                            'session': o.session,
+                            'slots': [
+                                {'days': list(days), 'start': f'{start // 60:02d}:{start % 60:02d}',
+                                 'end': f'{end // 60:02d}:{end % 60:02d}'}
+                                for days, start, end in o.slots
+                            ],
+                        }
+                        for o in ordered
+                    ],
+                    'days': sorted(spans, key=lambda day: DAYS.index(day) if day in DAYS else len(DAYS)),
+                    'day_count': len(spans),
+                    'campus_minutes': sum(end - start for start, end in spans.values()),
+                    'section_count': len({o.section_id for o in chosen}),
+                })
+
+        return {
+            'rank': rank,
+            'subjects': len(subjects),
+            'unavailable': unavailable,
+            'recommendations': recommendations,
+            'exhaustive': exhaustive,
+        }
@@ -0,0 +1,141 @@
+"""
+Richwell Portal — Timetable Projection
+
+Day-grouped timetables of a professor, room or section, as served by the
+schedule insight endpoints. A timetable is built from one joined `values()`
+query (no per-row lookups of subject, section, room or professor) and cached per
+(term, kind, entity).
+
+Cached timetables are stored under a per-term version token that the Schedule
+save/delete signals (and the bulk writers that bypass them) replace, and each
+entry also carries the ScheduleIndex fingerprint it was built from, so a write
+made by another process is noticed as well.
+
+Usage:
+    timetable = TimetableProjection.for_entity(term, 'professor', prof.id)
+    timetables = TimetableProjection.for_entities(term, 'room', room_ids)   # {room_id: timetable}
+    TimetableProjection.invalidate(term.id)
+"""
+
+from django.core.cache import cache
+
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.schedule_index import ScheduleIndex
+from core.cache import current_token, rotate_token
+
+
+CACHE_KEY = 'timetable:{term_id}:{version}:{kind}:{entity_id}'
+VERSION_KEY = 'timetable_version:{term_id}'
+CACHE_TIMEOUT = 60 * 60
+
+# Entity kinds and the Schedule column that selects them
+KINDS = {'professor': 'professor_id', 'room': 'room_id', 'section': 'section_id'}
+
+DAY_NAMES = {
+    'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday',
+    'TH': 'Thursday', 'F': 'Friday', 'S': 'Saturday'
+}
+
+# Columns a timetable entry is built from; everything comes from one joined query
+FIELDS = (
+    'id', 'professor_id', 'room_id', 'section_id', 'days', 'start_time', 'end_time',
+    'subject__code', 'subject__description', 'section__name', 'room__name', 'professor__user__last_name',
+)
+
+
+class TimetableProjection:
+    """
+    Builds and caches day-grouped timetables.
+    """
+
+    # Most entities the bulk insight endpoint accepts per request
+    BULK_LIMIT = 200
+
+    @staticmethod
+    def project(rows):
+        """
+        Groups schedule rows (dicts with FIELDS) by day name, ordered by start time.
+        Slots without a time are left out.
+
+        Returns:
+            dict: {'Monday': [{'id', 'time', 'subject', 'section', 'room', 'professor'}, ...], ...}
+        """
+        results = {name: [] for name in DAY_NAMES.values()}
+        timed = [row for row in rows if row['start_time'] and row['end_time']]
+        for row in sorted(timed, key=lambda row: (row['start_time'], row['id'])):
+            time_str = f"{row['start_time'].strftime('%H:%M')} - {row['end_time'].strftime('%H:%M')}"
+            for d_code in row['days']:
+                day_name = DAY_NAMES.get(d_code)
+                if day_name:
+                    results[day_name].append({
+                        "id": row['id'],
+                        "time": time_str,
+                        "subject": f"{row['subject__code']} - {row['subject__description']}",
+                        "section": row['section__name'],
+                        "room": row['room__name'] or "TBA",
+                        "professor": f"Prof. {row['professor__user__last_name']}" if row['professor_id'] else "TBA"
+                    })
+        return results
+
+    @staticmethod
+    def _version(term_id):
+        return current_token(VERSION_KEY.format(term_id=term_id))
+
+    @classmethod
+    def for_entities(cls, term, kind, entity_ids):
+        """
+        Returns the timetables of many professors, rooms or sections of a term with at
+        most one schedule query for the ones not cached.
+
+        Args:
+            term (Term|int): The term or its primary key.
+            kind (str): 'professor', 'room' or 'section'.
+            entity_ids (Iterable[int]): Primary keys of the entities.
+
+        Returns:
+            dict: entity_id -> timetable (see `project`).
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown timetable kind '{kind}'. Use one of: {', '.join(KINDS)}.")
+        term_id = int(getattr(term, 'id', term))
+        entity_ids = list(dict.fromkeys(int(entity_id) for entity_id in entity_ids))
+        if not entity_ids:
+            return {}
+
+        version = cls._version(term_id)
+        fingerprint = ScheduleIndex._fingerprint(term_id)
+        keys = {
+            entity_id: CACHE_KEY.format(term_id=term_id, version=version, kind=kind, entity_id=entity_id)
+            for entity_id in entity_ids
+        }
+        cached = cache.get_many(keys.values())
+
+        timetables, missing = {}, []
+        for entity_id, key in keys.items():
+            entry = cached.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                timetables[entity_id] = entry[1]
+            else:
+                missing.append(entity_id)
+
+        if missing:
+            column = KINDS[kind]
+            rows_by_entity = {entity_id: [] for entity_id in missing}
+            rows = Schedule.objects.filter(term_id=term_id, **{f'{column}__in': missing}).values(*FIELDS)
+            for row in rows:
+                rows_by_entity[row[column]].append(row)
+            built = {entity_id: cls.project(rows) for entity_id, rows in rows_by_entity.items()}
+            cache.set_many({keys[entity_id]: (fingerprint, timetable) for entity_id, timetable in built.items()}, CACHE_TIMEOUT)
+            timetables.update(built)
+
+        return {entity_id: timetables[entity_id] for entity_id in entity_ids}
+
+    @classmethod
+    def for_entity(cls, term, kind, entity_id):
+        """Returns the cached timetable of one professor, room or section of a term."""
+        return cls.for_entities(term, kind, [entity_id])[int(entity_id)]
+
+    @staticmethod
+    def invalidate(term_id):
+        """Retires every cached timetable of a term (see core.cache)."""
+        rotate_token(VERSION_KEY.format(term_id=term_id))
@@ -0,0 +1,272 @@
+"""
+Richwell Portal — Term Timetable Solver
+
+Schedules every section of a term in one search instead of one section at a time.
+Each (section, subject) pair is a block of consecutive minutes (LEC + LAB kept
+together, exactly like `randomize_section_schedule`) that needs a day, a start time
+and, when constraints are respected, a qualified professor and a lecture room.
+
+The search is a depth-first backtracking over the blocks, most constrained first.
+Candidates for a block are the earliest free start per (day, professor), trying the
+section's least loaded days first. Occupancy of sections, professors and rooms is kept
+in WeekGrids seeded from the term's ScheduleIndex, so slots of sections outside the
+solve are respected as fixed constraints.
+
+The search is deterministic for a given seed and stops when every block is placed,
+the time budget runs out, or the node budget is spent. In the last two cases the
+deepest partial solution found is completed greedily, and whatever still does not
+fit is reported as unsatisfied instead of aborting the whole term.
+
+Usage:
+    solver = TermTimetableSolver(blocks, constraints, respect_professor=True, seed=7)
+    result = solver.solve()
+    result.placements   # [(Block, Placement), ...]
+    result.unsatisfied  # [(Block, reason), ...]
+"""
+
+import random
+import time
+from collections import namedtuple
+
+from apps.scheduling.services.week_grid import WeekGrid
+
+
+DAYS = ('M', 'T', 'W', 'TH', 'F', 'S')
+
+# One schedulable unit: all slots of a subject in a section, placed back to back
+Block = namedtuple('Block', [
+    'section_id', 'session', 'subject_id', 'slots', 'minutes',
+    'grid_start', 'grid_end', 'professors', 'rooms',
+])
+
+# Where and with whom a block was placed
+Placement = namedtuple('Placement', ['day', 'start', 'professor_id', 'room_id'])
+
+SolverResult = namedtuple('SolverResult', [
+    'placements', 'unsatisfied', 'nodes', 'elapsed_ms', 'budget_exhausted',
+])
+
+
+class _BudgetExhausted(Exception):
+    pass
+
+
+def earliest_start(blocking, minutes, grid_start, grid_end):
+    """
+    Returns the first start minute where `minutes` fit between the blocking ranges
+    inside [grid_start, grid_end), or None.
+    """
+    candidate = grid_start
+    for occ_start, occ_end in sorted(blocking):
+        if candidate + minutes <= occ_start:
+            break
+        candidate = max(candidate, occ_end)
+    return candidate if candidate + minutes <= grid_end else None
+
+
+class TermTimetableSolver:
+    """
+    Backtracking timetable search over the blocks of one term.
+
+    Args:
+        blocks (list[Block]): Blocks to place.
+        constraints (dict): Output of `SchedulingService._prepare_constraints`
+            ('index' and 'prof_availabilities').
+        respect_professor (bool): Enforce professor availability and conflicts.
+        respect_room (bool): Enforce room conflicts.
+        seed (int): Seed of the tie-breaking random generator.
+        time_budget (float): Seconds the backtracking search may run.
+        max_nodes (int): Placements the backtracking search may try.
+    """
+
+    DEFAULT_TIME_BUDGET = 10.0
+    DEFAULT_MAX_NODES = 50000
+    # Branching cap per block; candidates are already ordered by preference
+    MAX_CANDIDATES = 12
+
+    def __init__(self, blocks, constraints, respect_professor=False, respect_room=False,
+                 seed=0, time_budget=None, max_nodes=None):
+        self.blocks = list(blocks)
+        self.respect_professor = respect_professor
+        self.respect_room = respect_room
+        self.rng = random.Random(seed)
+        self.time_budget = self.DEFAULT_TIME_BUDGET if time_budget is None else time_budget
+        self.max_nodes = max_nodes or self.DEFAULT_MAX_NODES
+
+        self._index = constraints.get('index')
+        self._availability = {
+            prof_id: set(avails) for prof_id, avails in constraints.get('prof_availabilities', {}).items()
+        }
+        self._grids = {}
+        self._nodes = 0
+        self._deadline = None
+
+    # ── Occupancy ──────────────────────────────────────────────────────────
+
+    def _grid(self, kind, resource_id):
+        """Mutable WeekGrid of a resource, seeded from the term index on first use."""
+        key = (kind, resource_id)
+        if key not in self._grids:
+            grid = WeekGrid()
+            if self._index is not None and kind != 'section':
+                grid.update(self._index.grid(kind, resource_id))
+            self._grids[key] = grid
+        return self._grids[key]
+
+    def _resource_grids(self, block, placement):
+        grids = [self._grid('section', block.section_id)]
+        if self.respect_professor and placement.professor_id:
+            grids.append(self._grid('professor', placement.professor_id))
+        if self.respect_room and placement.room_id:
+            grids.append(self._grid('room', placement.room_id))
+        return grids
+
+    def _place(self, block, placement):
+        for grid in self._resource_grids(block, placement):
+            grid.add([placement.day], placement.start, placement.start + block.minutes)
+
+    def _unplace(self, block, placement):
+        for grid in self._resource_grids(block, placement):
+            grid.discard([placement.day], placement.start, placement.start + block.minutes)
+
+    # ── Candidates ─────────────────────────────────────────────────────────
+
+    def _is_available(self, professor_id, day, session):
+        if not (self.respect_professor and professor_id):
+            return True
+        return (day, session) in self._availability.get(professor_id, ())
+
+    def _candidates(self, block):
+        """
+        Returns up to MAX_CANDIDATES placements for a block in the current state:
+        the earliest free start per (day, professor), using the room that allows it.
+        """
+        section_grid = self._grid('section', block.section_id)
+        days = sorted(DAYS, key=lambda d: (section_grid.minutes_on(d), self.rng.random()))
+
+        candidates = []
+        for day in days:
+            section_ranges = section_grid.ranges_on(day)
+            for prof_id in block.professors:
+                if not self._is_available(prof_id, day, block.session):
+                    continue
+                prof_ranges = (
+                    self._grid('professor', prof_id).ranges_on(day)
+                    if self.respect_professor and prof_id else []
+                )
+                best = None
+                for room_id in block.rooms:
+                    room_ranges = (
+                        self._grid('room', room_id).ranges_on(day)
+                        if self.respect_room and room_id else []
+                    )
+                    start = earliest_start(
+                        section_ranges + prof_ranges + room_ranges,
+                        block.minutes, block.grid_start, block.grid_end
+                    )
+                    if start is not None and (best is None or start < best.start):
+                        best = Placement(day, start, prof_id, room_id)
+                if best:
+                    candidates.append(best)
+                    if len(candidates) >= self.MAX_CANDIDATES:
+                        return candidates
+        return candidates
+
+    def fits_section_grid(self, block):
+        """True if the block fits its section's remaining time, ignoring professors and rooms."""
+        section_grid = self._grid('section', block.section_id)
+        return any(
+            earliest_start(section_grid.ranges_on(day), block.minutes, block.grid_start, block.grid_end) is not None
+            for day in DAYS
+        )
+
+    # ── Search ─────────────────────────────────────────────────────────────
+
+    def _ordered_blocks(self):
+        """Most constrained first: fewest professor/room options, then longest."""
+        return sorted(
+            self.blocks,
+            key=lambda b: (len(b.professors) * len(b.rooms), -b.minutes, b.section_id, b.subject_id)
+        )
+
+    def _tick(self):
+        self._nodes += 1
+        if self._nodes > self.max_nodes or time.monotonic() > self._deadline:
+            raise _BudgetExhausted()
+
+    def _backtrack(self, order):
+        """
+        Iterative depth-first search. Returns the deepest assignment reached
+        (a prefix of `order`) and whether the budget stopped the search.
+        """
+        assignment = []
+        best = []
+        stack = [self._candidates(order[0])] if order else []
+        try:
+            while stack and len(assignment) < len(order):
+                if not stack[-1]:
+                    stack.pop()
+                    if assignment:
+                        block = order[len(assignment) - 1]
+                        self._unplace(block, assignment.pop())
+                    continue
+
+                self._tick()
+                placement = stack[-1].pop(0)
+                self._place(order[len(assignment)], placement)
+                assignment.append(placement)
+                if len(assignment) > len(best):
+                    best = list(assignment)
+                if len(assignment) < len(order):
+                    stack.append(self._candidates(order[len(assignment)]))
+            exhausted = False
+        except _BudgetExhausted:
+            exhausted = True
+
+        if len(assignment) == len(order):
+            return assignment, exhausted
+
+        # Rewind to the deepest partial solution
+        for block, placement in reversed(list(zip(order, assignment))):
+            self._unplace(block, placement)
+        for block, placement in zip(order, best):
+            self._place(block, placement)
+        return best, exhausted
+
+    def solve(self):
+        """
+        Runs the search and returns a SolverResult.
+
+        Blocks the backtracking could not reach are placed greedily on top of the
+        deepest partial solution; blocks that still do not fit are returned in
+        `unsatisfied` with the reason code 'section_full' or 'constraints'.
+        """
+        started = time.monotonic()
+        self._deadline = started + self.time_budget
+        order, unsatisfied = [], []
+        for block in self._ordered_blocks():
+            # A block with no placement on an empty timetable can never be placed
+            if self._candidates(block):
+                order.append(block)
+            else:
+                unsatisfied.append((block, 'section_full' if not self.fits_section_grid(block) else 'constraints'))
+
+        assignment, exhausted = self._backtrack(order)
+        placements = list(zip(order, assignment))
+
+        for block in order[len(assignment):]:
+            candidates = self._candidates(block)
+            if candidates:
+                self._place(block, candidates[0])
+                placements.append((block, candidates[0]))
+            else:
+                reason = 'constraints' if self.fits_section_grid(block) else 'section_full'
+                unsatisfied.append((block, reason))
+
+        return SolverResult(
+            placements=placements,
+            unsatisfied=unsatisfied,
+            nodes=self._nodes,
+            elapsed_ms=int((time.monotonic() - started) * 1000),
+            budget_exhausted=exhausted,
+        )
@@ -0,0 +1,158 @@
+"""
+Richwell Portal — Week Grid
+
+Compact occupancy bitmap for one resource (section, professor or room) over a week.
+Each day is split into SLOT_MINUTES slots and every occupied slot sets one bit of a
+single Python int, so "do these two timetables collide?" is a bitwise AND.
+
+Schedules are not always aligned to the slot size (the randomizer derives durations
+from `hrs_per_week`), so a grid also keeps the exact minute ranges. The bitmap is a
+conservative filter — it never misses an overlap — and the exact ranges are consulted
+only when two bitmaps share a slot.
+
+Usage:
+    taken = WeekGrid.from_schedules(section_schedules)
+    if taken.overlaps(WeekGrid.from_schedules(candidate_schedules)): ...
+    taken.is_free(['M', 'W'], 8 * 60, 10 * 60)
+"""
+
+from bisect import insort
+from collections import defaultdict
+
+
+DAYS = ('M', 'T', 'W', 'TH', 'F', 'S')
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# Sunday and any unexpected day code share the last lanes so they are never dropped
+_DAY_LANES = {day: i for i, day in enumerate(DAYS + ('SU',))}
+_OTHER_LANE = len(_DAY_LANES)
+
+
+def _lane(day):
+    return _DAY_LANES.get(day, _OTHER_LANE)
+
+
+def slot_mask(days, start, end):
+    """
+    Returns the bitmap of every slot touched by [start, end) on the given days.
+
+    Args:
+        days (Iterable[str]): Day codes (e.g. ['M', 'W']).
+        start (int), end (int): Minutes since midnight.
+    """
+    if end <= start:
+        return 0
+    first, last = start // SLOT_MINUTES, (end - 1) // SLOT_MINUTES
+    run = ((1 << (last - first + 1)) - 1) << first
+    mask = 0
+    for day in days:
+        mask |= run << (_lane(day) * SLOTS_PER_DAY)
+    return mask
+
+
+def schedule_minutes(schedule):
+    """Returns (start, end) in minutes for a timed schedule, or None if untimed."""
+    if not schedule.start_time or not schedule.end_time:
+        return None
+    return (
+        schedule.start_time.hour * 60 + schedule.start_time.minute,
+        schedule.end_time.hour * 60 + schedule.end_time.minute,
+    )
+
+
+class WeekGrid:
+    """
+    Occupancy of one resource across the week.
+
+    Attributes:
+        mask (int): One bit per occupied SLOT_MINUTES slot.
+        ranges (dict[str, list[tuple[int, int]]]): Exact (start, end) minutes per day, sorted.
+    """
+
+    __slots__ = ('mask', 'ranges')
+
+    def __init__(self):
+        self.mask = 0
+        self.ranges = defaultdict(list)
+
+    @classmethod
+    def from_schedules(cls, schedules):
+        """Builds a grid from Schedule-like objects (days, start_time, end_time)."""
+        grid = cls()
+        for schedule in schedules:
+            grid.add_schedule(schedule)
+        return grid
+
+    def add(self, days, start, end):
+        """Marks [start, end) as occupied on each of `days`."""
+        if end <= start:
+            return
+        self.mask |= slot_mask(days, start, end)
+        for day in days:
+            insort(self.ranges[day], (start, end))
+
+    def discard(self, days, start, end):
+        """Removes one [start, end) occupancy from each of `days` (the inverse of `add`)."""
+        for day in days:
+            ranges = self.ranges.get(day)
+            if ranges and (start, end) in ranges:
+                ranges.remove((start, end))
+                # Other ranges may share the freed slots, so rebuild this day's lane
+                self.mask &= ~slot_mask([day], 0, 24 * 60)
+                for lane_day, lane_ranges in self.ranges.items():
+                    if _lane(lane_day) == _lane(day):
+                        for r_start, r_end in lane_ranges:
+                            self.mask |= slot_mask([lane_day], r_start, r_end)
+
+    def add_schedule(self, schedule):
+        """Marks a Schedule's days and time as occupied (untimed schedules are ignored)."""
+        minutes = schedule_minutes(schedule)
+        if minutes:
+            self.add(schedule.days or [], *minutes)
+
+    def update(self, other):
+        """Merges another grid into this one in place."""
+        self.mask |= other.mask
+        for day, ranges in other.ranges.items():
+            for r in ranges:
+                insort(self.ranges[day], r)
+        return self
+
+    def __or__(self, other):
+        return WeekGrid().update(self).update(other)
+
+    # ── Queries ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _ranges_overlap(ranges_a, ranges_b):
+        for a_start, a_end in ranges_a:
+            for b_start, b_end in ranges_b:
+                if a_start < b_end and b_start < a_end:
+                    return True
+        return False
+
+    def overlaps(self, other):
+        """True if any occupied minute of `other` is also occupied here."""
+        if not self.mask & other.mask:
+            return False
+        return any(
+            self._ranges_overlap(ranges, self.ranges.get(day, ()))
+            for day, ranges in other.ranges.items()
+        )
+
+    def is_free(self, days, start, end):
+        """True if [start, end) is unoccupied on every one of `days`."""
+        if not self.mask & slot_mask(days, start, end):
+            return True
+        return not any(
+            self._ranges_overlap([(start, end)], self.ranges.get(day, ())) for day in days
+        )
+
+    def ranges_on(self, day):
+        """Returns the sorted (start, end) ranges occupied on a day."""
+        return list(self.ranges.get(day, ()))
+
+    def minutes_on(self, day):
+        """Returns the total occupied minutes on a day."""
+        return sum(end - start for start, end in self.ranges.get(day, ()))
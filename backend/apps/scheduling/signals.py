@@ -0,0 +1,44 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from apps.faculty.models import Professor
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.faculty_load import FacultyLoadService
+from apps.scheduling.services.schedule_index import ScheduleIndex
+from apps.scheduling.services.section_recommender import OfferingIndex
+from apps.scheduling.services.timetable import TimetableProjection
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+from apps.terms.models import Term
+
+
+@receiver(post_save, sender=Schedule)
+@receiver(post_delete, sender=Schedule)
+def invalidate_schedule_index(sender, instance, **kwargs):
+    ScheduleIndex.invalidate(instance.term_id)
+    OfferingIndex.invalidate(instance.term_id)
+    TimetableProjection.invalidate(instance.term_id)
+    SectioningSnapshot.mark_dirty(instance.term_id, 'courses')
+
+
+@receiver(pre_save, sender=Schedule)
+def remember_previous_professor(sender, instance, raw=False, **kwargs):
+    # A reassigned slot leaves the previous professor's rollup to refresh too
+    instance._previous_professor_id = None
+    if instance.pk and not raw:
+        instance._previous_professor_id = (
+            Schedule.objects.filter(pk=instance.pk).values_list('professor_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Schedule)
+def refresh_faculty_load_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    FacultyLoadService.refresh(instance.term_id, [getattr(instance, '_previous_professor_id', None), instance.professor_id])
+
+
+@receiver(post_delete, sender=Schedule)
+def refresh_faculty_load(sender, instance, origin=None, **kwargs):
+    # Cascades from a deleted term or professor take the rollup rows with them
+    if getattr(origin, 'model', type(origin)) in (Term, Professor):
+        return
+    FacultyLoadService.refresh(instance.term_id, [instance.professor_id])
@@ -0,0 +1,115 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.grades.models import Grade
+from apps.notifications.models import Notification
+from apps.scheduling.services.picking_service import PickingService
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestAutoAssignRemaining:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.program = Program.objects.create(code='AUTO', name='Auto Assign Test')
+        self.curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.subject = Subject.objects.create(
+            curriculum=self.curriculum, code='AUTO1', description='Auto 1', year_level=1, semester='1', total_units=3
+        )
+        self.term = Term.objects.create(
+            code='2024-AUTO', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30),
+            schedule_published=True, picking_published_at=timezone.now()
+        )
+        self.am = self.make_section(1, 1, 'AM', 3)
+        self.pm = self.make_section(1, 2, 'PM', 3)
+        self.y2 = self.make_section(2, 1, 'AM', 1)
+        self.idx = 0
+
+    def make_section(self, year_level, number, session, max_students):
+        return Section.objects.create(
+            name=f'AUTO {year_level}-{number}', term=self.term, program=self.program, year_level=year_level,
+            section_number=number, session=session, max_students=max_students
+        )
+
+    def make_student(self, year_level=1, is_regular=True):
+        self.idx += 1
+        student = Student.objects.create(
+            user=User.objects.create(username=f'auto{self.idx}', email=f'auto{self.idx}@test.com', role='STUDENT'),
+            idn=f'29{self.idx:04d}', program=self.program, curriculum=self.curriculum,
+            date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+        )
+        StudentEnrollment.objects.create(
+            student=student, term=self.term, year_level=year_level, is_regular=is_regular, advising_status='APPROVED'
+        )
+        Grade.objects.create(student=student, subject=self.subject, term=self.term, advising_status='APPROVED')
+        return student
+
+    def test_balances_sessions_and_reports_overflow(self, django_capture_on_commit_callbacks):
+        picked = self.make_student()
+        PickingService().pick_schedule_regular(picked, self.term, 'PM')
+        regulars = [self.make_student() for _ in range(5)]
+        self.make_student(is_regular=False)
+        y2 = [self.make_student(year_level=2) for _ in range(2)]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            report = PickingService().auto_assign_remaining(self.term)
+
+        assert report['assigned'] == 6
+        assert report['overflow'] == 1
+        assert report['irregular_skipped'] == 1
+        assert [(c['year_level'], c['assigned'], c['overflow']) for c in report['clusters']] == [(1, 5, 0), (2, 1, 1)]
+        assert report['clusters'][1]['overflow_students'] == [y2[1].idn]
+
+        counts = dict(Section.objects.filter(term=self.term).values_list('name', 'student_count'))
+        assert counts == {'AUTO 1-1': 3, 'AUTO 1-2': 3, 'AUTO 2-1': 1}
+        assert SeatCounter.reconcile(term=self.term, dry_run=True) == []
+
+        for student in regulars:
+            assignment = SectionStudent.objects.get(student=student, term=self.term)
+            assert Grade.objects.get(student=student, term=self.term).section_id == assignment.section_id
+        assert AuditLog.objects.filter(model_name='SectionStudent', action='CREATE').count() == 7
+
+        # Both later placements in PM were balanced there, but only the last one found AM
+        # full, so only that student gets the redirection notice a regular pick would send
+        pm_students = list(SectionStudent.objects.filter(section=self.pm).exclude(student=picked).values_list('student__user', flat=True))
+        assert sorted(pm_students) == sorted([regulars[2].user_id, regulars[4].user_id])
+        notified = Notification.objects.filter(title="Session Assignment Changed").values_list('recipient', flat=True)
+        assert list(notified) == [regulars[4].user_id]
+
+    def test_skips_inactive_sections(self):
+        self.pm.is_active = False
+        self.pm.save()
+        student = self.make_student()
+
+        section, redirected = PickingService().pick_schedule_regular(student, self.term, 'PM', bypass_period_validation=True)
+        assert (section, redirected) == (self.am, True)
+
+        self.am.is_active = False
+        self.am.save()
+        late = self.make_student()
+        report = PickingService().auto_assign_remaining(self.term)
+        assert (report['assigned'], report['overflow']) == (0, 1)
+        assert not SectionStudent.objects.filter(student=late, term=self.term).exists()
+
+    def test_query_count_does_not_grow_with_students(self, django_assert_max_num_queries):
+        for _ in range(6):
+            self.make_student()
+
+        # enrollments, seated, sections, insert + audit, per-section grade update + counter
+        with django_assert_max_num_queries(12):
+            report = PickingService().auto_assign_remaining(self.term)
+
+        assert report['assigned'] == 6
+        assert not SectionStudent.objects.filter(term=self.term, section=self.y2).exists()
@@ -0,0 +1,90 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion
+from apps.scheduling.services.picking_service import PickingService
+from apps.scheduling.services.report_service import ReportService
+from apps.sections.models import Section, SectionStudent
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestCapacityBottleneckReport:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = Term.objects.create(
+            code='2024-CAP', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        self.bsa = Program.objects.create(code='CAPA', name='Cap A')
+        self.bsb = Program.objects.create(code='CAPB', name='Cap B')
+        self.idx = 0
+
+    def make_students(self, program, year_level, count, advising_status='APPROVED'):
+        curriculum, _ = CurriculumVersion.objects.get_or_create(program=program, version_name='V1')
+        students = []
+        for _ in range(count):
+            self.idx += 1
+            student = Student.objects.create(
+                user=User.objects.create(username=f'cap{self.idx}', email=f'cap{self.idx}@test.com', role='STUDENT'),
+                idn=f'24{self.idx:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='FEMALE', student_type='FRESHMAN'
+            )
+            StudentEnrollment.objects.create(
+                student=student, term=self.term, year_level=year_level, is_regular=True,
+                advising_status=advising_status
+            )
+            students.append(student)
+        return students
+
+    def make_section(self, program, year_level, number, max_students, is_active=True):
+        return Section.objects.create(
+            name=f'{program.code} {year_level}-{number}', term=self.term, program=program, year_level=year_level,
+            section_number=number, session='AM', max_students=max_students, is_active=is_active
+        )
+
+    def test_groups_waiting_students_against_open_seats(self, django_assert_num_queries):
+        seated = self.make_students(self.bsa, 1, 3)
+        self.make_students(self.bsa, 1, 4)
+        self.make_students(self.bsa, 2, 2)
+        self.make_students(self.bsb, 1, 5, advising_status='PENDING')
+        section = self.make_section(self.bsa, 1, 1, max_students=5)
+        self.make_section(self.bsa, 1, 2, max_students=1)
+        self.make_section(self.bsa, 1, 3, max_students=40, is_active=False)
+        for student in seated:
+            SectionStudent.objects.create(student=student, section=section, term=self.term)
+
+        with django_assert_num_queries(1):
+            report = ReportService.get_capacity_bottlenecks(self.term)
+
+        assert report == [
+            {
+                'program_id': self.bsa.id, 'program_name': 'Cap A', 'program_code': 'CAPA', 'year_level': 1,
+                'students_waiting': 4, 'available_slots': 3, 'existing_sections_count': 2,
+                'sections_needed': 1, 'deficit': 1, 'needs_assignment_only': False,
+            },
+            {
+                'program_id': self.bsa.id, 'program_name': 'Cap A', 'program_code': 'CAPA', 'year_level': 2,
+                'students_waiting': 2, 'available_slots': 0, 'existing_sections_count': 0,
+                'sections_needed': 1, 'deficit': 2, 'needs_assignment_only': False,
+            },
+        ]
+
+    def test_cached_variant_is_dropped_after_distribution(self, django_assert_num_queries):
+        self.make_students(self.bsb, 1, 2)
+        self.make_section(self.bsb, 1, 1, max_students=10)
+
+        first = ReportService.get_capacity_bottlenecks_cached(self.term)
+        with django_assert_num_queries(0):
+            assert ReportService.get_capacity_bottlenecks_cached(self.term) == first
+        assert first[0]['needs_assignment_only'] is True
+
+        PickingService().auto_assign_remaining(self.term)
+
+        assert ReportService.get_capacity_bottlenecks_cached(self.term) == []
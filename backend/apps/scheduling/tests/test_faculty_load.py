@@ -0,0 +1,143 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.facilities.models import Room
+from apps.faculty.models import FacultyLoad, Professor
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.report_service import ReportService
+from apps.scheduling.services.scheduling_service import SchedulingService
+from apps.sections.models import Section
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestFacultyLoadReports:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = Term.objects.create(
+            code='2024-LOAD', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        self.program = Program.objects.create(code='LOAD', name='Load Test')
+        self.curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.room = Room.objects.create(name='Load 101', room_type='LECTURE', capacity=40)
+        self.section = self.make_section(1)
+        self.idx = 0
+
+    def make_section(self, number):
+        return Section.objects.create(
+            name=f'LOAD 1-{number}', term=self.term, program=self.program, year_level=1,
+            section_number=number, session='AM'
+        )
+
+    def make_professor(self, status='FULL_TIME', is_active=True):
+        self.idx += 1
+        user = User.objects.create(
+            username=f'loadprof{self.idx}', email=f'loadprof{self.idx}@test.com', role='PROFESSOR',
+            first_name='Prof', last_name=f'Load{self.idx}'
+        )
+        return Professor.objects.create(
+            user=user, employee_id=f'LOAD-{self.idx:03d}', department='IT',
+            date_of_birth=date(1980, 1, 1), employment_status=status, is_active=is_active
+        )
+
+    def make_subject(self, code, hours):
+        return Subject.objects.create(
+            curriculum=self.curriculum, code=code, description=code, year_level=1,
+            semester='1', total_units=3, hrs_per_week=hours
+        )
+
+    def test_reports_run_one_query_each(self, django_assert_num_queries):
+        profs = [self.make_professor(status) for status in ('FULL_TIME', 'PART_TIME', 'FULL_TIME')]
+        self.make_professor(is_active=False)
+        sections = [self.section] + [self.make_section(n) for n in (2, 3)]
+        for i, section in enumerate(sections):
+            for j, prof in enumerate(profs[:2]):
+                Schedule.objects.create(
+                    term=self.term, section=section, subject=self.make_subject(f'LD{i}{j}', 3 + j * 7),
+                    component_type='LEC', professor=prof, room=self.room if i else None,
+                    days=['M'], start_time=time(8 + j * 2), end_time=time(10 + j * 2)
+                )
+        Schedule.objects.create(term=self.term, section=sections[0], subject=self.make_subject('LDX', 3),
+                                component_type='LAB')
+
+        with django_assert_num_queries(1):
+            loads = {row['professor_id']: row for row in ReportService.get_faculty_load_report(self.term)}
+        assert set(loads) == {prof.id for prof in profs}
+        assert (loads[profs[0].id]['current_hours'], loads[profs[0].id]['is_underloaded']) == (9.0, True)
+        assert (loads[profs[1].id]['current_hours'], loads[profs[1].id]['is_underloaded']) == (30.0, False)
+        assert loads[profs[2].id]['current_hours'] == 0.0
+
+        with django_assert_num_queries(1):
+            completion = ReportService.get_section_completion_report(self.term)
+        assert [(row['assigned'], row['total']) for row in completion] == [(0, 3), (2, 2), (2, 2)]
+
+    def test_rollup_follows_assignments(self):
+        service = SchedulingService()
+        first, second = self.make_professor('PART_TIME'), self.make_professor()
+        long_subject = self.make_subject('LDLONG', 9)
+        slot = service.create_or_update_schedule(
+            self.term, self.section, long_subject, 'LEC', professor=first, room=self.room,
+            days=['M', 'W'], start_time=time(7), end_time=time(12)
+        )
+        service.create_or_update_schedule(
+            self.term, self.make_section(2), self.make_subject('LDSHORT', 4.5), 'LEC', professor=first,
+            room=self.room, days=['M'], start_time=time(13), end_time=time(17, 30)
+        )
+
+        load = FacultyLoad.objects.get(term=self.term, professor=first)
+        assert (load.total_hours, load.day_hours, load.section_count) == (13.5, {'M': 9.5, 'W': 5.0}, 2)
+        assert [w['code'] for w in load.warnings] == ['WEEKLY_OVERLOAD', 'DAILY_OVERLOAD']
+
+        # Reassigning the slot moves its hours to the new professor
+        service.create_or_update_schedule(
+            self.term, self.section, long_subject, 'LEC', professor=second, room=self.room,
+            days=['M', 'W'], start_time=time(7), end_time=time(12), exclude_id=slot.id
+        )
+        load.refresh_from_db()
+        assert (load.total_hours, load.day_hours, load.warnings) == (4.5, {'M': 4.5}, [])
+
+        rollup = {row['professor_id']: row for row in ReportService.get_faculty_load_rollup(self.term)}
+        assert rollup[second.id]['day_hours'] == {'M': 5.0, 'W': 5.0}
+        assert rollup[second.id]['is_overloaded'] is False
+
+        Schedule.objects.filter(subject=long_subject).delete()
+        assert FacultyLoad.objects.get(term=self.term, professor=second).total_hours == 0
+
+    def test_rollup_is_built_on_first_read(self, django_assert_max_num_queries):
+        prof = self.make_professor()
+        Schedule.objects.create(term=self.term, section=self.section, subject=self.make_subject('LDB', 3),
+                                component_type='LEC', professor=prof)
+        # Rows missing for any reason (e.g. written before the rollup existed)
+        FacultyLoad.objects.all().delete()
+
+        rows = ReportService.get_faculty_load_rollup(self.term)
+        assert [(row['professor_id'], row['current_hours'], row['day_hours']) for row in rows] == [(prof.id, 3.0, {})]
+
+        # missing-professor check plus the rollup read
+        with django_assert_max_num_queries(2):
+            assert ReportService.get_faculty_load_rollup(self.term) == rows
+
+    def test_api_edits_refresh_the_rollup(self):
+        first, second = self.make_professor(), self.make_professor()
+        slot = Schedule.objects.create(term=self.term, section=self.section, subject=self.make_subject('LDAPI', 3),
+                                       component_type='LEC', professor=first)
+        assert FacultyLoad.objects.get(term=self.term, professor=first).total_hours == 3.0
+
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create(username='loaddean', email='loaddean@test.com', role='DEAN'))
+        response = client.patch(f'/api/scheduling/{slot.id}/', {
+            'professor': second.id, 'days': ['T'], 'start_time': '08:00', 'end_time': '11:00'
+        }, format='json')
+        assert response.status_code == 200
+
+        rollup = {row['professor_id']: row for row in ReportService.get_faculty_load_rollup(self.term)}
+        assert rollup[first.id]['current_hours'] == 0.0
+        assert (rollup[second.id]['current_hours'], rollup[second.id]['day_hours']) == (3.0, {'T': 3.0})
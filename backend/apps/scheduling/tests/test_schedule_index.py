@@ -0,0 +1,116 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.facilities.models import Room
+from apps.faculty.models import Professor
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.report_service import ReportService
+from apps.scheduling.services.schedule_index import ScheduleIndex
+from apps.scheduling.services.scheduling_service import SchedulingService
+from apps.sections.models import Section
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestScheduleIndex:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        program = Program.objects.create(code='BSIDX', name='BS Index Test')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        self.term = Term.objects.create(
+            code='2024-1-IDX', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        self.subjects = [
+            Subject.objects.create(curriculum=curriculum, code=f'IDX{i}', description=f'Index {i}',
+                                   year_level=1, semester='1', lec_units=3, total_units=3)
+            for i in range(4)
+        ]
+        self.professors = [
+            Professor.objects.create(
+                user=User.objects.create(username=f'idxprof{i}', last_name=f'Prof{i}', email=f'idx{i}@test.com'),
+                employee_id=f'E-IDX{i}', department='IT', date_of_birth=date(1980, 1, 1)
+            )
+            for i in range(3)
+        ]
+        self.rooms = [Room.objects.create(name=f'IDX-R{i}', room_type='LECTURE', capacity=40) for i in range(3)]
+        self.sections = [
+            Section.objects.create(name=f'IDX {i}', term=self.term, program=program, year_level=1, section_number=i, session='AM')
+            for i in range(1, 3)
+        ]
+        self.service = SchedulingService()
+
+        # Prof0/R0 teach IDX0 to section 1 on M/W 8:00-10:00
+        self.busy = Schedule.objects.create(
+            term=self.term, section=self.sections[0], subject=self.subjects[0], professor=self.professors[0],
+            room=self.rooms[0], days=['M', 'W'], start_time=time(8, 0), end_time=time(10, 0)
+        )
+        # Long slot followed by a short one on the same room/day, to exercise the running max of ends
+        Schedule.objects.create(
+            term=self.term, section=self.sections[1], subject=self.subjects[1], room=self.rooms[1],
+            days=['T'], start_time=time(7, 0), end_time=time(12, 0)
+        )
+        Schedule.objects.create(
+            term=self.term, section=self.sections[1], subject=self.subjects[2], room=self.rooms[1],
+            days=['T'], start_time=time(8, 0), end_time=time(8, 30)
+        )
+
+    def test_find_conflict_matches_day_and_overlap(self):
+        index = ScheduleIndex.for_term(self.term)
+
+        assert index.find_conflict('professor', self.professors[0].id, ['W'], 9 * 60, 11 * 60).id == self.busy.id
+        assert index.find_conflict('professor', self.professors[0].id, ['T'], 9 * 60, 11 * 60) is None
+        # Touching intervals do not overlap
+        assert index.find_conflict('room', self.rooms[0].id, ['M'], 10 * 60, 11 * 60) is None
+        assert index.find_conflict('room', self.rooms[1].id, ['T'], 11 * 60, 13 * 60) is not None
+        assert index.find_conflict('section', self.sections[0].id, ['M'], 8 * 60, 9 * 60, exclude_id=self.busy.id) is None
+
+    def test_free_resources(self):
+        index = ScheduleIndex.for_term(self.term)
+        room_ids = [r.id for r in self.rooms]
+
+        assert index.free_resources('room', room_ids, ['M', 'T'], 9 * 60, 9 * 60 + 30) == [self.rooms[2].id]
+        assert index.free_resources('room', room_ids, ['F'], 9 * 60, 10 * 60) == room_ids
+
+    def test_conflict_payload_is_unchanged(self):
+        err = self.service.check_professor_conflict(
+            self.professors[0], self.term, ['M'], time(9, 0), time(11, 0)
+        )
+        assert err == {
+            "type": "professor_conflict",
+            "message": "Professor is currently using this slot:",
+            "time": "['M', 'W'] 08:00 - 10:00",
+            "subject": "IDX0 - Index 0",
+            "section": "IDX 1",
+            "professor": "Prof. Prof0",
+            "room": "IDX-R0"
+        }
+
+    def test_index_refreshes_after_schedule_save(self):
+        assert ScheduleIndex.for_term(self.term).is_free('professor', self.professors[1].id, ['F'], 8 * 60, 9 * 60)
+
+        self.service.create_or_update_schedule(
+            self.term, self.sections[0], self.subjects[3], 'LEC', professor=self.professors[1],
+            days=['F'], start_time=time(8, 0), end_time=time(9, 0)
+        )
+
+        assert not ScheduleIndex.for_term(self.term).is_free('professor', self.professors[1].id, ['F'], 8 * 60, 9 * 60)
+
+    def test_resource_availability_uses_constant_queries(self, django_assert_max_num_queries):
+        ScheduleIndex.for_term(self.term)
+
+        # fingerprint + professors + rooms
+        with django_assert_max_num_queries(3):
+            result = ReportService.check_resource_availability(
+                self.term, ['M'], time(8, 0), time(9, 0), None, self.service
+            )
+
+        availability = {p['id']: p['is_available'] for p in result['professors']}
+        assert availability[self.professors[0].id] is False
+        assert availability[self.professors[1].id] is True
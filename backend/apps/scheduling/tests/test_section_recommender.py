@@ -0,0 +1,115 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.grades.models import Grade
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.picking_service import PickingService
+from apps.scheduling.services.section_recommender import SectionRecommender
+from apps.sections.models import Section
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestSectionRecommender:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.program = Program.objects.create(code='REC', name='Recommender Test')
+        curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.term = Term.objects.create(
+            code='2024-REC', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30),
+            schedule_published=True
+        )
+        self.subjects = [
+            Subject.objects.create(curriculum=curriculum, code=f'REC{i}', description=f'Rec {i}',
+                                   year_level=1, semester='1', total_units=3)
+            for i in range(1, 4)
+        ]
+        self.a = self.make_section(1, 'AM', [('M', 8, 10), ('M', 10, 12), ('T', 8, 10)])
+        self.b = self.make_section(2, 'PM', [('W', 13, 15), ('M', 9, 11), ('M', 13, 15)])
+        self.full = self.make_section(3, 'AM', [('F', 8, 9), ('F', 9, 10), ('F', 10, 11)], max_students=0)
+
+        self.user = User.objects.create(username='recstudent', email='rec@test.com', role='STUDENT')
+        self.student = Student.objects.create(
+            user=self.user, idn='260001', program=self.program, curriculum=curriculum,
+            date_of_birth=date(2005, 1, 1), gender='MALE', student_type='TRANSFEREE'
+        )
+        StudentEnrollment.objects.create(
+            student=self.student, term=self.term, year_level=1, is_regular=False, advising_status='APPROVED'
+        )
+        for subject in self.subjects:
+            Grade.objects.create(student=self.student, subject=subject, term=self.term, advising_status='APPROVED')
+
+    def make_section(self, number, session, slots, max_students=40):
+        section = Section.objects.create(
+            name=f'REC 1-{number}', term=self.term, program=self.program, year_level=1,
+            section_number=number, session=session, max_students=max_students
+        )
+        for subject, (day, start, end) in zip(self.subjects, slots):
+            Schedule.objects.create(
+                term=self.term, section=section, subject=subject, component_type='LEC',
+                days=[day], start_time=time(start), end_time=time(end)
+            )
+        return section
+
+    def sections_of(self, recommendation):
+        return [item['section_id'] for item in recommendation['selections']]
+
+    def test_rankings_and_full_sections(self):
+        compact = SectionRecommender.recommend(self.student, self.term, rank='compact', limit=10)
+        days = SectionRecommender.recommend(self.student, self.term, rank='days', limit=10)
+
+        a, b = self.a.id, self.b.id
+        assert self.sections_of(compact['recommendations'][0]) == [a, a, a]
+        assert compact['recommendations'][0]['campus_minutes'] == 360
+        assert self.sections_of(days['recommendations'][0]) == [a, a, b]
+        assert days['recommendations'][0]['days'] == ['M']
+        assert compact['exhaustive'] and compact['unavailable'] == []
+
+        # 8 combinations minus the two where REC1 (A, M 8-10) meets REC2 (B, M 9-11)
+        assert len(compact['recommendations']) == 6
+        for recommendation in compact['recommendations']:
+            assert self.full.id not in self.sections_of(recommendation)
+
+    def test_recommendation_is_accepted_by_the_picker(self):
+        best = SectionRecommender.recommend(self.student, self.term, rank='days', limit=1)
+        assert len(best['recommendations']) == 1
+
+        assert PickingService().pick_schedule_irregular(
+            self.student, self.term, best['recommendations'][0]['selections']
+        ) is True
+
+    def test_offerings_are_cached_and_refreshed_on_schedule_change(self, django_assert_max_num_queries):
+        SectionRecommender.recommend(self.student, self.term)
+        # grades, fingerprint, open sections
+        with django_assert_max_num_queries(3):
+            SectionRecommender.recommend(self.student, self.term)
+
+        Schedule.objects.filter(section=self.b).delete()
+        report = SectionRecommender.recommend(self.student, self.term, limit=10)
+        assert {tuple(self.sections_of(r)) for r in report['recommendations']} == {(self.a.id,) * 3}
+
+    def test_endpoint_is_student_only(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = '/api/scheduling/recommend-sections/'
+
+        response = client.get(url, {'term_id': self.term.id, 'rank': 'days', 'limit': 2})
+        assert response.status_code == 200
+        assert len(response.data['recommendations']) == 2
+        assert client.get(url, {'term_id': self.term.id, 'rank': 'latest'}).status_code == 400
+
+        client.force_authenticate(user=User.objects.create(username='recdean', email='d@test.com', role='DEAN'))
+        assert client.get(url, {'term_id': self.term.id}).status_code == 403
+
+        # A STUDENT account without a Student record is a bad request, not a server error
+        client.force_authenticate(user=User.objects.create(username='recorphan', email='o@test.com', role='STUDENT'))
+        assert client.get(url, {'term_id': self.term.id}).status_code == 400
@@ -0,0 +1,93 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.facilities.models import Room
+from apps.faculty.models import Professor
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.scheduling_service import SchedulingService
+from apps.scheduling.services.timetable import TimetableProjection
+from apps.sections.models import Section
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestTimetableProjection:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = Term.objects.create(
+            code='2024-TT', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        program = Program.objects.create(code='TT', name='Timetable Test')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        self.rooms = [Room.objects.create(name=f'TT {i}', room_type='LECTURE', capacity=40) for i in range(3)]
+        user = User.objects.create(username='ttprof', email='ttprof@test.com', role='PROFESSOR', last_name='Cruz')
+        self.professor = Professor.objects.create(
+            user=user, employee_id='TT-001', department='IT', date_of_birth=date(1980, 1, 1)
+        )
+        self.section = Section.objects.create(
+            name='TT 1-1', term=self.term, program=program, year_level=1, section_number=1, session='AM'
+        )
+        self.slots = []
+        for i, room in enumerate(self.rooms):
+            subject = Subject.objects.create(curriculum=curriculum, code=f'TT{i}', description=f'Topic {i}',
+                                             year_level=1, semester='1', total_units=3)
+            self.slots.append(Schedule.objects.create(
+                term=self.term, section=self.section, subject=subject, component_type='LEC',
+                professor=self.professor if i < 2 else None, room=room,
+                days=['M', 'W'] if i else ['M'], start_time=time(10 - i * 2), end_time=time(11 - i * 2)
+            ))
+        Schedule.objects.create(term=self.term, section=self.section, subject=subject, component_type='LAB')
+
+    def test_matches_the_insight_format_from_one_query(self, django_assert_num_queries):
+        # fingerprint and the joined schedule query
+        with django_assert_num_queries(2):
+            timetable = TimetableProjection.for_entity(self.term, 'section', self.section.id)
+
+        assert timetable == SchedulingService.get_schedule_insights(Schedule.objects.filter(section=self.section))
+        assert [entry['subject'] for entry in timetable['Monday']] == ['TT2 - Topic 2', 'TT1 - Topic 1', 'TT0 - Topic 0']
+        assert timetable['Monday'][0]['professor'] == 'TBA'
+        assert timetable['Wednesday'][1] == {
+            'id': self.slots[1].id, 'time': '08:00 - 09:00', 'subject': 'TT1 - Topic 1',
+            'section': 'TT 1-1', 'room': 'TT 1', 'professor': 'Prof. Cruz',
+        }
+
+        with django_assert_num_queries(1):
+            assert TimetableProjection.for_entity(self.term, 'section', self.section.id) == timetable
+
+    def test_bulk_variant_and_invalidation(self, django_assert_num_queries):
+        room_ids = [room.id for room in self.rooms]
+        with django_assert_num_queries(2):
+            timetables = TimetableProjection.for_entities(self.term, 'room', room_ids)
+        assert [len(timetables[room_id]['Monday']) for room_id in room_ids] == [1, 1, 1]
+
+        self.slots[0].room = self.rooms[1]
+        self.slots[0].save()
+
+        timetables = TimetableProjection.for_entities(self.term, 'room', room_ids)
+        assert [len(timetables[room_id]['Monday']) for room_id in room_ids] == [0, 2, 1]
+
+        with pytest.raises(ValueError):
+            TimetableProjection.for_entities(self.term, 'building', room_ids)
+
+    def test_insight_endpoints(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create(username='ttdean', email='ttdean@test.com', role='DEAN'))
+
+        response = client.get(f'/api/scheduling/insights/professor/{self.professor.id}/', {'term_id': self.term.id})
+        assert response.status_code == 200
+        assert len(response.data['Wednesday']) == 1
+
+        response = client.get('/api/scheduling/insights/bulk/', {
+            'term_id': self.term.id, 'kind': 'room', 'ids': ','.join(str(room.id) for room in self.rooms)
+        })
+        assert response.status_code == 200
+        assert set(response.data) == {str(room.id) for room in self.rooms}
+        assert client.get('/api/scheduling/insights/bulk/', {'term_id': self.term.id, 'kind': 'room'}).status_code == 400
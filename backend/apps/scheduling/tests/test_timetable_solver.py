@@ -0,0 +1,182 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.faculty.models import Professor, ProfessorAvailability, ProfessorSubject
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.scheduling_service import SchedulingService
+from apps.scheduling.services.schedule_index import to_minutes
+from apps.scheduling.services.timetable_solver import Block, TermTimetableSolver
+from apps.sections.models import Section
+from apps.terms.models import Term
+from core.exceptions import ConflictError
+
+User = get_user_model()
+
+
+def make_block(section_id, subject_id, minutes, professors=(None,), session='AM'):
+    return Block(
+        section_id=section_id, session=session, subject_id=subject_id, slots=[], minutes=minutes,
+        grid_start=7 * 60, grid_end=13 * 60, professors=list(professors), rooms=[None],
+    )
+
+
+class TestTermTimetableSolver:
+    def test_shared_professor_is_never_double_booked(self):
+        # Prof 1 teaches 4h in both sections but is only available on Monday and Tuesday mornings
+        blocks = [make_block(1, 10, 240, professors=[1]), make_block(2, 10, 240, professors=[1])]
+        constraints = {'index': None, 'prof_availabilities': {1: [('M', 'AM'), ('T', 'AM')]}}
+
+        result = TermTimetableSolver(blocks, constraints, respect_professor=True, seed=1).solve()
+
+        assert result.unsatisfied == []
+        days = sorted(placement.day for _, placement in result.placements)
+        assert days == ['M', 'T']
+
+    def test_backtracks_out_of_a_dead_end(self):
+        # Section 1's block can use prof 1 or 2; section 2's block can only use prof 1.
+        # Both profs teach Monday mornings only, so section 1 must take prof 2.
+        blocks = [make_block(1, 10, 360, professors=[1, 2]), make_block(2, 11, 360, professors=[1])]
+        constraints = {'index': None, 'prof_availabilities': {1: [('M', 'AM')], 2: [('M', 'AM')]}}
+
+        result = TermTimetableSolver(blocks, constraints, respect_professor=True, seed=3).solve()
+
+        assert result.unsatisfied == []
+        profs = {block.section_id: placement.professor_id for block, placement in result.placements}
+        assert profs == {1: 2, 2: 1}
+
+    def test_same_seed_gives_same_timetable(self):
+        blocks = [make_block(s, subj, 180) for s in range(1, 4) for subj in range(1, 5)]
+        constraints = {'index': None, 'prof_availabilities': {}}
+
+        first = TermTimetableSolver(blocks, constraints, seed=42).solve().placements
+        second = TermTimetableSolver(blocks, constraints, seed=42).solve().placements
+
+        assert first == second
+
+    def test_unplaceable_blocks_are_reported(self):
+        blocks = [make_block(1, 10, 120, professors=[9]), make_block(1, 11, 120)]
+        constraints = {'index': None, 'prof_availabilities': {}}
+
+        result = TermTimetableSolver(blocks, constraints, respect_professor=True, seed=0).solve()
+
+        assert [(b.subject_id, reason) for b, reason in result.unsatisfied] == [(10, 'constraints')]
+        assert [b.subject_id for b, _ in result.placements] == [11]
+
+
+@pytest.mark.django_db
+class TestRandomizeTermSchedule:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        program = Program.objects.create(code='BSSLV', name='BS Solver Test')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        self.term = Term.objects.create(
+            code='2024-1-SLV', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        self.subjects = [
+            Subject.objects.create(curriculum=curriculum, code=f'SLV{i}', description=f'Solver {i}',
+                                   year_level=1, semester='1', lec_units=3, total_units=3)
+            for i in range(3)
+        ]
+        self.professor = Professor.objects.create(
+            user=User.objects.create(username='slvprof', last_name='Solver', email='slv@test.com'),
+            employee_id='E-SLV', department='IT', date_of_birth=date(1980, 1, 1)
+        )
+        ProfessorAvailability.objects.create(professor=self.professor, day='M', session='AM')
+        ProfessorSubject.objects.create(professor=self.professor, subject=self.subjects[0])
+
+        self.sections = [
+            Section.objects.create(name=f'SLV {i}', term=self.term, program=program, year_level=1,
+                                   section_number=i, session='AM')
+            for i in range(1, 4)
+        ]
+        for section in self.sections:
+            for subject in self.subjects:
+                Schedule.objects.create(term=self.term, section=section, subject=subject, component_type='LEC')
+
+    def test_places_every_section_without_conflicts(self):
+        report = SchedulingService.randomize_term_schedule(self.term, seed=5)
+
+        assert report['complete'] is True
+        assert report['blocks'] == report['placed'] == 9
+        for section in self.sections:
+            slots = list(Schedule.objects.filter(section=section))
+            assert all(s.days and s.start_time for s in slots)
+            for a in slots:
+                for b in slots:
+                    if a.id < b.id and a.days == b.days:
+                        assert to_minutes(a.end_time) <= to_minutes(b.start_time) or to_minutes(b.end_time) <= to_minutes(a.start_time)
+
+    def test_writes_are_batched(self, django_assert_max_num_queries):
+        # fingerprint, slot load, savepoint pair, lock, bulk update, audit insert
+        with django_assert_max_num_queries(7):
+            SchedulingService.randomize_term_schedule(self.term, seed=5)
+
+        entries = AuditLog.objects.filter(model_name='Schedule', action='UPDATE')
+        assert entries.count() == 9
+        assert all(entry.changes['days']['old'] == '[]' for entry in entries)
+
+    def test_refuses_to_save_over_a_change_made_during_the_solve(self, monkeypatch):
+        edited = Schedule.objects.filter(section=self.sections[0]).first()
+        solve = TermTimetableSolver.solve
+
+        def solve_then_edit(solver):
+            result = solve(solver)
+            # A registrar assigns a professor while the solver runs
+            edited.professor = self.professor
+            edited.save()
+            return result
+
+        monkeypatch.setattr(TermTimetableSolver, 'solve', solve_then_edit)
+        with pytest.raises(ConflictError):
+            SchedulingService.randomize_term_schedule(self.term, seed=5)
+
+        edited.refresh_from_db()
+        assert edited.professor_id == self.professor.id
+        assert not Schedule.objects.filter(term=self.term, start_time__isnull=False).exists()
+
+    def test_section_randomizer_saves_in_bulk(self, django_assert_max_num_queries):
+        section = self.sections[0]
+
+        # savepoint pair, slot load, clear, bulk update, audit insert, result
+        with django_assert_max_num_queries(7):
+            list(SchedulingService.randomize_section_schedule(self.term, section))
+
+        assert not Schedule.objects.filter(section=section, start_time__isnull=True).exists()
+        assert AuditLog.objects.filter(model_name='Schedule', action='UPDATE').count() == 3
+
+    def test_reports_slots_the_professor_cannot_cover(self):
+        # One professor is qualified for SLV0 and teaches only Monday mornings: 6h for three 3h blocks
+        report = SchedulingService.randomize_term_schedule(self.term, respect_professor=True, seed=5)
+
+        assert report['placed'] == 8
+        assert report['complete'] is False
+        assert [u['subject'] for u in report['unsatisfied']] == ['SLV0']
+        assert report['unsatisfied'][0]['reason'] == "professor availability or existing schedule conflicts."
+
+        placed = Schedule.objects.filter(subject=self.subjects[0], start_time__isnull=False)
+        assert placed.count() == 2
+        assert set(placed.values_list('professor_id', flat=True)) == {self.professor.id}
+        assert sorted(to_minutes(s.start_time) for s in placed) == [7 * 60, 10 * 60]
+
+    def test_endpoint_scope_term_returns_report_and_audits(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_superuser(username='slvdean', email='d@test.com', password='p'))
+
+        response = client.post(
+            reverse('schedule-randomize'),
+            {'term_id': self.term.id, 'scope': 'term', 'seed': 11},
+            format='json'
+        )
+
+        assert response.status_code == 200
+        assert response.data['seed'] == 11
+        assert response.data['placed'] == 9
+        assert AuditLog.objects.filter(model_name='Term', object_id=str(self.term.id), action='UPDATE').exists()
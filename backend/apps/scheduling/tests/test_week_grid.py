@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from datetime import time
+
+from apps.scheduling.services.week_grid import WeekGrid, slot_mask
+from apps.scheduling.services.picking_service import PickingService
+from apps.sections.services.sectioning_service import _allocate_slots
+
+
+def make_schedule(days, start, end):
+    return SimpleNamespace(days=days, start_time=start, end_time=end)
+
+
+class TestWeekGrid:
+    def test_slot_mask_is_per_day(self):
+        assert slot_mask(['M'], 480, 540) & slot_mask(['T'], 480, 540) == 0
+        assert slot_mask(['M'], 480, 540) & slot_mask(['M'], 510, 600)
+        assert slot_mask(['M'], 480, 480) == 0
+
+    def test_overlaps_and_touching_slots(self):
+        taken = WeekGrid.from_schedules([make_schedule(['M', 'W'], time(8, 0), time(10, 0))])
+
+        assert taken.overlaps(WeekGrid.from_schedules([make_schedule(['W'], time(9, 0), time(11, 0))]))
+        assert not taken.overlaps(WeekGrid.from_schedules([make_schedule(['W'], time(10, 0), time(11, 0))]))
+        assert not taken.overlaps(WeekGrid.from_schedules([make_schedule(['T'], time(8, 0), time(10, 0))]))
+
+    def test_unaligned_times_use_exact_ranges(self):
+        # 8:00-8:50 and 8:50-9:40 share the 8:45 slot but do not overlap
+        taken = WeekGrid()
+        taken.add(['F'], 480, 530)
+
+        assert taken.is_free(['F'], 530, 580)
+        assert not taken.is_free(['F'], 529, 580)
+        assert taken.minutes_on('F') == 50
+        assert taken.ranges_on('F') == [(480, 530)]
+
+    def test_discard_keeps_slots_shared_with_other_ranges(self):
+        grid = WeekGrid()
+        grid.add(['M'], 480, 530)
+        grid.add(['M'], 530, 600)
+        grid.discard(['M'], 480, 530)
+
+        assert grid.is_free(['M'], 480, 530)
+        assert not grid.is_free(['M'], 525, 540)
+        assert grid.mask == slot_mask(['M'], 530, 600)
+
+    def test_untimed_schedules_are_ignored(self):
+        grid = WeekGrid.from_schedules([make_schedule(['M'], None, None)])
+        assert grid.mask == 0
+
+    def test_picker_conflict_check(self):
+        taken = WeekGrid.from_schedules([make_schedule(['TH'], time(13, 0), time(14, 30))])
+
+        assert PickingService._has_conflict([make_schedule(['TH'], time(14, 0), time(15, 0))], taken)
+        assert not PickingService._has_conflict([make_schedule(['TH'], time(14, 30), time(15, 0))], taken)
+
+    def test_sectioning_allocation_balances_days(self):
+        grid = WeekGrid()
+        first = _allocate_slots(grid, 'AM', 3)
+        second = _allocate_slots(grid, 'AM', 3)
+
+        assert first == (['M'], time(7, 0), time(10, 0))
+        assert second[0] != first[0]
+        assert _allocate_slots(grid, 'AM', 6) is None
@@ -18,10 +18,13 @@ from apps.scheduling.serializers import ScheduleSerializer
 from apps.scheduling.services.scheduling_service import SchedulingService
 from apps.scheduling.services.picking_service import PickingService
 from apps.scheduling.services.report_service import ReportService
+from apps.scheduling.services.section_recommender import SectionRecommender
+from apps.scheduling.services.timetable import TimetableProjection
 from apps.sections.models import Section
 from apps.faculty.models import Professor
 from apps.facilities.models import Room
 from apps.terms.models import Term
+from core.exceptions import ConflictError
 
 class ScheduleViewSet(viewsets.ModelViewSet):
     """
@@ -40,7 +43,7 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         """
         Dynamically applies Dean-only permissions for writing and administrative actions.
         """
-        dean_actions = ['create', 'update', 'partial_update', 'destroy', 'assign', 'publish', 'randomize', 'pending_slots', 'section_completion', 'faculty_load_report', 'capacity_bottlenecks', 'sectioning_report', 'distribute_students', 'validate_slot', 'resource_availability', 'available_slots', 'professor_insights', 'room_insights', 'section_insights']
+        dean_actions = ['create', 'update', 'partial_update', 'destroy', 'assign', 'publish', 'randomize', 'pending_slots', 'section_completion', 'faculty_load_report', 'capacity_bottlenecks', 'sectioning_report', 'distribute_students', 'validate_slot', 'resource_availability', 'available_slots', 'professor_insights', 'room_insights', 'section_insights', 'bulk_insights']
         if self.action in dean_actions:
             from core.permissions import IsDean
             return [IsDean()]
@@ -101,9 +104,26 @@ class ScheduleViewSet(viewsets.ModelViewSet):
     def randomize(self, request):
         """
         Automatically randomizes Day/Time assignments for a whole section.
+        With `scope=term`, every active section of the term is solved at once and a
+        solve report (including unsatisfied blocks) is returned instead of the slots.
         """
         try:
             term = self._get_term(request.data.get('term_id'))
+            if request.data.get('scope') == 'term':
+                report = SchedulingService.randomize_term_schedule(
+                    term,
+                    respect_professor=request.data.get('respect_professor', False),
+                    respect_room=request.data.get('respect_room', False),
+                    seed=request.data.get('seed'),
+                    time_budget=request.data.get('time_budget')
+                )
+                term.audit_action(
+                    request, 'UPDATE', f'Term:{term.id}',
+                    f'Term timetable generated for {term.code}: {report["placed"]}/{report["blocks"]} blocks placed',
+                    metadata={key: report[key] for key in ('seed', 'sections', 'blocks', 'placed', 'complete', 'budget_exhausted')}
+                )
+                return Response(report)
+
             section = Section.objects.get(id=request.data.get('section_id'))
             updated = SchedulingService.randomize_section_schedule(
                 term, section, 
@@ -111,6 +131,8 @@ class ScheduleViewSet(viewsets.ModelViewSet):
                 respect_room=request.data.get('respect_room', False)
             )
             return Response(self.get_serializer(updated, many=True).data)
+        except ConflictError:
+            raise
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -155,6 +177,30 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['GET'], url_path='recommend-sections')
+    def recommend_sections(self, request):
+        """
+        Irregular students: top conflict-free section combinations for their approved
+        subjects, ranked by `rank` ('compact' or 'days'). Read-only; nothing is reserved.
+        Usage: GET /api/scheduling/recommend-sections/?term_id={id}&rank=days&limit=5
+        """
+        if request.user.role != 'STUDENT':
+            raise PermissionDenied("Unauthorized")
+        student = getattr(request.user, 'student_profile', None)
+        if student is None:
+            raise ValidationError({'error': 'No student record is linked to this account.'})
+        term = self._get_term(request.query_params.get('term_id'))
+        try:
+            report = SectionRecommender.recommend(
+                student,
+                term,
+                rank=request.query_params.get('rank', 'compact'),
+                limit=request.query_params.get('limit', SectionRecommender.DEFAULT_LIMIT)
+            )
+        except ValueError as e:
+            raise ValidationError({'error': str(e)})
+        return Response(report)
+
     @action(detail=False, methods=['GET'], url_path='status-matrix')
     def status_matrix(self, request):
         """
@@ -168,10 +214,11 @@ class ScheduleViewSet(viewsets.ModelViewSet):
     def publish(self, request):
         """
         Dean publishes the entire term schedule.
+        Student notifications are sent after the publish transaction commits.
         """
         try:
             term = self._get_term(request.data.get('term_id'))
-            SchedulingService.publish_schedule(term)
+            SchedulingService.publish_schedule(term, defer_notifications=True)
             return Response({"message": f"Schedule Published for {term.code}"})
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -219,8 +266,13 @@ class ScheduleViewSet(viewsets.ModelViewSet):
     def faculty_load_report(self, request):
         """
         Retrieves current teaching hours vs target for faculty.
+        Pass `daily=true` for the FacultyLoad rollup (per-day hours and overload
+        warnings); add `refresh=true` to recompute it first.
         """
         term = self._get_term(request.query_params.get('term_id'))
+        if request.query_params.get('daily') in ('1', 'true'):
+            refresh = request.query_params.get('refresh') in ('1', 'true')
+            return Response(self.report_service.get_faculty_load_rollup(term, refresh=refresh))
         return Response(self.report_service.get_faculty_load_report(term))
 
     def _get_term(self, term_id):
@@ -236,9 +288,11 @@ class ScheduleViewSet(viewsets.ModelViewSet):
     def capacity_bottlenecks(self, request):
         """
         Reporting: Capacity bottlenecks (students without slots).
+        Served from a short-lived cache; pass `refresh=true` to recompute.
         """
         term = self._get_term(request.query_params.get('term_id'))
-        return Response(self.report_service.get_capacity_bottlenecks(term))
+        refresh = request.query_params.get('refresh') in ('1', 'true')
+        return Response(self.report_service.get_capacity_bottlenecks_cached(term, refresh=refresh))
 
     @action(detail=False, methods=['GET'], url_path='sectioning-report')
     def sectioning_report(self, request):
@@ -255,11 +309,19 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         """
         try:
             term = self._get_term(request.data.get('term_id'))
-            assigned_count = self.picking_service.auto_assign_remaining(term)
+            report = self.picking_service.auto_assign_remaining(term)
+            term.audit_action(
+                request, 'UPDATE', f'Term:{term.id}',
+                f"Distributed {report['assigned']} students to sections for {term.code}",
+                {'assigned': report['assigned'], 'overflow': report['overflow']}
+            )
             
             return Response({
-                "message": f"Successfully distributed {assigned_count} students to sections.",
-                "count": assigned_count
+                "message": f"Successfully distributed {report['assigned']} students to sections.",
+                "count": report['assigned'],
+                "overflow": report['overflow'],
+                "irregular_skipped": report['irregular_skipped'],
+                "clusters": report['clusters']
             })
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -347,8 +409,7 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         if not term_id:
             return Response({'error': 'term_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        schedules = Schedule.objects.filter(term_id=term_id, professor_id=prof_id)
-        return Response(self.scheduling_service.get_schedule_insights(schedules))
+        return Response(TimetableProjection.for_entity(term_id, 'professor', prof_id))
 
     @action(detail=False, methods=['GET'], url_path=r'insights/room/(?P<room_id>\d+)')
     def room_insights(self, request, room_id=None):
@@ -360,8 +421,7 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         if not term_id:
             return Response({'error': 'term_id is required'}, status=status.HTTP_400_BAD_REQUEST)
             
-        schedules = Schedule.objects.filter(term_id=term_id, room_id=room_id)
-        return Response(self.scheduling_service.get_schedule_insights(schedules))
+        return Response(TimetableProjection.for_entity(term_id, 'room', room_id))
 
     @action(detail=False, methods=['GET'], url_path=r'insights/section/(?P<section_id>\d+)')
     def section_insights(self, request, section_id=None):
@@ -369,5 +429,30 @@ class ScheduleViewSet(viewsets.ModelViewSet):
         Returns a timetable-ready grouped view of a specific section's full schedule.
         Usage: GET /api/scheduling/insights/section/{id}/
         """
-        schedules = Schedule.objects.filter(section_id=section_id)
-        return Response(self.scheduling_service.get_schedule_insights(schedules))
+        term_id = Section.objects.filter(id=section_id).values_list('term_id', flat=True).first()
+        if term_id is None:
+            return Response(TimetableProjection.project([]))
+        return Response(TimetableProjection.for_entity(term_id, 'section', section_id))
+
+    @action(detail=False, methods=['GET'], url_path='insights/bulk')
+    def bulk_insights(self, request):
+        """
+        Returns the timetables of many professors, rooms or sections of a term in one call.
+        Usage: GET /api/scheduling/insights/bulk/?term_id={term_id}&kind=room&ids=1,2,3
+        """
+        term_id = request.query_params.get('term_id')
+        kind = request.query_params.get('kind')
+        try:
+            ids = [int(value) for value in request.query_params.get('ids', '').split(',') if value.strip()]
+        except ValueError:
+            return Response({'error': 'ids must be a comma-separated list of numbers'}, status=status.HTTP_400_BAD_REQUEST)
+        if not term_id or not ids:
+            return Response({'error': 'term_id and ids are required'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > TimetableProjection.BULK_LIMIT:
+            return Response({'error': f'At most {TimetableProjection.BULK_LIMIT} ids per request'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            timetables = TimetableProjection.for_entities(term_id, kind, ids)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({str(entity_id): timetable for entity_id, timetable in timetables.items()})
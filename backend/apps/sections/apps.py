@@ -5,3 +5,6 @@ class SectionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.sections"
     verbose_name = "Sections"
+
+    def ready(self):
+        import apps.sections.signals
@@ -0,0 +1,40 @@
+"""
+Management Command — Section Seat Counter Reconciliation
+File: apps/sections/management/commands/reconcile_section_counts.py
+
+Recounts SectionStudent rows and repairs any `Section.student_count` that drifted
+from them (e.g. after raw SQL, bulk writes or manual database fixes).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.terms.models import Term
+from apps.sections.services.seat_counter import SeatCounter
+
+
+class Command(BaseCommand):
+    help = 'Repairs Section.student_count counters that drifted from the actual SectionStudent rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--term', type=str, help='Term code to reconcile (defaults to every term).')
+        parser.add_argument('--dry-run', action='store_true', help='Only report drifted sections.')
+
+    def handle(self, *args, **options):
+        term = None
+        if options['term']:
+            term = Term.objects.filter(code=options['term']).first()
+            if not term:
+                raise CommandError(f"Term {options['term']} not found.")
+
+        drifted = SeatCounter.reconcile(term=term, dry_run=options['dry_run'])
+
+        for row in drifted:
+            self.stdout.write(
+                self.style.WARNING(f"  {row['name']}: counter {row['student_count']}, actual {row['actual']}")
+            )
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('All section counters match their assignments.'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} section counter(s) drifted (dry run, nothing changed).'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Repaired {len(drifted)} section counter(s).'))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_student_count(apps, schema_editor):
+    Section = apps.get_model('sections', 'Section')
+    SectionStudent = apps.get_model('sections', 'SectionStudent')
+    counts = SectionStudent.objects.filter(section=OuterRef('pk')).values('section').annotate(
+        total=Count('id')
+    ).values('total')
+    Section.objects.update(student_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sections', '0003_add_term_to_section_student'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='section',
+            name='student_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_student_count, migrations.RunPython.noop),
+    ]
@@ -22,6 +22,8 @@ class Section(AuditMixin, models.Model):
     
     target_students = models.PositiveSmallIntegerField(default=35)
     max_students = models.PositiveSmallIntegerField(default=40)
+    # Denormalized SectionStudent count, maintained by SeatCounter (see services/seat_counter.py)
+    student_count = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -30,6 +32,19 @@ class Section(AuditMixin, models.Model):
     class Meta:
         unique_together = ('term', 'program', 'year_level', 'section_number')
 
+    def save(self, *args, **kwargs):
+        """
+        Saves the section without ever writing `student_count` back on updates: the
+        counter is changed by concurrent conditional UPDATEs, so the in-memory value
+        may be stale.
+        """
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'student_count'
+            ]
+        return super().save(*args, **kwargs)
+
     def __str__(self):
         """
         Returns a human readable section name.
@@ -1,3 +1,4 @@
+from django.db.models import Count, Q
 from rest_framework import serializers
 from apps.sections.models import Section, SectionStudent
 
@@ -10,9 +11,25 @@ class SectionSerializer(serializers.ModelSerializer):
     program_name = serializers.CharField(source='program.name', read_only=True)
 
     def get_student_count(self, obj):
-        return obj.student_assignments.count()
+        return obj.student_count
+
+    @staticmethod
+    def with_schedule_counts(queryset):
+        """
+        Annotates sections with the counts subject_count and scheduling_status are
+        computed from, so serializing many sections runs no per-section queries.
+        """
+        return queryset.select_related('program').annotate(
+            schedule_total=Count('schedules', distinct=True),
+            schedule_configured=Count('schedules', distinct=True, filter=(
+                Q(schedules__professor__isnull=False, schedules__start_time__isnull=False)
+                & ~Q(schedules__days=[])
+            ))
+        )
 
     def get_subject_count(self, obj):
+        if hasattr(obj, 'schedule_total'):
+            return obj.schedule_total
         return obj.schedules.count()
 
     def get_subject_schedules(self, obj):
@@ -39,15 +56,15 @@ class SectionSerializer(serializers.ModelSerializer):
         } for s in schedules]
 
     def get_scheduling_status(self, obj):
-        schedules = obj.schedules.all()
-        if not schedules.exists():
-            return 'UNSCHEDULED'
-        
-        total = schedules.count()
-        # Scheduled means has professor AND time/days
-        fully_configured = sum(1 for s in schedules if s.professor and s.days and s.start_time)
-        
-        if fully_configured == 0:
+        if hasattr(obj, 'schedule_total'):
+            total, fully_configured = obj.schedule_total, obj.schedule_configured
+        else:
+            schedules = list(obj.schedules.all())
+            total = len(schedules)
+            # Scheduled means has professor AND time/days
+            fully_configured = sum(1 for s in schedules if s.professor_id and s.days and s.start_time)
+
+        if total == 0 or fully_configured == 0:
             return 'UNSCHEDULED'
         if fully_configured < total:
             return 'PARTIAL'
@@ -0,0 +1,94 @@
+"""
+Richwell Portal — Section Seat Counters
+
+`Section.student_count` is a denormalized count of the section's SectionStudent rows.
+Picking reserves a seat with one conditional UPDATE
+(`... SET student_count = student_count + 1 WHERE student_count < max_students`), so
+overbooking is prevented by the database without locking or recounting the section.
+
+Every other SectionStudent write keeps the counter current through the signals in
+`apps/sections/signals.py`. Writes that bypass signals (queryset `.update()` of
+`section`, `bulk_create`) must adjust the counter themselves; any remaining drift is
+repaired by `python manage.py reconcile_section_counts`.
+"""
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+
+
+class SeatCounter:
+    @staticmethod
+    def reserve(section_id, override_capacity=False):
+        """
+        Takes one seat in a section if it is not full.
+
+        Args:
+            section_id (int): The section to reserve a seat in.
+            override_capacity (bool): Take the seat even if the section is full.
+
+        Returns:
+            bool: True if the seat was taken.
+        """
+        sections = Section.objects.filter(id=section_id)
+        if not override_capacity:
+            sections = sections.filter(student_count__lt=F('max_students'))
+        return sections.update(student_count=F('student_count') + 1) == 1
+
+    @classmethod
+    def reserve_first(cls, section_ids):
+        """Reserves a seat in the first section of `section_ids` that still has one; returns its ID or None."""
+        for section_id in section_ids:
+            if cls.reserve(section_id):
+                return section_id
+        return None
+
+    @staticmethod
+    def add(section_id, count=1):
+        """Unconditionally adds `count` seats (assignments that were not reserved)."""
+        Section.objects.filter(id=section_id).update(student_count=F('student_count') + count)
+
+    @staticmethod
+    def release(section_id, count=1):
+        """Frees `count` seats, never going below zero."""
+        Section.objects.filter(id=section_id, student_count__gte=count).update(
+            student_count=F('student_count') - count
+        )
+
+    @staticmethod
+    def _actual_counts():
+        return SectionStudent.objects.filter(section=OuterRef('pk')).values('section').annotate(
+            total=Count('id')
+        ).values('total')
+
+    @classmethod
+    def reconcile(cls, term=None, dry_run=False):
+        """
+        Recounts SectionStudent rows and repairs sections whose counter drifted.
+
+        Args:
+            term (Term|None): Limit to one term's sections.
+            dry_run (bool): Only report the drift.
+
+        Returns:
+            list[dict]: {'id', 'name', 'term_id', 'student_count', 'actual'} for each drifted section.
+        """
+        sections = Section.objects.all()
+        if term is not None:
+            sections = sections.filter(term=term)
+
+        drifted = list(
+            sections.annotate(actual=Coalesce(Subquery(cls._actual_counts()), 0))
+            .exclude(student_count=F('actual'))
+            .order_by('id')
+            .values('id', 'name', 'term_id', 'student_count', 'actual')
+        )
+        if drifted and not dry_run:
+            Section.objects.filter(id__in=[row['id'] for row in drifted]).update(
+                student_count=Coalesce(Subquery(cls._actual_counts()), 0)
+            )
+            for term_id in {row['term_id'] for row in drifted}:
+                SectioningSnapshot.mark_dirty(term_id, 'sections')
+        return drifted
@@ -1,8 +1,15 @@
 import math
 from datetime import time
 from django.db import transaction, models
+from django.forms.models import model_to_dict
+from django.utils import timezone
 from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
 from apps.scheduling.models import Schedule
+from apps.scheduling.services.report_service import ReportService
+from apps.scheduling.services.schedule_index import ScheduleIndex
+from apps.scheduling.services.week_grid import WeekGrid
 from apps.students.models import StudentEnrollment
 from apps.academics.models import Subject
 from apps.grades.models import Grade
@@ -13,31 +20,26 @@ PM_HOURS = list(range(13, 18)) # [13, 14, 15, 16, 17] -> 1pm to 6pm
 DAYS_ORDER = ['M', 'T', 'W', 'TH', 'F', 'S']
 
 
-def _allocate_slots(used_slots, session, num_hours):
+def _allocate_slots(used_grid, session, num_hours):
     """
     Block scheduling: allocates num_hours as one contiguous block on one day.
     To ensure even distribution, it tries days with the least load first.
+
+    `used_grid` is the section's WeekGrid; the allocated block is marked on it.
     """
     hours = AM_HOURS if session == 'AM' else PM_HOURS
     if num_hours <= 0 or num_hours > len(hours):
         return None
 
-    # Calculate current load per day to distribute evenly
-    day_loads = {day: 0 for day in DAYS_ORDER}
-    for day, hr in used_slots:
-        day_loads[day] += 1
-    
-    # Sort days by load (least busy first)
-    sorted_days = sorted(DAYS_ORDER, key=lambda d: day_loads[d])
+    # Sort days by load (least busy first) to distribute evenly
+    sorted_days = sorted(DAYS_ORDER, key=used_grid.minutes_on)
 
     for day in sorted_days:
         for start_idx in range(len(hours) - num_hours + 1):
-            block = [(day, hours[start_idx + i]) for i in range(num_hours)]
-            if all(slot not in used_slots for slot in block):
-                for slot in block:
-                    used_slots.add(slot)
-                start_hour = hours[start_idx]
-                end_hour = start_hour + num_hours
+            start_hour = hours[start_idx]
+            end_hour = start_hour + num_hours
+            if used_grid.is_free([day], start_hour * 60, end_hour * 60):
+                used_grid.add([day], start_hour * 60, end_hour * 60)
                 return ([day], time(start_hour, 0), time(end_hour, 0))
     return None
 
@@ -67,6 +69,9 @@ class SectioningService:
         """
         Generates sections based on student counts or provided num_sections.
         Automatically attaches curriculum subjects as empty schedule slots.
+
+        Sections and slots are written with bulk_create/bulk_update and audited as one
+        batch per model, so the query count does not grow with the number of sections.
         """
         # 1. Count students
         count = StudentEnrollment.objects.filter(
@@ -101,54 +106,73 @@ class SectioningService:
             is_practicum=False
         ).order_by('code')
 
+        # 6. Create or refresh the sections in bulk (same fields update_or_create used to set)
+        existing_sections = {
+            section.section_number: section
+            for section in Section.objects.filter(term=term, program=program, year_level=year_level)
+        }
+        new_sections, updated_sections, original_states = [], [], {}
         for i in range(1, num_sections + 1):
-            session = 'AM' if i <= num_am else 'PM'
-            section_name = f"{program.code} {year_level}-{i} ({term.code})"
-
-            # Use update_or_create to refresh target_students if count changes
-            section, created = Section.objects.update_or_create(
-                term=term,
-                program=program,
-                year_level=year_level,
-                section_number=i,
-                defaults={
-                    'name': section_name,
-                    'session': session,
-                    'target_students': target_capacity,
-                    'max_students': 40
-                }
-            )
+            values = {
+                'name': f"{program.code} {year_level}-{i} ({term.code})",
+                'session': 'AM' if i <= num_am else 'PM',
+                'target_students': target_capacity,
+                'max_students': 40
+            }
+            section = existing_sections.get(i)
+            if section is None:
+                section = Section(term=term, program=program, year_level=year_level, section_number=i, **values)
+                new_sections.append(section)
+            else:
+                original_states[section.pk] = model_to_dict(section)
+                for field, value in values.items():
+                    setattr(section, field, value)
+                section.updated_at = timezone.now()
+                updated_sections.append(section)
             created_sections.append(section)
 
-            # 6. Build allocation tasks (Lec and Lab)
-            allocation_tasks = []
-            for subject in subjects:
-                if subject.lec_units > 0:
-                    allocation_tasks.append((subject, 'LEC', subject.lec_units))
-                if subject.lab_units > 0:
-                    allocation_tasks.append((subject, 'LAB', subject.lab_units))
-            
-            # Sort by hours descending. This minimizes fragmentation!
-            allocation_tasks.sort(key=lambda x: x[2], reverse=True)
-
-            used_slots = set()
-            # 7. Create/Update Schedule slots
+        Section.objects.bulk_create(new_sections)
+        Section.objects.bulk_update(updated_sections, ['name', 'session', 'target_students', 'max_students', 'updated_at'])
+        Section.bulk_audit(new_sections, 'CREATE')
+        Section.bulk_audit(updated_sections, 'UPDATE', original_states)
+
+        # 7. Build allocation tasks (Lec and Lab)
+        allocation_tasks = []
+        for subject in subjects:
+            if subject.lec_units > 0:
+                allocation_tasks.append((subject, 'LEC', subject.lec_units))
+            if subject.lab_units > 0:
+                allocation_tasks.append((subject, 'LAB', subject.lab_units))
+
+        # Sort by hours descending. This minimizes fragmentation!
+        allocation_tasks.sort(key=lambda x: x[2], reverse=True)
+
+        # 8. Create missing Schedule slots (existing slots are kept as-is, like get_or_create)
+        existing_slots = set(
+            Schedule.objects.filter(term=term, section__in=created_sections)
+            .values_list('section_id', 'subject_id', 'component_type')
+        )
+        new_slots = []
+        for section in created_sections:
+            used_grid = WeekGrid()
             for subject, component_type, hours in allocation_tasks:
-                allocation = _allocate_slots(used_slots, session, hours) if auto_schedule else None
-                defaults = {'days': [], 'start_time': None, 'end_time': None}
-                if allocation:
-                    days, start_t, end_t = allocation
-                    defaults = {'days': days, 'start_time': start_t, 'end_time': end_t}
-                
-                Schedule.objects.get_or_create(
-                    term=term,
-                    section=section,
-                    subject=subject,
-                    component_type=component_type,
-                    defaults=defaults
-                )
+                allocation = _allocate_slots(used_grid, section.session, hours) if auto_schedule else None
+                if (section.id, subject.id, component_type) in existing_slots:
+                    continue
+                days, start_t, end_t = allocation or ([], None, None)
+                new_slots.append(Schedule(
+                    term=term, section=section, subject=subject, component_type=component_type,
+                    days=days, start_time=start_t, end_time=end_t
+                ))
+
+        Schedule.objects.bulk_create(new_slots)
+        Schedule.bulk_audit(new_slots, 'CREATE')
+        if new_slots:
+            ScheduleIndex.invalidate(term.id)
+        ReportService.invalidate_capacity_bottlenecks(term.id)
+        SectioningSnapshot.mark_dirty(term.id, 'sections', 'courses')
         
-        # 8. (DEPRECATED) Automatic assignment has been removed in favor of 
+        # 9. (DEPRECATED) Automatic assignment has been removed in favor of 
         # the manual "Distribute Students" trigger in the Dean's dashboard.
         
         return created_sections
@@ -221,9 +245,11 @@ class SectioningService:
         from apps.grades.models import Grade
         from apps.sections.models import SectionStudent
 
-        # 1. Capacity Check
-        current_count = target_section.student_assignments.count()
-        if not override_capacity and current_count >= target_section.max_students:
+        existing = SectionStudent.objects.filter(student=student, term=term).first()
+        already_seated = existing is not None and existing.section_id == target_section.id
+
+        # 1. Capacity Check — reserves the seat with a conditional UPDATE on the counter
+        if not already_seated and not SeatCounter.reserve(target_section.id, override_capacity=override_capacity):
             raise ValueError(f"Section {target_section.name} is full (Max: {target_section.max_students})")
         
         # 2. Update Grade records for this term
@@ -233,16 +259,17 @@ class SectioningService:
         ).update(section=target_section)
 
         # 3. Update SectionStudent record (Home Section) — query by direct term field
-        existing = SectionStudent.objects.filter(student=student, term=term).first()
-        if existing:
-            existing.section = target_section
+        if not already_seated:
+            if existing:
+                existing.section = target_section
+            else:
+                existing = SectionStudent(
+                    student=student,
+                    section=target_section,
+                    term=term,
+                    is_home_section=True
+                )
+            existing._seat_reserved = True
             existing.save()
-        else:
-            SectionStudent.objects.create(
-                student=student,
-                section=target_section,
-                term=term,
-                is_home_section=True
-            )
 
         return updated_count
@@ -0,0 +1,202 @@
+"""
+Richwell Portal — Sectioning Dashboard Snapshot
+
+Precomputed metrics behind the Dean's Sectioning Dashboard
+(`ReportService.get_sectioning_dashboard_report`). A term's snapshot is built from
+four GROUP BY queries, one per part, and kept in the cache:
+
+    sections     Section counts, capacity, targets and seat counters per (program, year, active)
+    enrollments  Approved enrollments per (program, year, regular/irregular)
+    backlog      Approved enrollments without a SectionStudent row per (program, year)
+    courses      Distinct subjects scheduled in the term
+
+Writers never touch the snapshot. They replace the part's token in the cache
+(`mark_dirty`) — the signals in `apps/sections/signals.py` and
+`apps/scheduling/signals.py` do this, and bulk writers call it themselves. The
+next read re-runs only the queries of the parts whose token changed, so the
+report costs the same handful of queries however many programs there are, and
+nothing when nothing changed.
+
+Usage:
+    report = SectioningSnapshot.for_term(term).report
+    SectioningSnapshot.mark_dirty(term.id, 'sections', 'backlog')
+"""
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from apps.academics.models import Program
+from apps.scheduling.models import Schedule
+from apps.sections.models import Section
+from apps.students.models import StudentEnrollment
+from core.cache import current_token, rotate_token
+
+
+SNAPSHOT_KEY = 'sectioning_snapshot:{term_id}'
+TOKEN_KEY = 'sectioning_snapshot:{term_id}:{part}'
+# Program names/codes are only re-read on refresh; the timeout bounds how stale they get
+SNAPSHOT_TIMEOUT = 10 * 60
+
+YEAR_LEVELS = (1, 2, 3, 4)
+
+
+class SectioningSnapshot:
+    """
+    Per-term dashboard metrics, refreshed part by part.
+
+    Args:
+        term_id (int): The term the snapshot covers.
+    """
+
+    PARTS = ('sections', 'enrollments', 'backlog', 'courses')
+
+    def __init__(self, term_id):
+        self.term_id = term_id
+        self.tokens = {}
+        self.sections = {}      # (program_id, year_level, is_active) -> {'count', 'capacity', 'target', 'seated'}
+        self.enrollments = {}   # (program_id, year_level, is_regular) -> approved count
+        self.backlog = {}       # (program_id, year_level) -> approved without a section
+        self.unique_courses = 0
+        self.report = None
+
+    # ── Caching ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _token_keys(cls, term_id):
+        return {part: TOKEN_KEY.format(term_id=term_id, part=part) for part in cls.PARTS}
+
+    @classmethod
+    def mark_dirty(cls, term_id, *parts):
+        """
+        Marks parts of a term's snapshot (all parts if none given) for refresh, now and
+        again once the transaction commits so a refresh that ran in between is discarded.
+        """
+        if term_id is None:
+            return
+        rotate_token(*(TOKEN_KEY.format(term_id=term_id, part=part) for part in (parts or cls.PARTS)))
+
+    @classmethod
+    def _current_tokens(cls, term_id):
+        keys = cls._token_keys(term_id)
+        found = cache.get_many(keys.values())
+        tokens = {}
+        for part, key in keys.items():
+            token = found.get(key)
+            if token is None:
+                # Never marked (or evicted): start tracking so later writes are noticed
+                token = current_token(key)
+            tokens[part] = token
+        return tokens
+
+    @classmethod
+    def for_term(cls, term):
+        """
+        Returns the term's snapshot, refreshing the parts changed since it was cached.
+
+        Args:
+            term (Term|int): The term or its primary key.
+        """
+        term_id = getattr(term, 'id', term)
+        # Tokens are read before querying, so a write during the refresh marks it stale again
+        tokens = cls._current_tokens(term_id)
+        snapshot = cache.get(SNAPSHOT_KEY.format(term_id=term_id))
+        if snapshot is None:
+            snapshot = cls(term_id)
+
+        dirty = [part for part in cls.PARTS if snapshot.tokens.get(part) != tokens[part]]
+        if dirty or snapshot.report is None:
+            snapshot.refresh(dirty or cls.PARTS)
+            snapshot.tokens = tokens
+            cache.set(SNAPSHOT_KEY.format(term_id=term_id), snapshot, SNAPSHOT_TIMEOUT)
+        return snapshot
+
+    # ── Building ───────────────────────────────────────────────────────────
+
+    def refresh(self, parts):
+        """Re-runs the queries of the given parts and re-renders the report."""
+        approved = StudentEnrollment.objects.filter(term_id=self.term_id, advising_status='APPROVED')
+
+        if 'sections' in parts:
+            rows = Section.objects.filter(term_id=self.term_id).values(
+                'program_id', 'year_level', 'is_active'
+            ).annotate(
+                count=Count('id'),
+                capacity=Sum('max_students'),
+                target=Sum('target_students'),
+                seated=Sum('student_count')
+            ).order_by()
+            self.sections = {
+                (row['program_id'], row['year_level'], row['is_active']): {
+                    'count': row['count'], 'capacity': row['capacity'] or 0,
+                    'target': row['target'] or 0, 'seated': row['seated'] or 0,
+                }
+                for row in rows
+            }
+
+        if 'enrollments' in parts:
+            rows = approved.values('student__program_id', 'year_level', 'is_regular').annotate(
+                total=Count('id')
+            ).order_by()
+            self.enrollments = {
+                (row['student__program_id'], row['year_level'], row['is_regular']): row['total'] for row in rows
+            }
+
+        if 'backlog' in parts:
+            rows = approved.exclude(
+                student__section_assignments__term_id=self.term_id
+            ).values('student__program_id', 'year_level').annotate(total=Count('id')).order_by()
+            self.backlog = {(row['student__program_id'], row['year_level']): row['total'] for row in rows}
+
+        if 'courses' in parts:
+            self.unique_courses = Schedule.objects.filter(term_id=self.term_id).values('subject').distinct().count()
+
+        self.report = self._render(list(Program.objects.filter(is_active=True).order_by('code')))
+
+    def _render(self, programs):
+        active = {key[:2]: value for key, value in self.sections.items() if key[2]}
+        total_sections = sum(value['count'] for value in active.values())
+        total_capacity = sum(value['capacity'] for value in active.values())
+        total_target_capacity = sum(value['target'] for value in active.values())
+        enrolled_count = sum(value['seated'] for value in self.sections.values())
+
+        regular_count = sum(total for (_, _, is_regular), total in self.enrollments.items() if is_regular)
+        irregular_count = sum(total for (_, _, is_regular), total in self.enrollments.items() if not is_regular)
+        total_approved = regular_count + irregular_count
+
+        program_metrics = []
+        for prog in programs:
+            year_levels = []
+            for y_lvl in YEAR_LEVELS:
+                secs = active.get((prog.id, y_lvl), {'count': 0, 'target': 0, 'seated': 0})
+                sec_count = secs['count']
+                year_levels.append({
+                    "year_level": y_lvl,
+                    "section_count": sec_count,
+                    "avg_students": round(secs['seated'] / sec_count, 1) if sec_count > 0 else 0,
+                    "unassigned_count": self.backlog.get((prog.id, y_lvl), 0),
+                    "total_students": (
+                        self.enrollments.get((prog.id, y_lvl, True), 0) + self.enrollments.get((prog.id, y_lvl, False), 0)
+                    ),
+                    "total_target": secs['target'],
+                })
+            program_metrics.append({
+                "program_id": prog.id,
+                "program_code": prog.code.replace('_', ' '),
+                "program_name": prog.name,
+                "year_levels": year_levels,
+            })
+
+        return {
+            "total_sections": total_sections,
+            "total_capacity": total_capacity,
+            "total_target_capacity": total_target_capacity,
+            "total_approved": total_approved,
+            "regular_students": regular_count,
+            "irregular_students": irregular_count,
+            "enrolled_count": enrolled_count,
+            "backlog_count": sum(self.backlog.values()),
+            "unique_courses": self.unique_courses,
+            "utilization_rate": round((enrolled_count / total_capacity * 100), 1) if total_capacity > 0 else 0,
+            "program_metrics": program_metrics,
+            "excess_students": max(0, total_approved - total_target_capacity),
+        }
@@ -0,0 +1,65 @@
+"""
+Richwell Portal — Sections Signals
+
+Keeps `Section.student_count` in step with SectionStudent rows written through
+save()/delete(). Callers that already reserved the seat with
+`SeatCounter.reserve()` set `_seat_reserved = True` on the instance before saving,
+so the seat is not counted twice.
+
+The same writes (plus StudentEnrollment changes) mark the affected parts of the
+term's SectioningSnapshot for refresh.
+"""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+from apps.students.models import StudentEnrollment
+
+
+@receiver(pre_save, sender=SectionStudent)
+def remember_previous_section(sender, instance, **kwargs):
+    instance._previous_section_id = None
+    if instance.pk:
+        instance._previous_section_id = (
+            SectionStudent.objects.filter(pk=instance.pk).values_list('section_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=SectionStudent)
+def count_section_seat(sender, instance, created, **kwargs):
+    reserved = getattr(instance, '_seat_reserved', False)
+    instance._seat_reserved = False
+    previous_section_id = None if created else getattr(instance, '_previous_section_id', None)
+
+    if not created and previous_section_id == instance.section_id:
+        return
+    if previous_section_id:
+        SeatCounter.release(previous_section_id)
+    if not reserved:
+        SeatCounter.add(instance.section_id)
+
+
+@receiver(post_delete, sender=SectionStudent)
+def release_section_seat(sender, instance, **kwargs):
+    SeatCounter.release(instance.section_id)
+
+
+@receiver(post_save, sender=SectionStudent)
+@receiver(post_delete, sender=SectionStudent)
+def refresh_snapshot_seats(sender, instance, **kwargs):
+    SectioningSnapshot.mark_dirty(instance.term_id, 'sections', 'backlog')
+
+
+@receiver(post_save, sender=Section)
+@receiver(post_delete, sender=Section)
+def refresh_snapshot_sections(sender, instance, **kwargs):
+    SectioningSnapshot.mark_dirty(instance.term_id, 'sections')
+
+
+@receiver(post_save, sender=StudentEnrollment)
+@receiver(post_delete, sender=StudentEnrollment)
+def refresh_snapshot_enrollments(sender, instance, **kwargs):
+    SectioningSnapshot.mark_dirty(instance.term_id, 'enrollments', 'backlog')
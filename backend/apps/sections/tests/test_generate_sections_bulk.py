@@ -0,0 +1,72 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.scheduling.models import Schedule
+from apps.sections.models import Section
+from apps.sections.services.sectioning_service import SectioningService
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestGenerateSectionsBulk:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.program = Program.objects.create(code='BSBLK', name='BS Bulk Test')
+        curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1', is_active=True)
+        self.term = Term.objects.create(
+            code='2024-1-BLK', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        for i in range(4):
+            Subject.objects.create(
+                curriculum=curriculum, code=f'BLK{i}', description=f'Bulk {i}', year_level=1,
+                semester='1', lec_units=2, lab_units=1 if i % 2 else 0, total_units=3
+            )
+        user = User.objects.create(username='blkstudent', email='blk@test.com')
+        student = Student.objects.create(
+            user=user, idn='250001', program=self.program, curriculum=curriculum,
+            date_of_birth='2005-01-01', gender='MALE', student_type='FRESHMAN'
+        )
+        StudentEnrollment.objects.create(
+            student=student, term=self.term, year_level=1, advising_status='APPROVED', is_regular=True
+        )
+        self.service = SectioningService()
+
+    def test_query_count_does_not_grow_with_sections(self, django_assert_max_num_queries):
+        # count, subjects, existing sections, section insert + audit,
+        # existing slots, slot insert + audit, savepoint pair
+        with django_assert_max_num_queries(10):
+            sections = self.service.generate_sections(self.term, self.program, 1, num_sections=8, auto_schedule=True)
+
+        assert len(sections) == 8
+        assert [s.session for s in sections] == ['AM'] * 4 + ['PM'] * 4
+        assert Schedule.objects.filter(term=self.term).count() == 8 * 6
+        assert not Schedule.objects.filter(term=self.term, start_time__isnull=True).exists()
+        assert AuditLog.objects.filter(model_name='Section', action='CREATE').count() == 8
+        assert AuditLog.objects.filter(model_name='Schedule', action='CREATE').count() == 48
+
+    def test_rerun_refreshes_sections_and_keeps_existing_slots(self):
+        self.service.generate_sections(self.term, self.program, 1, num_sections=2)
+        slot = Schedule.objects.filter(term=self.term).first()
+        slot_ids = set(Schedule.objects.values_list('id', flat=True))
+
+        sections = self.service.generate_sections(self.term, self.program, 1, num_sections=3)
+
+        assert Section.objects.filter(term=self.term).count() == 3
+        assert [s.target_students for s in sections] == [1, 1, 1]
+        assert slot_ids < set(Schedule.objects.values_list('id', flat=True))
+        assert Schedule.objects.filter(term=self.term).count() == 3 * 6
+        slot.refresh_from_db()
+        assert slot.days == []
+        # Only section 2 changed (PM -> AM once there are three sections)
+        assert [s.session for s in sections] == ['AM', 'AM', 'PM']
+        update = AuditLog.objects.get(model_name='Section', action='UPDATE')
+        assert update.changes['session'] == {'old': 'PM', 'new': 'AM'}
@@ -0,0 +1,114 @@
+import pytest
+from datetime import date
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.academics.models import Program, CurriculumVersion
+from apps.scheduling.services.picking_service import PickingService
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.sections.services.sectioning_service import SectioningService
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+from core.exceptions import ConflictError
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestSeatCounter:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.program = Program.objects.create(code='SEAT', name='Seat Test')
+        self.curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.term = Term.objects.create(
+            code='2024-SEAT', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30),
+            schedule_published=True, picking_published_at=timezone.now()
+        )
+        self.am = Section.objects.create(name='SEAT AM', term=self.term, program=self.program, year_level=1,
+                                         section_number=1, session='AM', max_students=2)
+        self.pm = Section.objects.create(name='SEAT PM', term=self.term, program=self.program, year_level=1,
+                                         section_number=2, session='PM', max_students=1)
+
+    def make_student(self, idx):
+        student = Student.objects.create(
+            user=User.objects.create(username=f'seat{idx}', email=f'seat{idx}@test.com', role='STUDENT'),
+            idn=f'28{idx:04d}', program=self.program, curriculum=self.curriculum,
+            date_of_birth=date(2005, 1, 1), gender='FEMALE', student_type='FRESHMAN'
+        )
+        StudentEnrollment.objects.create(
+            student=student, term=self.term, year_level=1, is_regular=True, advising_status='APPROVED'
+        )
+        return student
+
+    def counts(self):
+        return dict(Section.objects.filter(term=self.term).values_list('name', 'student_count'))
+
+    def test_signals_track_create_move_and_delete(self):
+        assignment = SectionStudent.objects.create(student=self.make_student(1), section=self.am, term=self.term)
+        assert self.counts() == {'SEAT AM': 1, 'SEAT PM': 0}
+
+        assignment.section = self.pm
+        assignment.save()
+        assert self.counts() == {'SEAT AM': 0, 'SEAT PM': 1}
+
+        assignment.delete()
+        assert self.counts() == {'SEAT AM': 0, 'SEAT PM': 0}
+
+    def test_section_save_does_not_overwrite_counter(self):
+        stale = Section.objects.get(id=self.am.id)
+        SectionStudent.objects.create(student=self.make_student(1), section=self.am, term=self.term)
+
+        stale.name = 'SEAT AM Renamed'
+        stale.save()
+
+        assert Section.objects.get(id=self.am.id).student_count == 1
+
+    def test_reserve_stops_at_capacity(self):
+        assert SeatCounter.reserve(self.pm.id) is True
+        assert SeatCounter.reserve(self.pm.id) is False
+        assert SeatCounter.reserve(self.pm.id, override_capacity=True) is True
+        assert Section.objects.get(id=self.pm.id).student_count == 2
+
+    def test_regular_picking_never_overbooks(self):
+        service = PickingService()
+        picks = [service.pick_schedule_regular(self.make_student(i), self.term, 'AM') for i in range(3)]
+
+        assert [(section.name, redirected) for section, redirected in picks] == [
+            ('SEAT AM', False), ('SEAT AM', False), ('SEAT PM', True)
+        ]
+        with pytest.raises(ConflictError):
+            service.pick_schedule_regular(self.make_student(3), self.term, 'AM')
+
+        assert self.counts() == {'SEAT AM': 2, 'SEAT PM': 1}
+        assert SeatCounter.reconcile(term=self.term, dry_run=True) == []
+
+    def test_manual_transfer_moves_the_seat(self):
+        student = self.make_student(1)
+        PickingService().pick_schedule_regular(student, self.term, 'AM')
+
+        SectioningService().manual_transfer_student(student, self.pm, self.term)
+        assert self.counts() == {'SEAT AM': 0, 'SEAT PM': 1}
+
+        with pytest.raises(ValueError):
+            SectioningService().manual_transfer_student(self.make_student(2), self.pm, self.term)
+        SectioningService().manual_transfer_student(student, self.pm, self.term)
+        assert self.counts() == {'SEAT AM': 0, 'SEAT PM': 1}
+
+    def test_reconcile_command_repairs_drift(self):
+        SectionStudent.objects.create(student=self.make_student(1), section=self.am, term=self.term)
+        Section.objects.filter(id=self.am.id).update(student_count=5)
+        Section.objects.filter(id=self.pm.id).update(student_count=1)
+
+        out = StringIO()
+        call_command('reconcile_section_counts', '--term', self.term.code, '--dry-run', stdout=out)
+        assert 'counter 5, actual 1' in out.getvalue()
+        assert self.counts() == {'SEAT AM': 5, 'SEAT PM': 1}
+
+        call_command('reconcile_section_counts', stdout=StringIO())
+        assert self.counts() == {'SEAT AM': 1, 'SEAT PM': 0}
@@ -0,0 +1,112 @@
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.report_service import ReportService
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.sectioning_snapshot import SectioningSnapshot
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestSectioningSnapshot:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = Term.objects.create(
+            code='2024-SNAP', academic_year='2024-2025', semester_type='1', is_active=True,
+            start_date=date(2024, 6, 1), end_date=date(2024, 10, 31),
+            enrollment_start=date(2024, 5, 1), enrollment_end=date(2024, 6, 15),
+            advising_start=date(2024, 5, 1), advising_end=date(2024, 5, 30)
+        )
+        self.program = Program.objects.create(code='BS_SNAP', name='BS Snapshot')
+        self.curriculum = CurriculumVersion.objects.create(program=self.program, version_name='V1')
+        self.idx = 0
+
+    def make_enrollment(self, year_level=1, is_regular=True, advising_status='APPROVED', program=None):
+        self.idx += 1
+        program = program or self.program
+        curriculum, _ = CurriculumVersion.objects.get_or_create(program=program, version_name='V1')
+        student = Student.objects.create(
+            user=User.objects.create(username=f'snap{self.idx}', email=f'snap{self.idx}@test.com', role='STUDENT'),
+            idn=f'23{self.idx:04d}', program=program, curriculum=curriculum,
+            date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+        )
+        StudentEnrollment.objects.create(
+            student=student, term=self.term, year_level=year_level, is_regular=is_regular,
+            advising_status=advising_status
+        )
+        return student
+
+    def make_section(self, number, max_students=40, target_students=35, is_active=True, program=None):
+        return Section.objects.create(
+            name=f'SNAP 1-{number}', term=self.term, program=program or self.program, year_level=1,
+            section_number=number, session='AM', max_students=max_students,
+            target_students=target_students, is_active=is_active
+        )
+
+    def test_report_matches_the_dashboard_schema(self):
+        section = self.make_section(1, max_students=10, target_students=8)
+        self.make_section(2, max_students=10, target_students=8)
+        self.make_section(3, max_students=50, is_active=False)
+        seated = [self.make_enrollment() for _ in range(3)]
+        self.make_enrollment(is_regular=False)
+        self.make_enrollment(year_level=2)
+        self.make_enrollment(advising_status='PENDING')
+        for student in seated:
+            SectionStudent.objects.create(student=student, section=section, term=self.term)
+        subject = Subject.objects.create(curriculum=self.curriculum, code='SNAP1', description='Snap 1',
+                                         year_level=1, semester='1', total_units=3)
+        Schedule.objects.create(term=self.term, section=section, subject=subject, component_type='LEC',
+                                days=['M'], start_time=time(8), end_time=time(10))
+
+        report = ReportService.get_sectioning_dashboard_report(self.term)
+
+        assert {k: v for k, v in report.items() if k != 'program_metrics'} == {
+            'total_sections': 2, 'total_capacity': 20, 'total_target_capacity': 16,
+            'total_approved': 5, 'regular_students': 4, 'irregular_students': 1,
+            'enrolled_count': 3, 'backlog_count': 2, 'unique_courses': 1,
+            'utilization_rate': 15.0, 'excess_students': 0,
+        }
+        metrics = report['program_metrics'][0]
+        assert metrics['program_code'] == 'BS SNAP'
+        assert metrics['year_levels'][0] == {
+            'year_level': 1, 'section_count': 2, 'avg_students': 1.5,
+            'unassigned_count': 1, 'total_students': 4, 'total_target': 16,
+        }
+        assert metrics['year_levels'][1]['unassigned_count'] == 1
+        assert [y['year_level'] for y in metrics['year_levels']] == [1, 2, 3, 4]
+
+    def test_query_count_does_not_grow_with_programs(self, django_assert_max_num_queries):
+        for i in range(6):
+            program = Program.objects.create(code=f'SNAP{i}', name=f'Snap {i}')
+            self.make_section(i + 1, program=program)
+            self.make_enrollment(program=program)
+
+        # one query per part plus the program list
+        with django_assert_max_num_queries(5):
+            report = SectioningSnapshot.for_term(self.term).report
+        assert len(report['program_metrics']) == 7
+
+        with django_assert_max_num_queries(0):
+            assert SectioningSnapshot.for_term(self.term).report == report
+
+    def test_writes_refresh_only_their_parts(self, django_assert_num_queries):
+        section = self.make_section(1)
+        student = self.make_enrollment()
+        assert SectioningSnapshot.for_term(self.term).report['backlog_count'] == 1
+
+        SectionStudent.objects.create(student=student, section=section, term=self.term)
+
+        # sections + backlog + program list
+        with django_assert_num_queries(3):
+            report = SectioningSnapshot.for_term(self.term).report
+        assert (report['backlog_count'], report['enrolled_count']) == (0, 1)
+
+        self.make_enrollment(is_regular=False)
+        report = ReportService.get_sectioning_dashboard_report(self.term)
+        assert (report['irregular_students'], report['backlog_count']) == (1, 1)
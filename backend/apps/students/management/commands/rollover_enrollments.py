@@ -0,0 +1,50 @@
+"""
+Management Command — Term Rollover Enrollment
+File: apps/students/management/commands/rollover_enrollments.py
+
+Enrolls every ADMITTED/ENROLLED student into the target term (the active term by
+default) in chunked batches. Progress is checkpointed after every chunk, so an
+interrupted run picks up where it stopped when re-run.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.terms.models import Term
+from apps.students.services import rollover_enrollments
+
+
+class Command(BaseCommand):
+    help = 'Enrolls all eligible ADMITTED/ENROLLED students into a term in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--term', type=str, help='Term code to roll over into (defaults to the active term).')
+        parser.add_argument('--chunk-size', type=int, default=500, help='Students processed per transaction.')
+        parser.add_argument('--restart', action='store_true', help='Ignore any saved checkpoint and start over.')
+
+    def handle(self, *args, **options):
+        if options['term']:
+            term = Term.objects.filter(code=options['term']).first()
+            if not term:
+                raise CommandError(f"Term {options['term']} not found.")
+        else:
+            term = Term.objects.filter(is_active=True).first()
+            if not term:
+                raise CommandError('No active term found.')
+
+        def report(progress):
+            self.stdout.write(
+                f"  Processed {progress['processed']} students "
+                f"({progress['created']} enrolled, {progress['skipped']} already enrolled)..."
+            )
+
+        self.stdout.write(f'Rolling over eligible students into Term: {term.code}...')
+        result = rollover_enrollments(
+            term=term,
+            chunk_size=options['chunk_size'],
+            restart=options['restart'],
+            on_progress=report
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rollover into {result['term']} complete: {result['created']} enrollments created, "
+            f"{result['skipped']} already enrolled."
+        ))
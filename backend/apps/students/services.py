@@ -114,7 +114,7 @@ def admit_student_application(student, monthly_commitment, admitted_by):
     if not active_term:
         raise DRFValidationError({'detail': 'No active term found. Please activate a term first.'})
 
-    from apps.grades.services.advising_service import AdvisingService
+    from apps.grades.services.student_standing import StudentStanding
 
     with transaction.atomic():
         # Generate IDN
@@ -145,8 +145,9 @@ def admit_student_application(student, monthly_commitment, admitted_by):
         student.save(audit_user=admitted_by)
 
         # Create Initial Enrollment
-        reg_data = AdvisingService.check_student_regularity(student, active_term)
-        year_level = AdvisingService.get_year_level(student)
+        standing = StudentStanding.for_student(student)
+        reg_data = standing.regularity(active_term)
+        year_level = standing.year_level
         enrollment, created = StudentEnrollment.objects.get_or_create(
             student=student,
             term=active_term,
@@ -216,15 +217,16 @@ def enroll_student_for_term(student, monthly_commitment=None, enrolled_by=None):
     if not active_term:
         raise DRFValidationError({'detail': 'No active term found.'})
 
-    from apps.grades.services.advising_service import AdvisingService
+    from apps.grades.services.student_standing import StudentStanding
     
     with transaction.atomic():
         # Keep status as is (usually ADMITTED) until advising is approved
         # student.status = 'ENROLLED'
         # student.save()
         
-        reg_data = AdvisingService.check_student_regularity(student, active_term)
-        year_level = AdvisingService.get_year_level(student)
+        standing = StudentStanding.for_student(student)
+        reg_data = standing.regularity(active_term)
+        year_level = standing.year_level
         
         # Determine status: if student enrolled themselves, it's FOR_ADVISING
         # If staff enrolled them (with commitment), maybe it's PENDING or DRAFT?
@@ -247,6 +249,128 @@ def enroll_student_for_term(student, monthly_commitment=None, enrolled_by=None):
             enrollment.save(audit_user=enrolled_by)
         return enrollment
 
+ROLLOVER_STATUSES = ('ADMITTED', 'ENROLLED')
+ROLLOVER_CHECKPOINT_KEY = 'enrollment_rollover:{term_id}'
+ROLLOVER_CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+
+def get_rollover_checkpoint(term):
+    """
+    Returns the saved progress of a term rollover, or None if none was started.
+
+    @param {Term} term - The term being rolled over into.
+    @returns {dict|None} {last_student_id, processed, created, skipped, completed}
+    """
+    from django.core.cache import cache
+    return cache.get(ROLLOVER_CHECKPOINT_KEY.format(term_id=term.id))
+
+def rollover_enrollments(term=None, performed_by=None, chunk_size=500, restart=False, on_progress=None):
+    """
+    Enrolls every eligible ADMITTED/ENROLLED student into a term in one batched pipeline.
+    Students are processed in primary-key order, one transaction per chunk: standing is
+    computed with StudentStanding.for_students() and enrollments are written with
+    bulk_create(). A checkpoint (last processed student ID) is stored in the cache after
+    every chunk so an interrupted run resumes where it stopped; students already enrolled
+    in the term are always skipped, so re-running is safe even without a checkpoint.
+    A single summary AuditLog entry is written at the end of the run.
+
+    @param {Term} term - Target term. Defaults to the active term.
+    @param {User} performed_by - The staff user running the rollover.
+    @param {int} chunk_size - Number of students processed per transaction.
+    @param {boolean} restart - Ignore any saved checkpoint and start from the first student.
+    @param {callable} on_progress - Optional callback receiving the progress dict after each chunk.
+    @returns {dict} {term, last_student_id, processed, created, skipped, completed}
+    """
+    from django.core.cache import cache
+    from django.db.models import OuterRef, Subquery
+    from apps.terms.models import Term
+    from apps.grades.services.student_standing import StudentStanding
+    from apps.auditing.models import AuditLog
+    from apps.auditing.middleware import get_current_ip
+    from apps.reports.services.graduation_audit import GraduationAudit
+
+    if term is None:
+        term = Term.objects.filter(is_active=True).first()
+        if not term:
+            raise DRFValidationError({'detail': 'No active term found.'})
+
+    checkpoint_key = ROLLOVER_CHECKPOINT_KEY.format(term_id=term.id)
+    progress = None if restart else cache.get(checkpoint_key)
+    if not progress or progress.get('completed'):
+        progress = {'last_student_id': 0, 'processed': 0, 'created': 0, 'skipped': 0, 'completed': False}
+
+    latest_commitment = StudentEnrollment.objects.filter(
+        student=OuterRef('pk')
+    ).exclude(term=term).order_by('-enrollment_date').values('monthly_commitment')[:1]
+
+    eligible = Student.objects.filter(
+        status__in=ROLLOVER_STATUSES
+    ).annotate(
+        last_commitment=Subquery(latest_commitment)
+    ).order_by('id')
+
+    while True:
+        chunk = list(eligible.filter(id__gt=progress['last_student_id'])[:chunk_size])
+        if not chunk:
+            break
+
+        with transaction.atomic():
+            already_enrolled = set(StudentEnrollment.objects.filter(
+                term=term, student_id__in=[s.id for s in chunk]
+            ).values_list('student_id', flat=True))
+            pending = [s for s in chunk if s.id not in already_enrolled]
+            standings = StudentStanding.for_students(pending)
+
+            enrollments = []
+            for student in pending:
+                enrollment = StudentEnrollment(
+                    student=student,
+                    term=term,
+                    monthly_commitment=student.last_commitment or 0,
+                    enrolled_by=performed_by,
+                    advising_status='DRAFT'
+                )
+                standings[student.id].apply_to_enrollment(enrollment, term)
+                enrollments.append(enrollment)
+            StudentEnrollment.objects.bulk_create(enrollments, ignore_conflicts=True)
+            # bulk_create skips the enrollment signals that retire cached term-cohort audits
+            GraduationAudit.invalidate()
+
+            # ignore_conflicts drops rows another run inserted meanwhile; count the chunk's enrollments, not the attempts
+            created = StudentEnrollment.objects.filter(
+                term=term, student_id__in=[s.id for s in chunk]
+            ).count() - len(already_enrolled)
+
+        progress['last_student_id'] = chunk[-1].id
+        progress['processed'] += len(chunk)
+        progress['created'] += created
+        progress['skipped'] += len(chunk) - created
+        cache.set(checkpoint_key, progress, ROLLOVER_CHECKPOINT_TIMEOUT)
+        if on_progress:
+            on_progress(progress)
+
+    progress['completed'] = True
+    cache.set(checkpoint_key, progress, ROLLOVER_CHECKPOINT_TIMEOUT)
+
+    AuditLog.objects.create(
+        user=performed_by,
+        action='BULK_ENROLL',
+        model_name='StudentEnrollment',
+        object_id=str(term.id),
+        object_repr=f"Term Rollover | {term.code}",
+        changes={
+            "message": f"Rolled over eligible students into {term.code}",
+            "counts": {
+                "processed": progress['processed'],
+                "created": progress['created'],
+                "skipped": progress['skipped']
+            }
+        },
+        ip_address=get_current_ip()
+    )
+
+    logger.info(f"Term rollover into {term.code}: {progress['created']} enrollments created, {progress['skipped']} skipped.")
+    return {'term': term.code, **progress}
+
 def manual_add_student_record(data, requested_by):
     """
     Manually creates a student record for existing students not in the system.
@@ -276,7 +400,7 @@ def manual_add_student_record(data, requested_by):
         raise DRFValidationError({'monthly_commitment': ['Must be a valid number.']})
 
     from apps.terms.models import Term
-    from apps.grades.services.advising_service import AdvisingService
+    from apps.grades.services.student_standing import StudentStanding
     
     active_term = Term.objects.filter(is_active=True).first()
     if not active_term:
@@ -333,12 +457,13 @@ def manual_add_student_record(data, requested_by):
             raise DRFValidationError(e.message_dict if hasattr(e, 'message_dict') else str(e))
         
         # Enrollment Record
-        reg_data = AdvisingService.check_student_regularity(student, active_term)
+        standing = StudentStanding.for_student(student)
+        reg_data = standing.regularity(active_term)
         is_regular = reg_data['is_regular']
         regularity_reason = reg_data['reason']
         
         # Calculate year level automatically based on completed/credited units
-        year_level = AdvisingService.get_year_level(student)
+        year_level = standing.year_level
         
         enrollment = StudentEnrollment.objects.create(
             student=student,
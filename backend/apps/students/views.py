@@ -28,6 +28,8 @@ from .services import (
     manual_add_student_record,
     toggle_student_regularity,
     get_student_schedule,
+    rollover_enrollments,
+    get_rollover_checkpoint,
 )
 
 class StudentViewSet(viewsets.ModelViewSet):
@@ -259,6 +261,43 @@ class StudentEnrollmentViewSet(viewsets.ModelViewSet):
             ).filter(subject_count__gt=0).distinct()
         return StudentEnrollment.objects.all()
 
+    def _get_rollover_term(self, term_id):
+        from apps.terms.models import Term
+        if term_id:
+            try:
+                term_id = int(term_id)
+            except (TypeError, ValueError):
+                raise ValidationError({'term': ['A valid term id is required.']})
+            term = Term.objects.filter(id=term_id).first()
+            if not term: raise ValidationError({'term': ['Term not found.']})
+            return term
+        term = Term.objects.filter(is_active=True).first()
+        if not term: raise ValidationError({'detail': 'No active term found.'})
+        return term
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAdmissionOrRegistrar])
+    def rollover(self, request):
+        """
+        Enrolls every eligible ADMITTED/ENROLLED student into a term (defaults to the
+        active term) in batches. Resumes from the last checkpoint unless `restart` is set.
+        """
+        term = self._get_rollover_term(request.data.get('term'))
+        result = rollover_enrollments(
+            term=term,
+            performed_by=request.user,
+            # JSON sends a boolean, form data the string 'true'/'false'
+            restart=str(request.data.get('restart', '')).lower() in ('1', 'true')
+        )
+        return Response(result)
+
+    @action(detail=False, methods=['get'], url_path='rollover-status', permission_classes=[IsAdmissionOrRegistrar])
+    def rollover_status(self, request):
+        """
+        Returns the saved checkpoint of the latest rollover into a term.
+        """
+        term = self._get_rollover_term(request.query_params.get('term'))
+        return Response({'term': term.code, 'progress': get_rollover_checkpoint(term)})
+
     @action(detail=False, methods=['get'])
     def me(self, request):
         """
@@ -100,6 +100,7 @@ if config('USE_SQLITE', default=False, cast=bool):
             'NAME': BASE_DIR / 'db.sqlite3',
             'OPTIONS': {
                 'timeout': 20,
+                'transaction_mode': 'IMMEDIATE',
             }
         }
     }
@@ -116,6 +117,29 @@ else:
     }
 
 
+
+# --- Cache ---
+# Cached projections (transcripts, graduation audits, prerequisite graphs, dashboard
+# snapshots) are invalidated by signals in whichever worker made the change, so the
+# cache must be shared by every worker process. Redis when REDIS_URL is set (needs the
+# `redis` package), otherwise a table in the main database (created by core migrations).
+
+if REDIS_URL := config('REDIS_URL', default=''):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'richwell_cache',
+            'OPTIONS': {'MAX_ENTRIES': 50000},
+        }
+    }
+
 # --- Password Validation ---
 
 AUTH_PASSWORD_VALIDATORS = [
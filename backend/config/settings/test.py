@@ -17,3 +17,11 @@ DATABASES = {
         },
     }
 }
+
+# One process per test run; conftest clears it between tests
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+SILENCED_SYSTEM_CHECKS = ['core.W001']
@@ -4,6 +4,14 @@ from apps.terms.models import Term
 from apps.academics.models import Program, CurriculumVersion
 from django.utils import timezone
 from datetime import timedelta
+from django.core.cache import cache
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Database rows are rolled back between tests, so cached projections must be too
+    cache.clear()
+    yield
+    cache.clear()
 
 @pytest.fixture
 def api_client():
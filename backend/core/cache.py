@@ -0,0 +1,58 @@
+"""
+Richwell Portal — Cache Invalidation Helpers
+
+Shared by every cached projection (schedule index, timetables, transcripts,
+prerequisite graphs, reports, ...). A cached entry is either dropped outright or,
+for families of entries, retired by rotating a version token that is part of
+their keys.
+
+Invalidation runs twice: immediately, so the rest of the current transaction
+reads fresh data, and again once the transaction commits. A concurrent request
+can re-cache pre-commit data between the two; the second pass discards it.
+Outside a transaction the on_commit pass runs at once.
+
+Usage:
+    drop_now_and_on_commit(CACHE_KEY.format(term_id=term.id))
+    rotate_token(VERSION_KEY)
+    version = current_token(VERSION_KEY)
+"""
+
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def new_token():
+    """Returns a fresh random version token."""
+    return uuid.uuid4().hex
+
+
+def drop_now_and_on_commit(*keys):
+    """Deletes the given cache keys now and again once the transaction commits."""
+    keys = [key for key in keys if key is not None]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def rotate_token(*keys):
+    """Replaces the given version tokens now and again once the transaction commits."""
+    keys = [key for key in keys if key is not None]
+    if not keys:
+        return
+    cache.set_many({key: new_token() for key in keys}, None)
+    transaction.on_commit(lambda: cache.set_many({key: new_token() for key in keys}, None))
+
+
+def current_token(key):
+    """
+    Returns the version token stored under `key`, creating one if it was never set
+    (or was evicted). `cache.add` keeps the token of a concurrent writer if one won.
+    """
+    token = cache.get(key)
+    if token is None:
+        cache.add(key, new_token(), None)
+        token = cache.get(key)
+    return token
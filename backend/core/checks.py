@@ -0,0 +1,29 @@
+"""
+Richwell Portal — System Checks
+
+Cached projections (prerequisite graphs, transcripts, graduation audits, dashboard
+snapshots) are invalidated by signals in the process that saved the change. A
+per-process cache backend leaves every other worker serving stale data, so it is
+reported by `manage.py check` outside DEBUG.
+"""
+
+from django.conf import settings
+from django.core import checks
+
+PER_PROCESS_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if settings.DEBUG or backend not in PER_PROCESS_BACKENDS:
+        return []
+    return [checks.Warning(
+        f"The default cache ({backend}) is not shared between worker processes.",
+        hint="Cached prerequisite graphs, transcripts and audits would go stale in other workers. "
+             "Use the DatabaseCache or set REDIS_URL (see config/settings/base.py).",
+        id='core.W001',
+    )]
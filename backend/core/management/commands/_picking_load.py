@@ -0,0 +1,369 @@
+"""
+Helpers for the schedule picking load test (`benchmark_picking`).
+This is NOT a Django management command — it's imported by benchmark_picking.
+
+The benchmark runs in its own program (BENCH) and term (BENCH-1 by default), so it
+never touches the seeded curricula or the active term. Students are created with
+the shared `_base_seeder` helpers from index 90000 upward.
+"""
+import math
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+
+from django.db import connection, connections, transaction
+from django.db.models import Count, F
+from django.db.utils import OperationalError
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.academics.models import CurriculumVersion, Program, Subject
+from apps.grades.models import Grade
+from apps.scheduling.models import Schedule
+from apps.scheduling.services.picking_service import PickingService
+from apps.scheduling.services.week_grid import WeekGrid
+from apps.sections.models import Section, SectionStudent
+from apps.sections.services.seat_counter import SeatCounter
+from apps.students.models import Student, StudentEnrollment
+from apps.terms.models import Term
+from core.exceptions import ConflictError
+from core.management.commands._base_seeder import (
+    assign_schedules,
+    create_enrollment,
+    create_grade_records,
+    create_rooms,
+    create_sections,
+    create_term,
+    generate_student,
+)
+
+
+BENCH_PROGRAM_CODE = 'BENCH'
+BENCH_ID_START = 90000
+
+# (code, lec_units, lab_units)
+BENCH_SUBJECTS = [
+    ('BENCH101', 3, 0),
+    ('BENCH102', 2, 1),
+    ('BENCH103', 3, 0),
+    ('BENCH104', 2, 1),
+    ('BENCH105', 3, 0),
+    ('BENCH106', 2, 0),
+]
+
+# Seeding creates thousands of users; the real hasher would dominate the setup time
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+# ──────────────────────────────────────────────
+# Seeding
+# ──────────────────────────────────────────────
+
+def get_bench_curriculum():
+    """Creates (or reuses) the self-contained BENCH program, curriculum and Y1S1 subjects."""
+    program, _ = Program.objects.get_or_create(
+        code=BENCH_PROGRAM_CODE, defaults={'name': 'Picking Benchmark Program'}
+    )
+    curriculum, _ = CurriculumVersion.objects.get_or_create(
+        program=program, version_name='BENCH', defaults={'is_active': True}
+    )
+    subjects = []
+    for code, lec, lab in BENCH_SUBJECTS:
+        subject, _ = Subject.objects.get_or_create(
+            curriculum=curriculum, code=code,
+            defaults={
+                'description': f'Benchmark Subject {code[-3:]}',
+                'year_level': 1,
+                'semester': '1',
+                'lec_units': lec,
+                'lab_units': lab,
+                'total_units': lec + lab,
+            },
+        )
+        subjects.append(subject)
+    return program, curriculum, subjects
+
+
+def wipe_bench_term(term_code, stdout):
+    """Deletes the benchmark term and the BENCH students (and their users)."""
+    with transaction.atomic():
+        Schedule.objects.filter(term__code=term_code).delete()
+        Grade.objects.filter(term__code=term_code).delete()
+        SectionStudent.objects.filter(term__code=term_code).delete()
+        Section.objects.filter(term__code=term_code).delete()
+        StudentEnrollment.objects.filter(term__code=term_code).delete()
+        Term.objects.filter(code=term_code).delete()
+
+        user_ids = list(
+            Student.objects.filter(program__code=BENCH_PROGRAM_CODE).values_list('user_id', flat=True)
+        )
+        Student.objects.filter(user_id__in=user_ids).delete()
+        User.objects.filter(id__in=user_ids).delete()
+    stdout.write(f'  Wiped benchmark term {term_code} and {len(user_ids)} benchmark students')
+
+
+def seed_picking_term(stdout, term_code='BENCH-1', students=1000, irregular_ratio=0.2,
+                      seat_ratio=1.0, section_size=40):
+    """
+    Seeds a published term where every student has approved advising but no section.
+
+    Args:
+        stdout:          Management command stdout.
+        term_code:       Code of the benchmark term (created inactive).
+        students:        Number of students to create.
+        irregular_ratio: Share of students that use the per-subject (irregular) picker.
+        seat_ratio:      Seats per student; below 1.0 the rush ends with full sections.
+        section_size:    max_students of every benchmark section.
+
+    Returns:
+        Term: The seeded benchmark term.
+    """
+    program, curriculum, subjects = get_bench_curriculum()
+    term = create_term(
+        stdout, code=term_code, academic_year='2026-2027', is_active=False,
+    )
+    term.schedule_published = True
+    term.picking_published_at = timezone.now()
+    term.save(skip_audit=True)
+
+    seats = max(1, math.ceil(students * seat_ratio))
+    num_sections = max(1, math.ceil(seats / section_size))
+    sections = create_sections(term, program, 1, num_sections * 40, subjects, stdout)
+    Section.objects.filter(term=term).update(max_students=section_size)
+    assign_schedules(sections, [], create_rooms(stdout), stdout)
+
+    num_irregular = round(students * irregular_ratio)
+    with override_settings(PASSWORD_HASHERS=FAST_HASHERS):
+        for offset in range(students):
+            with transaction.atomic():
+                student = generate_student(
+                    BENCH_ID_START + offset, program, curriculum, status='ENROLLED',
+                    dob=date(2005, (offset % 12) + 1, (offset % 28) + 1),
+                )
+                create_enrollment(student, term, None, is_regular=offset >= num_irregular)
+                create_grade_records(student, term, subjects)
+
+    stdout.write(
+        f'  Students: {students} ({num_irregular} irregular), '
+        f'seats: {num_sections * section_size} in {num_sections} sections'
+    )
+    return term
+
+
+def reset_picks(term):
+    """Clears every pick of the benchmark term so the rush can be replayed on the same data."""
+    with transaction.atomic():
+        SectionStudent.objects.filter(term=term).delete()
+        Grade.objects.filter(term=term).update(section=None)
+        Section.objects.filter(term=term).update(student_count=0)
+
+
+# ──────────────────────────────────────────────
+# Load run
+# ──────────────────────────────────────────────
+
+def build_pick_plan(term, seed):
+    """
+    Builds one pick request per enrolled student.
+
+    Regular students ask for AM about twice as often as PM. Irregular students pick
+    a random section per subject, skipping sections that clash with what they already
+    chose, like a student working through the individual picker.
+
+    Returns:
+        list[tuple]: (student_id, 'regular', session) or (student_id, 'irregular', selections).
+    """
+    rng = random.Random(seed)
+    schedules = {}
+    for schedule in Schedule.objects.filter(term=term).only('section_id', 'subject_id', 'days', 'start_time', 'end_time'):
+        schedules.setdefault((schedule.section_id, schedule.subject_id), []).append(schedule)
+    sections_by_subject = {}
+    for section_id, subject_id in schedules:
+        sections_by_subject.setdefault(subject_id, []).append(section_id)
+
+    subjects_by_student = {}
+    for student_id, subject_id in Grade.objects.filter(
+        term=term, advising_status=Grade.ADVISING_APPROVED
+    ).order_by('student_id', 'subject_id').values_list('student_id', 'subject_id'):
+        subjects_by_student.setdefault(student_id, []).append(subject_id)
+
+    plan = []
+    enrollments = StudentEnrollment.objects.filter(term=term).order_by('student_id')
+    for student_id, is_regular in enrollments.values_list('student_id', 'is_regular'):
+        if is_regular:
+            plan.append((student_id, 'regular', rng.choice(['AM', 'AM', 'PM'])))
+            continue
+
+        taken = WeekGrid()
+        selections = []
+        for subject_id in subjects_by_student.get(student_id, []):
+            candidates = list(sections_by_subject.get(subject_id, []))
+            rng.shuffle(candidates)
+            for section_id in candidates:
+                grid = WeekGrid.from_schedules(schedules[(section_id, subject_id)])
+                if not taken.overlaps(grid):
+                    taken.update(grid)
+                    selections.append({'subject_id': subject_id, 'section_id': section_id})
+                    break
+        plan.append((student_id, 'irregular', selections))
+
+    rng.shuffle(plan)
+    return plan
+
+
+def classify_error(exc):
+    """Maps an exception raised by a pick to a report outcome."""
+    if isinstance(exc, ConflictError):
+        return 'conflict' if 'conflicts with' in str(exc.detail) else 'full'
+    if isinstance(exc, OperationalError):
+        message = str(exc).lower()
+        if 'deadlock' in message:
+            return 'deadlock'
+        if 'locked' in message or 'lock timeout' in message or 'could not obtain lock' in message:
+            return 'lock_timeout'
+    return 'error'
+
+
+def run_pick(term_id, task):
+    """
+    Performs one pick like a request would: fresh objects, own transaction, and the
+    connection closed afterwards.
+
+    Returns:
+        tuple: (outcome, latency_seconds, error_message or None)
+    """
+    student_id, kind, payload = task
+    started = time.perf_counter()
+    message = None
+    try:
+        student = Student.objects.select_related('program').get(id=student_id)
+        term = Term.objects.get(id=term_id)
+        if kind == 'regular':
+            _, redirected = PickingService().pick_schedule_regular(student, term, payload)
+            outcome = 'redirected' if redirected else 'assigned'
+        else:
+            PickingService().pick_schedule_irregular(student, term, payload)
+            outcome = 'assigned'
+    except Exception as exc:
+        outcome = classify_error(exc)
+        message = f'{type(exc).__name__}: {exc}'
+    finally:
+        connection.close()
+    return outcome, time.perf_counter() - started, message
+
+
+class LockWaitSampler(threading.Thread):
+    """Samples the number of ungranted PostgreSQL locks while the rush is running."""
+
+    INTERVAL = 0.02
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            with connections['default'].cursor() as cursor:
+                while not self._stop_event.is_set():
+                    cursor.execute('SELECT count(*) FROM pg_locks WHERE NOT granted')
+                    self.samples.append(cursor.fetchone()[0])
+                    self._stop_event.wait(self.INTERVAL)
+        finally:
+            connection.close()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def summary(self):
+        waiting = [sample for sample in self.samples if sample]
+        return {
+            'samples': len(self.samples),
+            'samples_with_waiters': len(waiting),
+            'max_waiting': max(self.samples, default=0),
+            'mean_waiting': round(sum(self.samples) / len(self.samples), 2) if self.samples else 0,
+        }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def find_capacity_violations(term):
+    """Sections holding more SectionStudent rows than max_students."""
+    return list(
+        Section.objects.filter(term=term)
+        .annotate(actual=Count('student_assignments'))
+        .filter(actual__gt=F('max_students'))
+        .order_by('id')
+        .values('id', 'name', 'max_students', 'actual')
+    )
+
+
+def run_picking_load(term, workers=32, mode='thread', seed=42):
+    """
+    Fires one pick per enrolled student of `term` through a thread or process pool
+    and checks the invariants afterwards.
+
+    Returns:
+        dict: Throughput, latency percentiles (ms), outcome counts, lock waits
+              (PostgreSQL only), deadlocks, capacity violations and counter drift.
+    """
+    plan = build_pick_plan(term, seed)
+    vendor = connection.vendor
+    sampler = LockWaitSampler() if vendor == 'postgresql' else None
+
+    if mode == 'process':
+        # Forked workers must not inherit an open database socket
+        connections.close_all()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    if sampler:
+        sampler.start()
+    started = time.perf_counter()
+    with pool:
+        results = list(pool.map(run_pick, [term.id] * len(plan), plan))
+    elapsed = time.perf_counter() - started
+    if sampler:
+        sampler.stop()
+
+    outcomes = Counter(outcome for outcome, _, _ in results)
+    latencies = sorted(latency * 1000 for _, latency, _ in results)
+    errors = Counter(message for outcome, _, message in results if outcome in ('error', 'deadlock', 'lock_timeout'))
+
+    return {
+        'database': vendor,
+        'mode': mode,
+        'workers': workers,
+        'picks': len(plan),
+        'regular': sum(1 for _, kind, _ in plan if kind == 'regular'),
+        'irregular': sum(1 for _, kind, _ in plan if kind == 'irregular'),
+        'elapsed_s': round(elapsed, 3),
+        'throughput_per_s': round(len(plan) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 2),
+            'p95': round(percentile(latencies, 95), 2),
+            'p99': round(percentile(latencies, 99), 2),
+            'max': round(latencies[-1], 2) if latencies else 0.0,
+        },
+        'outcomes': dict(outcomes),
+        'lock_timeouts': outcomes.get('lock_timeout', 0),
+        'deadlocks': outcomes.get('deadlock', 0),
+        'lock_waits': sampler.summary() if sampler else None,
+        'capacity_violations': find_capacity_violations(term),
+        'counter_drift': SeatCounter.reconcile(term=term, dry_run=True),
+        'seated': SectionStudent.objects.filter(term=term).count(),
+        'errors': [{'message': message, 'count': count} for message, count in errors.most_common(5)],
+    }
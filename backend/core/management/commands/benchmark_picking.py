@@ -0,0 +1,129 @@
+"""
+Management Command — Schedule Picking Load Test
+File: core/management/commands/benchmark_picking.py
+
+Seeds a realistic picking term (BENCH program, BENCH-1 term) and replays the
+picking rush: one pick per student fired through a thread or process pool
+straight at PickingService. Reports throughput, p50/p95/p99 latency, lock
+timeouts, deadlocks, PostgreSQL lock waits, capacity violations and seat
+counter drift.
+
+Usage:
+    python manage.py benchmark_picking --students 2000 --workers 64
+    python manage.py benchmark_picking --seat-ratio 0.8 --section-size 35 --mode process
+    python manage.py benchmark_picking --cleanup
+"""
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.terms.models import Term
+from core.management.commands._picking_load import (
+    reset_picks,
+    run_picking_load,
+    seed_picking_term,
+    wipe_bench_term,
+)
+
+
+class Command(BaseCommand):
+    help = 'Load-tests schedule picking with many concurrent pickers on a seeded benchmark term.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000, help='Students to seed (default 1000).')
+        parser.add_argument('--irregular-ratio', type=float, default=0.2, help='Share of irregular pickers (default 0.2).')
+        parser.add_argument('--seat-ratio', type=float, default=1.0,
+                            help='Seats per student; below 1.0 sections run out (default 1.0).')
+        parser.add_argument('--section-size', type=int, default=40, help='max_students per section (default 40).')
+        parser.add_argument('--workers', type=int, default=32, help='Concurrent pickers (default 32).')
+        parser.add_argument('--mode', choices=['thread', 'process'], default='thread')
+        parser.add_argument('--seed', type=int, default=42, help='Seed for the pick plan.')
+        parser.add_argument('--term-code', default='BENCH-1', help='Benchmark term code (default BENCH-1).')
+        parser.add_argument('--reseed', action='store_true', help='Wipe and re-seed the benchmark term first.')
+        parser.add_argument('--cleanup', action='store_true', help='Delete the benchmark term and students, then exit.')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+        parser.add_argument('--strict', action='store_true',
+                            help='Also fail on deadlocks, lock timeouts and unexpected errors.')
+        parser.add_argument('--force', action='store_true', help='Run even when DEBUG is off.')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('benchmark_picking writes thousands of rows; run it on a development database or pass --force.')
+
+        term_code = options['term_code']
+        if options['cleanup'] or options['reseed']:
+            wipe_bench_term(term_code, self.stdout)
+            if options['cleanup']:
+                return
+
+        if options['mode'] == 'process' and connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            raise CommandError('Process mode needs a file-backed SQLite or a PostgreSQL database.')
+
+        term = Term.objects.filter(code=term_code).first()
+        if term is None:
+            self.stdout.write(f'Seeding benchmark term {term_code}...')
+            term = seed_picking_term(
+                self.stdout,
+                term_code=term_code,
+                students=options['students'],
+                irregular_ratio=options['irregular_ratio'],
+                seat_ratio=options['seat_ratio'],
+                section_size=options['section_size'],
+            )
+        else:
+            self.stdout.write(f'Reusing benchmark term {term_code} (pass --reseed to rebuild it).')
+        reset_picks(term)
+
+        self.stdout.write(f"Running the picking rush with {options['workers']} {options['mode']} workers...")
+        report = run_picking_load(term, workers=options['workers'], mode=options['mode'], seed=options['seed'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self._print_report(report)
+
+        failures = []
+        if report['capacity_violations']:
+            failures.append(f"{len(report['capacity_violations'])} overbooked section(s)")
+        if report['counter_drift']:
+            failures.append(f"{len(report['counter_drift'])} drifted seat counter(s)")
+        if options['strict']:
+            for key in ('deadlocks', 'lock_timeouts'):
+                if report[key]:
+                    failures.append(f'{report[key]} {key.replace("_", " ")}')
+            if report['outcomes'].get('error'):
+                failures.append(f"{report['outcomes']['error']} unexpected error(s)")
+        if failures:
+            raise CommandError('Picking load test failed: ' + ', '.join(failures))
+
+    def _print_report(self, report):
+        latency = report['latency_ms']
+        self.stdout.write(
+            f"  {report['picks']} picks ({report['regular']} regular, {report['irregular']} irregular) "
+            f"on {report['database']} in {report['elapsed_s']}s — {report['throughput_per_s']} picks/s"
+        )
+        self.stdout.write(
+            f"  Latency ms: p50 {latency['p50']}, p95 {latency['p95']}, p99 {latency['p99']}, max {latency['max']}"
+        )
+        outcomes = ', '.join(f'{name} {count}' for name, count in sorted(report['outcomes'].items()))
+        self.stdout.write(f'  Outcomes: {outcomes}; seated {report["seated"]}')
+        self.stdout.write(f"  Lock timeouts: {report['lock_timeouts']}, deadlocks: {report['deadlocks']}")
+        if report['lock_waits'] is not None:
+            waits = report['lock_waits']
+            self.stdout.write(
+                f"  Lock waits: {waits['samples_with_waiters']}/{waits['samples']} samples with waiters, "
+                f"max {waits['max_waiting']}, mean {waits['mean_waiting']}"
+            )
+        for row in report['errors']:
+            self.stdout.write(self.style.WARNING(f"  {row['count']}x {row['message']}"))
+
+        for row in report['capacity_violations']:
+            self.stdout.write(self.style.ERROR(f"  OVERBOOKED {row['name']}: {row['actual']}/{row['max_students']}"))
+        for row in report['counter_drift']:
+            self.stdout.write(self.style.ERROR(
+                f"  DRIFT {row['name']}: counter {row['student_count']}, actual {row['actual']}"
+            ))
+        if not report['capacity_violations'] and not report['counter_drift']:
+            self.stdout.write(self.style.SUCCESS('  No capacity violations; seat counters match.'))
@@ -0,0 +1,28 @@
+import pytest
+from django.core.cache import cache
+
+from core.cache import current_token, drop_now_and_on_commit, rotate_token
+
+
+@pytest.mark.django_db
+class TestCacheHelpers:
+    def test_drop_runs_now_and_again_on_commit(self, django_capture_on_commit_callbacks):
+        cache.set_many({'helper:a': 1, 'helper:b': 2})
+        with django_capture_on_commit_callbacks(execute=True):
+            drop_now_and_on_commit('helper:a', 'helper:b', None)
+            assert cache.get_many(['helper:a', 'helper:b']) == {}
+            # A concurrent reader re-caches pre-commit data before the commit
+            cache.set('helper:a', 'stale')
+
+        assert cache.get('helper:a') is None
+
+    def test_rotate_token_replaces_the_current_token(self, django_capture_on_commit_callbacks):
+        token = current_token('helper:version')
+        assert current_token('helper:version') == token
+
+        with django_capture_on_commit_callbacks(execute=True):
+            rotate_token('helper:version')
+            rotated = cache.get('helper:version')
+            assert rotated != token
+
+        assert current_token('helper:version') not in (token, rotated)
@@ -0,0 +1,109 @@
+import io
+import zipfile
+import pytest
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.facilities.models import Room
+from apps.grades.models import Grade
+from apps.reports.services.cor_batch import CORBatchService
+from apps.reports.services.report_service import ReportService
+from apps.scheduling.models import Schedule
+from apps.sections.models import Section, SectionStudent
+from apps.students.models import Student, StudentEnrollment
+from tests.factories import TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestCORBatch:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = TermFactory()
+        program = Program.objects.create(code='COR', name='COR Batch')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        subjects = [
+            Subject.objects.create(curriculum=curriculum, code=f'CB10{i}', description=f'Subject {i}',
+                                   year_level=1, semester='1', total_units=3)
+            for i in range(2)
+        ]
+        self.sections = [
+            Section.objects.create(name=f'CB 1-{i}', term=self.term, program=program, year_level=1,
+                                   section_number=i, session='AM')
+            for i in (1, 2)
+        ]
+        rooms = [Room.objects.create(name=f'CB R{i}', room_type='LECTURE', capacity=40) for i in (1, 2)]
+        for section, room, hour in zip(self.sections, rooms, (8, 13)):
+            for subject in subjects:
+                Schedule.objects.create(term=self.term, section=section, subject=subject, component_type='LEC',
+                                        room=room, days=['M', 'W'], start_time=time(hour), end_time=time(hour + 1))
+
+        self.students = []
+        for i in range(10):
+            student = Student.objects.create(
+                user=User.objects.create(username=f'cbstud{i}', email=f'cbstud{i}@test.com', role='STUDENT',
+                                         first_name='Stud', last_name=f'{i}'),
+                idn=f'33{i:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+            )
+            section = self.sections[i % 2]
+            StudentEnrollment.objects.create(student=student, term=self.term, year_level=1, advising_status='APPROVED')
+            SectionStudent.objects.create(section=section, term=self.term, student=student)
+            for subject in subjects:
+                Grade.objects.create(student=student, subject=subject, term=self.term, section=section,
+                                     advising_status=Grade.ADVISING_APPROVED, grade_status=Grade.STATUS_ENROLLED)
+            self.students.append(student)
+        # Enrolled but not advised: no COR
+        Grade.objects.filter(student=self.students[9]).update(advising_status=Grade.ADVISING_PENDING)
+
+        self.registrar = User.objects.create(username='cbreg', email='cbreg@test.com', role='REGISTRAR')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.registrar)
+
+    def test_documents_are_preloaded_in_three_queries(self, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            documents = CORBatchService.documents(self.term)
+
+        assert [d['idn'] for d in documents] == [s.idn for s in self.students[:9]]
+        # Each student sees their own section's slot
+        assert documents[0]['rows'][0] == ('CB100', 'Subject 0', 3, 'MW 08:00AM', 'CB R1')
+        assert documents[1]['rows'][0][3:] == ('MW 01:00PM', 'CB R2')
+
+        section_batch = CORBatchService.documents(self.term, section_id=self.sections[1].id)
+        assert [d['idn'] for d in section_batch] == [s.idn for s in self.students[1:9:2]]
+
+    def test_zip_is_rendered_in_a_process_pool(self):
+        documents = CORBatchService.documents(self.term)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(CORBatchService.stream_zip(documents, workers=2))))
+
+        assert archive.namelist() == [f"COR_{d['idn']}.pdf" for d in documents]
+        assert all(archive.read(name).startswith(b'%PDF') for name in archive.namelist())
+
+    def test_endpoint_writes_one_release_entry_per_batch(self):
+        response = self.client.get('/api/reports/cor-batch/', {'term_id': self.term.id})
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/pdf'
+        assert response.content.startswith(b'%PDF')
+
+        response = self.client.get('/api/reports/cor-batch/', {
+            'term_id': self.term.id, 'section_id': self.sections[0].id, 'output': 'zip'
+        })
+        assert response.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        assert len(archive.namelist()) == 5
+
+        entries = AuditLog.objects.filter(action='RELEASE', model_name='COR').order_by('id')
+        assert [(e.changes['output'], e.changes['count']) for e in entries] == [('pdf', 9), ('zip', 5)]
+
+        assert self.client.get('/api/reports/cor-batch/', {'term_id': self.term.id, 'output': 'doc'}).status_code == 400
+        self.client.force_authenticate(user=self.students[0].user)
+        assert self.client.get('/api/reports/cor-batch/', {'term_id': self.term.id}).status_code == 403
+
+    def test_single_cor_uses_the_same_loader(self):
+        assert ReportService.generate_cor_pdf(self.students[0].id, self.term.id).read().startswith(b'%PDF')
+        with pytest.raises(ValueError):
+            ReportService.generate_cor_pdf(self.students[9].id, self.term.id)
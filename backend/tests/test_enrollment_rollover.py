@@ -0,0 +1,113 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+
+from apps.auditing.models import AuditLog
+from apps.students.models import Student, StudentEnrollment
+from apps.students.services import rollover_enrollments, get_rollover_checkpoint
+from tests.factories import StudentFactory, StudentEnrollmentFactory, TermFactory
+
+User = get_user_model()
+
+
+class Interrupted(Exception):
+    pass
+
+
+@pytest.mark.django_db
+class TestEnrollmentRollover:
+    def test_enrolls_eligible_students_in_chunks(self, active_term, program, curriculum):
+        eligible = StudentFactory.create_batch(5, program=program, curriculum=curriculum, status='ENROLLED')
+        StudentFactory.create_batch(2, program=program, curriculum=curriculum, status='APPLICANT')
+        StudentEnrollmentFactory(student=eligible[0], term=active_term, advising_status='APPROVED')
+
+        result = rollover_enrollments(term=active_term, chunk_size=2)
+
+        assert result['processed'] == 5
+        assert result['created'] == 4
+        assert result['skipped'] == 1
+        assert result['completed'] is True
+        assert StudentEnrollment.objects.filter(term=active_term).count() == 5
+        # Existing enrollment is left untouched
+        assert StudentEnrollment.objects.get(student=eligible[0], term=active_term).advising_status == 'APPROVED'
+        assert AuditLog.objects.filter(action='BULK_ENROLL').count() == 1
+
+    def test_carries_forward_monthly_commitment(self, active_term, program, curriculum):
+        previous_term = TermFactory(is_active=False)
+        student = StudentFactory(program=program, curriculum=curriculum, status='ADMITTED')
+        StudentEnrollmentFactory(student=student, term=previous_term, monthly_commitment=4500)
+
+        rollover_enrollments(term=active_term)
+
+        enrollment = StudentEnrollment.objects.get(student=student, term=active_term)
+        assert enrollment.monthly_commitment == 4500
+        assert enrollment.advising_status == 'DRAFT'
+        assert enrollment.year_level == 1
+
+    def test_resumes_from_checkpoint(self, active_term, program, curriculum):
+        students = StudentFactory.create_batch(4, program=program, curriculum=curriculum, status='ENROLLED')
+        students.sort(key=lambda s: s.id)
+
+        def stop_after_first_chunk(progress):
+            raise Interrupted()
+
+        with pytest.raises(Interrupted):
+            rollover_enrollments(term=active_term, chunk_size=2, on_progress=stop_after_first_chunk)
+
+        checkpoint = get_rollover_checkpoint(active_term)
+        assert checkpoint['last_student_id'] == students[1].id
+        assert checkpoint['completed'] is False
+
+        result = rollover_enrollments(term=active_term, chunk_size=2)
+        assert result['processed'] == 4
+        assert result['created'] == 4
+        assert StudentEnrollment.objects.filter(term=active_term).count() == 4
+
+    def test_endpoint_requires_records_staff(self, api_client, admin_user, student_user, active_term, program, curriculum):
+        StudentFactory.create_batch(3, program=program, curriculum=curriculum, status='ENROLLED')
+        url = reverse('student-enrollment-rollover')
+
+        api_client.force_authenticate(user=student_user)
+        assert api_client.post(url).status_code == status.HTTP_403_FORBIDDEN
+
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['created'] == 3
+
+        status_response = api_client.get(reverse('student-enrollment-rollover-status'))
+        assert status_response.data['progress']['completed'] is True
+
+    def test_form_restart_flag_is_parsed(self, api_client, admin_user, active_term, program, curriculum):
+        for i in range(3):
+            Student.objects.create(
+                user=User.objects.create(username=f'rostud{i}', email=f'rostud{i}@test.com', role='STUDENT'),
+                idn=f'36{i:04d}', program=program, curriculum=curriculum, date_of_birth=date(2005, 1, 1),
+                gender='FEMALE', student_type='FRESHMAN', status='ENROLLED'
+            )
+
+        def stop_after_first_chunk(progress):
+            raise Interrupted()
+
+        url = reverse('student-enrollment-rollover')
+        api_client.force_authenticate(user=admin_user)
+        for restart, expected in (('false', (3, 3, 0)), ('true', (3, 2, 1))):
+            StudentEnrollment.objects.filter(term=active_term).delete()
+            with pytest.raises(Interrupted):
+                rollover_enrollments(term=active_term, chunk_size=1, on_progress=stop_after_first_chunk)
+
+            # Form data sends the flag as a string; 'false' resumes the checkpoint
+            response = api_client.post(url, {'restart': restart})
+            assert (response.data['processed'], response.data['created'], response.data['skipped']) == expected
+
+    def test_invalid_term_id_is_rejected(self, api_client, admin_user, active_term):
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.post(reverse('student-enrollment-rollover'), {'term': 'abc'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['details']['term'] == ['A valid term id is required.']
+        response = api_client.get(reverse('student-enrollment-rollover-status'), {'term': 'abc'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not StudentEnrollment.objects.filter(term=active_term).exists()
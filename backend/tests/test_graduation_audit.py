@@ -0,0 +1,129 @@
+import csv
+import io
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+from openpyxl import load_workbook
+from rest_framework.test import APIClient
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.auditing.models import AuditLog
+from apps.grades.models import Grade
+from apps.reports.services.graduation_audit import GraduationAudit, EXPORT_HEADERS
+from apps.reports.services.report_service import ReportService
+from apps.students.models import Student, StudentEnrollment
+from apps.students.services import rollover_enrollments
+from tests.factories import TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestGraduationAudit:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = TermFactory()
+        self.program = Program.objects.create(code='GA', name='Graduation Audit')
+        curricula = [CurriculumVersion.objects.create(program=self.program, version_name=f'V{i}') for i in (1, 2)]
+        self.subjects = [
+            Subject.objects.create(curriculum=curricula[0], code=f'GA10{i}', description=f'Subject {i}',
+                                   year_level=1 + i // 2, semester=str(1 + i % 2), total_units=3)
+            for i in range(4)
+        ]
+        Subject.objects.create(curriculum=curricula[1], code='GA200', description='Other', year_level=1,
+                               semester='1', total_units=5)
+
+        self.students = []
+        for i in range(6):
+            student = Student.objects.create(
+                user=User.objects.create(username=f'gastud{i}', email=f'gastud{i}@test.com', role='STUDENT',
+                                         first_name='Grad', last_name=f'{i}'),
+                idn=f'35{i:04d}', program=self.program, curriculum=curricula[1 if i == 5 else 0],
+                date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN', status='ENROLLED'
+            )
+            if i % 2 == 0:
+                StudentEnrollment.objects.create(student=student, term=self.term, year_level=2)
+            self.students.append(student)
+
+        # Student 0 passed everything; student 1 misses the last subject; others have nothing yet
+        for student, subjects in ((self.students[0], self.subjects), (self.students[1], self.subjects[:3])):
+            for subject in subjects:
+                Grade.objects.create(student=student, subject=subject, term=self.term,
+                                     grade_status=Grade.STATUS_PASSED, final_grade='1.50')
+        Grade.objects.create(student=self.students[1], subject=self.subjects[3], term=self.term,
+                             grade_status=Grade.STATUS_FAILED, final_grade='5.00')
+        self.students[4].status = 'GRADUATED'
+        self.students[4].save()
+
+    def test_cohort_is_audited_in_three_queries(self, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            results = GraduationAudit.audit(GraduationAudit.cohort(program_id=self.program.id))
+
+        # Graduated students are no longer candidates
+        assert [r['idn'] for r in results] == ['350000', '350001', '350002', '350003', '350005']
+        first, second, empty, _, other = results
+        assert (first['is_eligible'], first['total_units_earned'], first['missing_subjects']) == (True, 12, [])
+        assert second['is_eligible'] is False
+        assert second['total_units_earned'] == 9
+        assert second['missing_subjects'] == [{'code': 'GA103', 'name': 'Subject 3', 'year_level': 2, 'semester': '2'}]
+        assert [s['code'] for s in empty['missing_subjects']] == ['GA100', 'GA101', 'GA102', 'GA103']
+        assert (other['total_units_required'], other['missing_subjects'][0]['code']) == (5, 'GA200')
+
+    def test_single_student_check_matches_the_cohort(self):
+        cohort = {r['student_id']: r for r in GraduationAudit.audit(GraduationAudit.cohort(program_id=self.program.id))}
+        for student in (self.students[0], self.students[1], self.students[5]):
+            check = ReportService.graduation_check(student.id)
+            assert check == {key: cohort[student.id][key] for key in check}
+        with pytest.raises(Student.DoesNotExist):
+            ReportService.graduation_check(0)
+
+    def test_cohorts_are_cached_until_grades_change(self, django_assert_num_queries):
+        audit = GraduationAudit.for_cohort(program_id=self.program.id, term_id=self.term.id)
+        assert [s['idn'] for s in audit['students']] == ['350000', '350002']
+        assert audit['summary'] == {'total': 2, 'eligible': 1, 'ineligible': 1}
+
+        with django_assert_num_queries(0):
+            assert GraduationAudit.for_cohort(program_id=self.program.id, term_id=self.term.id) == audit
+
+        for subject in self.subjects:
+            Grade.objects.create(student=self.students[2], subject=subject, term=self.term,
+                                 grade_status=Grade.STATUS_PASSED, final_grade='2.00')
+        audit = GraduationAudit.for_cohort(program_id=self.program.id, term_id=self.term.id)
+        assert audit['summary']['eligible'] == 2
+
+    def test_rollover_retires_term_cohorts(self):
+        next_term = TermFactory()
+        assert GraduationAudit.for_cohort(term_id=next_term.id)['summary']['total'] == 0
+
+        rollover_enrollments(term=next_term)
+        assert GraduationAudit.for_cohort(term_id=next_term.id)['summary']['total'] == 5
+
+    def test_exports_match(self):
+        audit = GraduationAudit.for_cohort(program_id=self.program.id)
+        rows = [list(row) for row in load_workbook(GraduationAudit.export_excel(audit))['Graduation Audit'].iter_rows(values_only=True)]
+        assert rows[0] == EXPORT_HEADERS
+        assert rows[2] == ['350001', 'Grad 1', 'GA', 'ENROLLED', 'No', 9, 12, 1, 'GA103']
+
+        text = ''.join(GraduationAudit.stream_csv(audit, chunk_size=2))
+        assert list(csv.reader(io.StringIO(text))) == [['' if value is None else str(value) for value in row] for row in rows]
+
+    def test_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create(username='gareg', email='gareg@test.com', role='REGISTRAR'))
+
+        assert client.get('/api/reports/graduation-audit/').status_code == 400
+        response = client.get('/api/reports/graduation-audit/', {'program_id': self.program.id})
+        assert response.status_code == 200
+        assert response.data['summary'] == {'total': 5, 'eligible': 1, 'ineligible': 4}
+
+        response = client.get('/api/reports/graduation-audit/', {'term_id': self.term.id, 'output': 'csv'})
+        assert response['Content-Type'] == 'text/csv'
+        assert len(b''.join(response.streaming_content).decode().splitlines()) == 3
+        response = client.get('/api/reports/graduation-audit/', {'program_id': self.program.id, 'output': 'xlsx'})
+        assert load_workbook(io.BytesIO(b''.join(response.streaming_content)))['Graduation Audit'].max_row == 6
+
+        assert list(AuditLog.objects.filter(action='RELEASE', model_name='GraduationAudit')
+                    .order_by('id').values_list('changes__output', flat=True)) == ['csv', 'xlsx']
+
+        client.force_authenticate(user=self.students[0].user)
+        assert client.get('/api/reports/graduation-audit/', {'program_id': self.program.id}).status_code == 403
@@ -0,0 +1,100 @@
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.grades.models import Grade
+from apps.grades.services.grading_service import GradingService
+from apps.notifications.models import Notification
+from apps.notifications.services.notification_service import NotificationService
+from apps.sections.models import Section
+from apps.students.models import Student
+from tests.factories import TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestNotificationDigest:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.term = TermFactory()
+        program = Program.objects.create(code='DIG', name='Digest Test')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        self.subject = Subject.objects.create(curriculum=curriculum, code='DG101', description='Digest',
+                                              year_level=1, semester='1', total_units=3)
+        self.sections = [
+            Section.objects.create(name=f'DG 1-{i}', term=self.term, program=program, year_level=1,
+                                   section_number=i, session='AM')
+            for i in (1, 2)
+        ]
+        self.registrars = [
+            User.objects.create(username=f'dgreg{i}', email=f'dgreg{i}@test.com', role=role)
+            for i, role in enumerate(['REGISTRAR', 'HEAD_REGISTRAR'])
+        ]
+        self.professor = User.objects.create(username='dgadmin', email='dgadmin@test.com', role='ADMIN',
+                                             first_name='Lea', last_name='Santos')
+        self.grades = []
+        for i in range(4):
+            student = Student.objects.create(
+                user=User.objects.create(username=f'dgstud{i}', email=f'dgstud{i}@test.com', role='STUDENT'),
+                idn=f'29{i:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='FEMALE', student_type='FRESHMAN'
+            )
+            self.grades.append(Grade.objects.create(
+                student=student, subject=self.subject, term=self.term, section=self.sections[i // 3],
+                grade_status=Grade.STATUS_ENROLLED
+            ))
+
+    def submit(self, grade):
+        GradingService().submit_final(grade.id, Decimal('2.0'), self.professor, override_window=True)
+
+    def test_registrar_list_is_cached_until_users_change(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert NotificationService.registrar_ids() == [user.id for user in self.registrars]
+        with django_assert_num_queries(0):
+            assert NotificationService.registrar_ids(include_head=False) == [self.registrars[0].id]
+
+        extra = User.objects.create(username='dgreg9', email='dgreg9@test.com', role='REGISTRAR')
+        assert extra.id in NotificationService.registrar_ids()
+        extra.is_active = False
+        extra.save()
+        assert extra.id not in NotificationService.registrar_ids()
+
+    def test_submissions_for_a_section_share_one_digest(self, django_assert_num_queries):
+        NotificationService.registrar_ids()
+        for grade in self.grades[:3]:
+            self.submit(grade)
+
+        digests = Notification.objects.filter(title="Final Grades Submitted", digest_key__startswith='grade-final')
+        assert digests.count() == 2
+        assert set(digests.values_list('recipient_id', flat=True)) == {user.id for user in self.registrars}
+        assert set(digests.values_list('event_count', flat=True)) == {3}
+        assert digests.first().message == "Lea Santos submitted final grades for DG101 - DG 1-1 (3 students)."
+
+        # Another section is another group
+        self.submit(self.grades[3])
+        assert digests.count() == 4
+
+        # open-digest lookup, bulk update and the audit entry; no per-registrar queries
+        with django_assert_num_queries(3):
+            NotificationService.notify_digest(
+                recipients=NotificationService.registrar_ids(),
+                notification_type=Notification.NotificationType.GRADE,
+                digest_key=GradingService.submission_digest_key('FINAL', self.sections[0].id, self.subject.id),
+                title="Final Grades Submitted", message="Bulk", unit='student', count=5
+            )
+        assert set(digests.filter(digest_key__endswith=f':{self.sections[0].id}:{self.subject.id}')
+                   .values_list('event_count', flat=True)) == {8}
+
+    def test_read_or_stale_digests_start_over(self):
+        self.submit(self.grades[0])
+        Notification.objects.filter(recipient=self.registrars[0]).update(is_read=True)
+        Notification.objects.filter(recipient=self.registrars[1]).update(
+            created_at=Notification.objects.get(recipient=self.registrars[1]).created_at - timedelta(hours=1)
+        )
+
+        self.submit(self.grades[1])
+        for registrar in self.registrars:
+            assert list(registrar.notifications.order_by('id').values_list('event_count', flat=True)) == [1, 1]
@@ -0,0 +1,59 @@
+import pytest
+from datetime import date
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion
+from apps.auditing.models import AuditLog
+from apps.notifications.models import Notification
+from apps.notifications.services.notification_service import NotificationService
+from apps.scheduling.services.scheduling_service import SchedulingService
+from apps.students.models import Student, StudentEnrollment
+from tests.factories import StudentUserFactory, TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestNotificationFanOut:
+    def test_notify_many_chunks_and_writes_one_audit_entry(self, django_assert_num_queries):
+        users = StudentUserFactory.create_batch(5)
+
+        # three chunked INSERTs plus the summary audit entry
+        with django_assert_num_queries(4):
+            created = NotificationService.notify_many(
+                recipients=[users[0]] + [user.id for user in users[1:]],
+                notification_type=Notification.NotificationType.GENERAL,
+                title="Maintenance", message="Portal maintenance tonight.", batch_size=2
+            )
+
+        assert created == 5
+        assert Notification.objects.filter(recipient__in=users, title="Maintenance").count() == 5
+        entry = AuditLog.objects.get(action='BULK_NOTIFY')
+        assert entry.changes['recipients'] == 5
+        assert not AuditLog.objects.filter(model_name='Notification', action='CREATE').exists()
+
+    def test_publish_schedule_defers_fan_out_until_commit(self, django_capture_on_commit_callbacks):
+        term = TermFactory()
+        program = Program.objects.create(code='FAN', name='Fan-out Test')
+        curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        enrollments = []
+        for i, advising_status in enumerate(['APPROVED', 'APPROVED', 'APPROVED', 'PENDING']):
+            student = Student.objects.create(
+                user=User.objects.create(username=f'fan{i}', email=f'fan{i}@test.com', role='STUDENT'),
+                idn=f'27{i:04d}', program=program, curriculum=curriculum,
+                date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+            )
+            enrollments.append(StudentEnrollment.objects.create(
+                student=student, term=term, year_level=1, advising_status=advising_status
+            ))
+        approved = enrollments[:3]
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            SchedulingService.publish_schedule(term, defer_notifications=True)
+        assert not Notification.objects.filter(title="Schedule Published").exists()
+
+        for callback in callbacks:
+            callback()
+        recipients = set(Notification.objects.filter(title="Schedule Published").values_list('recipient_id', flat=True))
+        assert recipients == {enrollment.student.user_id for enrollment in approved}
+        assert AuditLog.objects.filter(action='BULK_NOTIFY').count() == 1
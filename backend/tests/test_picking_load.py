@@ -0,0 +1,57 @@
+"""
+Smoke tests for the schedule picking load test harness (benchmark_picking).
+"""
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.sections.models import Section, SectionStudent
+from apps.students.models import Student
+from apps.terms.models import Term
+from core.management.commands._picking_load import percentile, run_picking_load, seed_picking_term
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPickingLoadHarness:
+    def test_rush_fills_sections_without_overbooking(self):
+        term = seed_picking_term(StringIO(), students=12, irregular_ratio=0.25, section_size=4)
+        assert Section.objects.filter(term=term).count() == 3
+
+        report = run_picking_load(term, workers=1, seed=7)
+
+        assert report['picks'] == 12
+        assert (report['regular'], report['irregular']) == (9, 3)
+        assert sum(report['outcomes'].values()) == 12
+        assert report['outcomes'].get('error', 0) == 0
+        assert report['seated'] == SectionStudent.objects.filter(term=term).count() <= 12
+        assert report['capacity_violations'] == []
+        assert report['counter_drift'] == []
+        assert report['lock_waits'] is None
+
+    def test_command_requires_force_and_cleans_up(self):
+        with pytest.raises(CommandError):
+            call_command('benchmark_picking', '--students', '4', stdout=StringIO())
+
+        out = StringIO()
+        call_command(
+            'benchmark_picking', '--students', '6', '--section-size', '2', '--seat-ratio', '0.5',
+            '--workers', '2', '--json', '--force', stdout=out
+        )
+        report = json.loads(out.getvalue()[out.getvalue().index('{'):])
+        assert report['picks'] == 6
+        assert report['seated'] <= 4
+        assert report['capacity_violations'] == []
+
+        call_command('benchmark_picking', '--cleanup', '--force', stdout=StringIO())
+        assert not Term.objects.filter(code='BENCH-1').exists()
+        assert not Student.objects.filter(program__code='BENCH').exists()
@@ -0,0 +1,86 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+
+from apps.academics.models import Program, CurriculumVersion, Subject
+from apps.grades.models import Grade
+from apps.grades.services.grading_service import GradingService
+from apps.reports.services.report_service import ReportService
+from apps.students.models import Student
+from tests.factories import TermFactory
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestTranscriptProjection:
+    @pytest.fixture(autouse=True)
+    def setup_data(self):
+        self.terms = [TermFactory(), TermFactory()]
+        program = Program.objects.create(code='TRX', name='Transcript Test')
+        self.curriculum = CurriculumVersion.objects.create(program=program, version_name='V1')
+        self.subjects = {
+            code: Subject.objects.create(curriculum=self.curriculum, code=code, description=f'{code} desc',
+                                         year_level=year, semester=sem, total_units=units)
+            for code, year, sem, units in [
+                ('TX101', 1, '1', 3), ('TX102', 1, '1', 2), ('TX103', 1, '2', 3), ('TX201', 2, 'S', 3)
+            ]
+        }
+        self.student = Student.objects.create(
+            user=User.objects.create(username='trxstud', email='trxstud@test.com', role='STUDENT',
+                                     first_name='Ian', last_name='Cruz'),
+            idn='320001', program=program, curriculum=self.curriculum,
+            date_of_birth=date(2005, 1, 1), gender='MALE', student_type='FRESHMAN'
+        )
+
+        def grade(code, term, status, final=None):
+            return Grade.objects.create(student=self.student, subject=self.subjects[code], term=term,
+                                        grade_status=status, final_grade=final)
+
+        grade('TX101', self.terms[0], Grade.STATUS_FAILED, Decimal('5.00'))
+        grade('TX101', self.terms[1], Grade.STATUS_PASSED, Decimal('2.00'))
+        grade('TX102', self.terms[0], Grade.STATUS_PASSED, Decimal('1.50'))
+        self.enrolled = grade('TX103', self.terms[1], Grade.STATUS_ENROLLED)
+
+    def test_summary_is_built_once_and_served_from_cache(self, django_assert_num_queries):
+        # student, latest enrollment, grades, curriculum
+        with django_assert_num_queries(4):
+            summary = ReportService.get_academic_summary(self.student.id)
+
+        assert summary['student']['units_earned'] == 5
+        # (5.0*3 + 2.0*3 + 1.5*2) / 8
+        assert summary['stats'] == {'gpa': Decimal('3.00'), 'passed': 2}
+        assert [(s['year_level'], s['title']) for s in summary['semesters']] == [
+            ('Year 1', '1st Semester'), ('Year 1', '2nd Semester'), ('Year 2', 'Summer Semester')
+        ]
+        assert summary['semesters'][0]['grades'][0] == {
+            'code': 'TX101', 'subject': 'TX101 desc', 'units': 3,
+            'grade': '2.00', 'status': 'Passed', 'status_code': 'PASSED'
+        }
+        assert summary['semesters'][1]['grades'][0]['grade'] == 'Enrolled'
+        assert summary['semesters'][2]['grades'][0]['status'] == 'Not Taken'
+
+        with django_assert_num_queries(2):
+            assert ReportService.get_academic_summary(self.student.id) == summary
+
+    def test_grade_and_curriculum_changes_invalidate(self):
+        ReportService.get_academic_summary(self.student.id)
+
+        self.enrolled.final_grade = Decimal('1.00')
+        self.enrolled.grade_status = Grade.STATUS_PASSED
+        self.enrolled.save()
+        assert ReportService.get_academic_summary(self.student.id)['stats']['passed'] == 3
+
+        Subject.objects.create(curriculum=self.curriculum, code='TX104', description='New',
+                               year_level=1, semester='2', total_units=3)
+        summary = ReportService.get_academic_summary(self.student.id)
+        assert [g['code'] for g in summary['semesters'][1]['grades']] == ['TX103', 'TX104']
+
+        # The INC sweep writes with a bulk UPDATE
+        Grade.objects.create(student=self.student, subject=self.subjects['TX201'], term=self.terms[1],
+                             grade_status=Grade.STATUS_ENROLLED)
+        ReportService.get_academic_summary(self.student.id)
+        GradingService().mark_unsubmitted_as_inc(self.terms[1], 'FINAL', None)
+        summary = ReportService.get_academic_summary(self.student.id)
+        assert summary['semesters'][2]['grades'][0]['status_code'] == Grade.STATUS_INC